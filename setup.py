@@ -17,6 +17,7 @@ setuptools.setup(
     install_requires=[
         'biopython==1.77',
         'networkx==2.4',
+        'numpy==1.18.1',
         'paramiko==2.7.1',
         'pymysql==0.9.3',
         'pyyaml==5.3.1',
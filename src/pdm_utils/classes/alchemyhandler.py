@@ -1,4 +1,5 @@
 from pathlib import Path
+import pickle
 import sys
 
 import sqlalchemy
@@ -8,8 +9,10 @@ from sqlalchemy import MetaData
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.automap import automap_base
 
+from pdm_utils.functions import basic
 from pdm_utils.functions import querying
 from pdm_utils.functions import mysqldb_basic
 from pdm_utils.functions import parsing
@@ -26,6 +29,8 @@ DEFAULT_DRIVER = {"mysql": "pymysql",
 CREDENTIALS_MSG = ("Credentials invalid and maximum login attempts reached. "
                    "Please check your MySQL credentials and try again.")
 
+METADATA_CACHE_DIR = Path.home().joinpath(".pdm_utils", "metadata_cache")
+
 DATABASE_MSG = ("Unable to connect to database with valid credentials.\n"
                 "Please check your SQL database access, "
                 "and/or your database availability.")
@@ -47,6 +52,9 @@ class AlchemyHandler:
         self._mapper = None
         self._session = None
         self.echo = False
+        self.cache_metadata = True
+        self.cache_dir = METADATA_CACHE_DIR
+        self.profiler = None
 
         if dialect not in SUPPORTED_DIALECTS:
             raise NotImplementedError(
@@ -195,6 +203,7 @@ class AlchemyHandler:
             raise TypeError
 
         self._engine = engine
+        self.attach_profiler()
         self.extract_engine_credentials(engine)
         self.get_mysql_dbs()
 
@@ -228,6 +237,7 @@ class AlchemyHandler:
             raise TypeError
 
         self._engine = create_engine(URI)
+        self.attach_profiler()
         self.extract_engine_credentials(self._engine)
 
     @property
@@ -369,6 +379,7 @@ class AlchemyHandler:
 
                 self._engine = sqlalchemy.create_engine(login_string,
                                                         echo=self.echo)
+                self.attach_profiler()
                 self._engine.connect()
 
                 self.connected = True
@@ -392,6 +403,7 @@ class AlchemyHandler:
 
             self._engine = sqlalchemy.create_engine(login_string,
                                                     echo=self.echo)
+            self.attach_profiler()
             self._engine.connect()
 
             self.connected = True
@@ -507,6 +519,12 @@ class AlchemyHandler:
                     print(DATABASE_MSG)
                     sys.exit(1)
 
+    def attach_profiler(self):
+        """Record statements executed by the stored engine, if profiling.
+        """
+        if self.profiler is not None and self._engine is not None:
+            self.profiler.attach(self._engine)
+
     def construct_engine_string(self, dialect="mysql", driver="pymysql",
                                 username="", password="", database=""):
         """Construct a SQLAlchemy engine URL.
@@ -582,9 +600,100 @@ class AlchemyHandler:
         if not self.connected_database:
             self.build_engine()
 
+        cache_path = None
+        if self.cache_metadata:
+            cache_path = self.get_metadata_cache_path()
+
+        if cache_path is not None and self.load_metadata_cache(cache_path):
+            return
+
         self._metadata = MetaData(bind=self._engine)
         self._metadata.reflect()
 
+        if cache_path is not None:
+            self._graph = querying.build_graph(self._metadata)
+            self.write_metadata_cache(cache_path)
+
+    def get_metadata_cache_path(self):
+        """Get the cache file path for the connected database's schema.
+
+        The file is keyed by the database URL and the SchemaVersion stored
+        in the database's version table, so any schema update results in
+        a new reflection.
+
+        :returns: Path to the metadata cache file, or None if uncacheable.
+        :rtype: Path
+        """
+        if not isinstance(self._engine, Engine):
+            return None
+
+        # SQLite files are reflected in-process, which is already fast.
+        if self._engine.dialect.name == "sqlite":
+            return None
+
+        try:
+            version_data = mysqldb_basic.get_first_row_data(self._engine,
+                                                            "version")
+        except SQLAlchemyError:
+            return None
+
+        schema_version = version_data.get("SchemaVersion")
+        if schema_version is None:
+            return None
+
+        cache_key = basic.get_database_cache_key(self._engine)
+        file_name = f"{cache_key}_v{schema_version}.pickle"
+        return Path(self.cache_dir).joinpath(file_name)
+
+    def load_metadata_cache(self, cache_path):
+        """Load and store reflected MetaData and Graph objects from a cache.
+
+        :param cache_path: Path to the metadata cache file.
+        :type cache_path: Path
+        :returns: Whether the cache was successfully loaded.
+        :rtype: bool
+        """
+        if not cache_path.is_file():
+            return False
+
+        try:
+            with cache_path.open("rb") as handle:
+                metadata, graph = pickle.load(handle)
+        except Exception:
+            return False
+
+        if not isinstance(metadata, MetaData):
+            return False
+
+        metadata.bind = self._engine
+        self._metadata = metadata
+        self._graph = graph
+        return True
+
+    def write_metadata_cache(self, cache_path):
+        """Write stored MetaData and Graph objects to a cache file.
+
+        Cache files for previous schema versions of the same database
+        are removed.  Failure to write the cache is not an error.
+
+        :param cache_path: Path to the metadata cache file.
+        :type cache_path: Path
+        """
+        prefix = cache_path.name.rsplit("_v", 1)[0] + "_v"
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale_path in cache_path.parent.glob(f"{prefix}*.pickle"):
+                if stale_path != cache_path:
+                    stale_path.unlink()
+
+            # Written atomically so concurrent pipelines never load a
+            # partially written cache.
+            basic.write_file_atomic(cache_path, pickle.dumps(
+                                    (self._metadata, self._graph),
+                                    protocol=pickle.HIGHEST_PROTOCOL))
+        except (OSError, pickle.PicklingError):
+            return
+
     def build_session(self):
         """Create and store SQLAlchemy Session object.
         """
@@ -1,5 +1,7 @@
+from collections import OrderedDict
 import os
 import shlex
+import tempfile
 from subprocess import Popen
 import re
 
@@ -13,8 +15,8 @@ class AragornHandler:
 
         # I/O attributes
         self.temp_dir = "/tmp/aragorn"
-        self.input = os.path.join(self.temp_dir, self.id) + ".fasta"
-        self.output = os.path.join(self.temp_dir, self.id) + ".out"
+        self.input = None
+        self.output = None
         self.out_str = ""
 
         self.trna_tally = 0
@@ -23,16 +25,54 @@ class AragornHandler:
         self.trnas = list()
         self.tmrnas = list()
 
+        # Sequences searched in a single run, keyed by FASTA identifier.
+        self.records = None
+
+    def make_input_file(self):
+        """
+        Creates a uniquely named input file, so that concurrent searches
+        of sequences with the same identifier do not share files. The
+        output file is named after the input file.
+        :return: open file descriptor of the input file
+        :rtype: int
+        """
+        os.makedirs(self.temp_dir, exist_ok=True)
+        handle, self.input = tempfile.mkstemp(dir=self.temp_dir,
+                                              prefix=f"{self.id}_",
+                                              suffix=".fasta")
+        self.output = os.path.splitext(self.input)[0] + ".out"
+        return handle
+
+    def remove_files(self):
+        """
+        Removes the input and output files once the output has been read.
+        :return:
+        """
+        for path in (self.output, self.input):
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
     def write_fasta(self):
         """
         Writes the search sequence to input file in FASTA format.
         :return:
         """
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir)
-        with open(self.input, "w") as fh:
+        with os.fdopen(self.make_input_file(), "w") as fh:
             fh.write(f">{self.id}\n{self.sequence}\n")
 
+    def write_multi_fasta(self, records):
+        """
+        Writes several search sequences to input file in FASTA format,
+        so that all of them are searched in a single Aragorn run.
+        :param records: search sequences keyed by FASTA identifier
+        :type records: dict
+        :return:
+        """
+        self.records = records
+        with os.fdopen(self.make_input_file(), "w") as fh:
+            for record_id, sequence in records.items():
+                fh.write(f">{record_id}\n{sequence}\n")
+
     def run_aragorn(self, c=False, d=True, m=False, t=True):
         """
         Set up Aragorn command, then run it. Default arguments will
@@ -70,6 +110,31 @@ class AragornHandler:
         with open(self.output, "r") as fh:
             self.out_str = "".join(fh.readlines())
 
+    def split_output(self):
+        """
+        Splits `out_str` of a multi-FASTA run into the output for each
+        search sequence.
+        :return: AragornHandler objects with the output for each sequence,
+                 keyed by FASTA identifier
+        :rtype: dict
+        """
+        handlers = dict()
+        for record_id, sequence in self.records.items():
+            handlers[record_id] = AragornHandler(record_id, sequence)
+
+        # Aragorn begins the output for each sequence with its FASTA header.
+        handler = None
+        for line in self.out_str.splitlines(keepends=True):
+            if line.startswith(">"):
+                header = line[1:].split()
+                if header and header[0] in handlers:
+                    handler = handlers[header[0]]
+                    continue
+            if handler is not None:
+                handler.out_str += line
+
+        return handlers
+
     def parse_tmrnas(self):
         """
         Searches `out_str` for matches to a regular expression for
@@ -242,3 +307,19 @@ class AragornHandler:
             trna_data["Structure"] = structure
 
             self.trnas.append(trna_data)
+
+
+def get_search_records(features):
+    """
+    Assigns a FASTA identifier to the sequence of each tRNA or tmRNA
+    feature that can be searched in a multi-FASTA run.
+    :param features: tRNA or tmRNA features to be searched
+    :type features: list
+    :return: features keyed by FASTA identifier
+    :rtype: dict
+    """
+    records = OrderedDict()
+    for index, feature in enumerate(features):
+        if len(feature.seq) > 0:
+            records[f"seq{index + 1}"] = feature
+    return records
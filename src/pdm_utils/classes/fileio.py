@@ -1,5 +1,7 @@
+import io
 import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from Bio.Seq import Seq
 from Bio.SeqFeature import SeqFeature, CompoundLocation, FeatureLocation
@@ -206,3 +208,72 @@ def parse_tbl_data_type(data_line):
    
     return data_type 
 
+
+class BlockCompressionWriter(io.RawIOBase):
+    """Class to act as a writable binary stream that compresses data in
+    independent blocks, optionally compressing blocks in parallel threads.
+
+    Blocks are written to the underlying file handle in the order they
+    were filled, so the output is identical regardless of thread count.
+    """
+    def __init__(self, filehandle, compress_block, block_size=1048576,
+                 threads=1, eof=b""):
+        self.filehandle = filehandle
+        self.compress_block = compress_block
+        self.block_size = block_size
+        self.threads = max([1, threads])
+        self.eof = eof
+
+        self._buffer = bytearray()
+        self._pending = []
+        self._executor = None
+        if self.threads > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads)
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("Write to closed block compression stream.")
+
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._submit_block(block)
+
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if self._buffer:
+                self._submit_block(bytes(self._buffer))
+                self._buffer = bytearray()
+            self._flush_pending(0)
+
+            self.filehandle.write(self.eof)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self.filehandle.close()
+            super().close()
+
+    def _submit_block(self, block):
+        if self._executor is None:
+            self.filehandle.write(self.compress_block(block))
+            return
+
+        self._pending.append(self._executor.submit(self.compress_block,
+                                                   block))
+        # Bounds memory use to a few blocks in flight per thread.
+        self._flush_pending(self.threads * 2)
+
+    def _flush_pending(self, max_pending):
+        while len(self._pending) > max_pending:
+            future = self._pending.pop(0)
+            self.filehandle.write(future.result())
+
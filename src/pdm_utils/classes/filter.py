@@ -478,6 +478,31 @@ class Filter:
 
         return results
 
+    def iter_select(self, raw_columns, return_dict=True, chunk_size=1000):
+        """Streams data conditioned on the values in the Filter object.
+
+        :param columns: SQLAlchemy Column object(s)
+        :type columns: Column
+        :type columns: str
+        :type columns: list[Column]
+        :type columns: list[str]
+        :param return_dict: Toggle whether to yield data as a dictionary.
+        :type return_dict: Boolean
+        :param chunk_size: Number of rows fetched from the database at a time.
+        :type chunk_size: int
+        :returns: SELECT data conditioned on the values in the Filter object.
+        :rtype: Generator[dict]
+        :rtype: Generator[RowProxy]
+        """
+        self.check()
+
+        columns = self.get_columns(raw_columns)
+
+        query = q.build_select(self._graph, columns, add_in=self._key)
+        return q.iter_rows(self._engine, query, in_column=self._key,
+                           values=self._values, chunk_size=chunk_size,
+                           return_dict=return_dict)
+
     def query(self, table_map):
         """Queries for ORM object instances conditioned on Filter values.
 
@@ -574,45 +599,93 @@ class Filter:
 
         return values
 
-    def group(self, raw_column, raw_bytes=False, filter=False):
+    def group(self, raw_column, raw_bytes=False, filter=False, limit=8000):
         """Queries and separates Filter object's values based on a Column.
 
+        Pairs of group and key values are retrieved with a single query
+        conditioned on the Filter values and partitioned afterwards.
+
         :param raw_column: SQLAlchemy Column object or object name.
         :type raw_column: Column
         :type raw_column: str
+        :param limit: SQLAlchemy IN clause query length limiter.
+        :type limit: int
+        :returns: Filter values separated by distinct values of the Column.
+        :rtype: dict{list}
         """
         self.check()
 
+        if not self._values:
+            return {}
+
         column = self.get_column(raw_column)
 
-        groups = self.transpose(column)
+        group_pairs = self.build_group_pairs(column, limit=limit)
 
-        where_clauses = []
+        # Groups without values after filtering are still reported.
         if filter:
             where_clauses = self.build_where_clauses()
+            group_pairs = ([(group, None) for group, value in group_pairs] +
+                           self.build_group_pairs(column, where=where_clauses,
+                                                  limit=limit))
 
-        group_results = {}
-        for group in groups:
-            if column.type.python_type == bytes:
-                group_clauses = where_clauses + \
-                                            [(column == group.encode("utf_8"))]
-            else:
-                group_clauses = where_clauses + [(column == group)]
+        decode_key = (not raw_bytes and self._key.type.python_type == bytes)
+        decode_group = (column.type.python_type == bytes)
 
-            values = self.build_values(where=group_clauses,
-                                       raw_bytes=raw_bytes)
-            group_results.update({group: values})
+        group_results = {}
+        group_names = {}
+        for group, value in group_pairs:
+            if decode_group and group is not None:
+                group = group.decode("utf-8")
+
+            # MySQL groups values case-insensitively.
+            group = group_names.setdefault(basic.fold_value(group), group)
+            group_values = group_results.setdefault(group, [])
+
+            if value is None:
+                continue
+            if decode_key:
+                value = value.decode("utf-8")
+            if value not in group_values:
+                group_values.append(value)
 
         return group_results
 
-    def retrieve(self, raw_columns, raw_bytes=False, filter=False):
+    def build_group_pairs(self, column, where=None, limit=8000):
+        """Queries for distinct pairs of Column and key values.
+
+        :param column: SQLAlchemy Column object.
+        :type column: Column
+        :param where: MySQL WHERE clause_related SQLAlchemy object(s).
+        :type where: BinaryExpression
+        :type where: list
+        :param limit: SQLAlchemy IN clause query length limiter.
+        :type limit: int
+        :returns: Distinct (Column value, key value) pairs.
+        :rtype: list[tuple]
+        """
+        query = q.build_distinct(self._graph, [column, self._key], where=where)
+        results = q.execute(self._engine, query, in_column=self._key,
+                            values=self._values, limit=limit,
+                            return_dict=False)
+
+        return [(result[0], result[1]) for result in results]
+
+    def retrieve(self, raw_columns, raw_bytes=False, filter=False,
+                 limit=8000):
         """Queries for distinct data for each value in the Filter object.
 
+        Data is retrieved with one query per column, selecting the key
+        alongside the column and conditioning on chunks of the values,
+        and is separated for each value afterwards.
+
         :param columns: SQLAlchemy Column object(s)
         :type columns: Column
         :type columns: str
         :type columns: list[Column]
         :type columns: list[str]
+        :param limit: SQLAlchemy IN clause query length limiter.
+        :type limit: int
         :returns: Distinct values for each Filter value.
         :rtype: dict{dict}
         """
@@ -628,25 +701,45 @@ class Filter:
             where_clauses = self.build_where_clauses()
 
         values = {}
+        value_map = {}
         for value in self._values:
-            compare_value = value
-            if self._key.type.python_type == bytes and value is not None:
-                compare_value = value.encode("utf-8")
-
-            value_clauses = where_clauses + [(self._key == compare_value)]
-            values.update({value: {}})
-
-            # For each column for each value, add the respective data to a dict
-            for i in range(len(columns)):
-                query = q.build_distinct(self._graph, columns[i],
-                                         where=value_clauses)
-                value_data = q.first_column(self._engine, query)
-
-                if not raw_bytes:
-                    if columns[i].type.python_type == bytes:
-                        value_data = basic.convert_to_decoded(value_data)
-
-                values[value].update({columns[i].name: value_data})
+            values[value] = {}
+            for column in columns:
+                values[value][column.name] = []
+
+            # MySQL comparisons are case-insensitive, so rows are matched
+            # back to values regardless of case.
+            mapped_values = value_map.get(basic.fold_value(value), [])
+            mapped_values.append(value)
+            value_map[basic.fold_value(value)] = mapped_values
+
+        key_bytes = (self._key.type.python_type == bytes)
+        # For each column, add the respective data to a dict for each value
+        for column in columns:
+            query = q.build_distinct(self._graph, [self._key, column],
+                                     where=where_clauses)
+            results = q.execute(self._engine, query, in_column=self._key,
+                                values=self._values, limit=limit,
+                                return_dict=False)
+
+            decode = (not raw_bytes and column.type.python_type == bytes)
+            # Column values already added for each value, so repeated
+            # values are skipped without searching the value lists.
+            seen = {}
+            for result in results:
+                key_value = result[0]
+                if key_bytes and key_value is not None:
+                    key_value = key_value.decode("utf-8")
+
+                column_value = result[1]
+                if decode and column_value is not None:
+                    column_value = column_value.decode("utf-8")
+
+                for value in value_map.get(basic.fold_value(key_value), []):
+                    seen_values = seen.setdefault(value, set())
+                    if column_value not in seen_values:
+                        seen_values.add(column_value)
+                        values[value][column.name].append(column_value)
 
         return values
 
@@ -0,0 +1,208 @@
+"""Represents the order of genes within each phage genome in a database."""
+
+from sqlalchemy import select
+
+from pdm_utils.functions import basic
+
+# Number of PhamIDs or PhageIDs conditioned per query.
+NEIGHBORHOOD_CHUNK_SIZE = 5000
+
+
+class GeneNeighborhood:
+    """In-memory index of gene neighbors ordered by genome coordinates."""
+
+    def __init__(self):
+        self.geneids = []
+        self.phageids = []
+        self.phams = []
+        self.notes = []
+
+        self.positions = {}
+        self.pham_positions = {}
+
+    def build(self, alchemist, phams=None):
+        """Index the genes of a database with ordered queries.
+
+        :param alchemist: A connected and fully built AlchemyHandler object.
+        :type alchemist: AlchemyHandler
+        :param phams:
+            PhamIDs whose neighborhoods are needed. Only the genomes with
+            genes in these phams are indexed. All genomes are indexed if
+            None.
+        :type phams: list[int]
+        """
+        gene_obj = alchemist.metadata.tables["gene"]
+
+        query = select([gene_obj.c.GeneID, gene_obj.c.PhageID,
+                        gene_obj.c.PhamID, gene_obj.c.Notes])
+        query = query.order_by(gene_obj.c.PhageID, gene_obj.c.Start,
+                               gene_obj.c.Stop, gene_obj.c.GeneID)
+
+        if phams is None:
+            proxy = alchemist.engine.execute(query)
+            self.load(proxy.fetchall())
+            return
+
+        phageids = set()
+        phage_query = select([gene_obj.c.PhageID]).distinct()
+        for chunk in basic.partition_list(list(phams),
+                                          NEIGHBORHOOD_CHUNK_SIZE):
+            proxy = alchemist.engine.execute(
+                        phage_query.where(gene_obj.c.PhamID.in_(chunk)))
+            phageids.update([row[0] for row in proxy.fetchall()])
+
+        # Each chunk holds whole genomes, so the genes of a genome stay
+        # together and in order when the chunks are joined.
+        rows = []
+        for chunk in basic.partition_list(sorted(phageids),
+                                          NEIGHBORHOOD_CHUNK_SIZE):
+            proxy = alchemist.engine.execute(
+                        query.where(gene_obj.c.PhageID.in_(chunk)))
+            rows.extend(proxy.fetchall())
+        self.load(rows)
+
+    def load(self, rows):
+        """Index genes from rows ordered by PhageID and Start coordinate.
+
+        :param rows: GeneID, PhageID, PhamID, and Notes of each gene.
+        :type rows: list[tuple]
+        """
+        self.geneids = []
+        self.phageids = []
+        self.phams = []
+        self.notes = []
+        self.positions = {}
+        self.pham_positions = {}
+
+        for position, row in enumerate(rows):
+            geneid, phageid, pham, note = row[:4]
+            if isinstance(note, bytes):
+                note = note.decode("utf-8")
+
+            self.geneids.append(geneid)
+            self.phageids.append(phageid)
+            self.phams.append(pham)
+            self.notes.append(note)
+
+            self.positions[geneid] = position
+            # GeneIDs are compared case-insensitively by the database.
+            self.positions.setdefault(basic.fold_value(geneid), position)
+            self.pham_positions.setdefault(pham, []).append(position)
+
+    def get_position(self, geneid):
+        """Get the index position of a gene.
+
+        :param geneid: GeneID of an indexed gene.
+        :type geneid: str
+        :returns: Index position of the gene, or None if it is not indexed.
+        :rtype: int
+        """
+        position = self.positions.get(geneid)
+        if position is None:
+            position = self.positions.get(basic.fold_value(geneid))
+        return position
+
+    def get_relative_position(self, position, pos):
+        """Get the index position of a gene in the same genome.
+
+        :param position: Index position of a gene.
+        :type position: int
+        :param pos: Number of genes away from the gene.
+        :type pos: int
+        :returns: Index position of the relative gene, or None.
+        :rtype: int
+        """
+        rel_position = position + pos
+        if rel_position < 0 or rel_position >= len(self.geneids):
+            return None
+        if self.phageids[rel_position] != self.phageids[position]:
+            return None
+        return rel_position
+
+    def get_relative_gene(self, geneid, pos):
+        """Get the gene a number of positions away from a gene.
+
+        :param geneid: GeneID of an indexed gene.
+        :type geneid: str
+        :param pos: Number of genes away from the gene.
+        :type pos: int
+        :returns: GeneID of the relative gene, or None.
+        :rtype: str
+        """
+        position = self.get_position(geneid)
+        if position is None:
+            return None
+
+        rel_position = self.get_relative_position(position, pos)
+        if rel_position is None:
+            return None
+        return self.geneids[rel_position]
+
+    def get_adjacent_genes(self, geneid):
+        """Get the genes to the left and right of a gene.
+
+        :param geneid: GeneID of an indexed gene.
+        :type geneid: str
+        :returns: Left and right GeneIDs, or None at genome ends.
+        :rtype: tuple(str, str)
+        """
+        return (self.get_relative_gene(geneid, -1),
+                self.get_relative_gene(geneid, 1))
+
+    def get_adjacent_phams(self, geneid):
+        """Get the phams of the genes to the left and right of a gene.
+
+        :param geneid: GeneID of an indexed gene.
+        :type geneid: str
+        :returns: Left and right PhamIDs, or None at genome ends.
+        :rtype: tuple(int, int)
+        """
+        adjacent_phams = []
+        for geneid in self.get_adjacent_genes(geneid):
+            pham = None
+            if geneid is not None:
+                pham = self.phams[self.get_position(geneid)]
+            adjacent_phams.append(pham)
+
+        return tuple(adjacent_phams)
+
+    def get_genes_adjacent_to_pham(self, pham):
+        """Get the genes to the left and right of the genes in a pham.
+
+        :param pham: PhamID of the pham.
+        :type pham: int
+        :returns: Lists of left and right GeneIDs.
+        :rtype: tuple(list[str], list[str])
+        """
+        left_genes = []
+        right_genes = []
+        for position in self.pham_positions.get(pham, []):
+            left = self.get_relative_position(position, -1)
+            if left is not None:
+                left_genes.append(self.geneids[left])
+
+            right = self.get_relative_position(position, 1)
+            if right is not None:
+                right_genes.append(self.geneids[right])
+
+        return (left_genes, right_genes)
+
+    def get_gene_values(self, geneids, values):
+        """Get indexed values for a list of genes.
+
+        :param geneids: GeneIDs of indexed genes.
+        :type geneids: list[str]
+        :param values: Indexed value list, such as phams or notes.
+        :type values: list
+        :returns: Values aligned with geneids, None for missing genes.
+        :rtype: list
+        """
+        gene_values = []
+        for geneid in geneids:
+            position = self.get_position(geneid)
+            if position is None:
+                gene_values.append(None)
+            else:
+                gene_values.append(values[position])
+
+        return gene_values
@@ -194,6 +194,15 @@ class Genome:
         self._organism_host_genus = host_genus
 
 
+    @property
+    def seq_hash(self):
+        """SHA-256 digest of the nucleotide sequence.
+
+        :returns: Digest computed with basic.get_seq_hash().
+        :rtype: str
+        """
+        return basic.get_seq_hash(self.seq)
+
     def set_sequence(self, value):
         """Set the nucleotide sequence and compute the length.
 
@@ -0,0 +1,244 @@
+"""Represents an on-disk cache of HTTP GET responses."""
+
+import hashlib
+import json
+import logging
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from pdm_utils.functions import basic
+
+# Responses younger than this many seconds are used without contacting
+# the server.  Older responses are revalidated with conditional requests.
+DEFAULT_TTL = 24 * 60 * 60
+# Responses that have not been retrieved or revalidated for this many
+# seconds are removed from the cache.
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPCache:
+    """Caches HTTP GET responses, revalidating them with ETag and
+    Last-Modified headers once they are older than a time-to-live."""
+
+    def __init__(self, cache_dir, ttl=DEFAULT_TTL, offline=False,
+                 max_age=DEFAULT_MAX_AGE):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.offline = offline
+        self.max_age = max_age
+
+        # The cache is pruned once, before the first response is written.
+        self.pruned = False
+
+    def get_entry_paths(self, url):
+        """Get the metadata and content file paths of a cached response.
+
+        :param url: URL of the response.
+        :type url: str
+        :returns: tuple (metadata_path, content_path)
+        :rtype: tuple
+        """
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return (self.cache_dir.joinpath(f"{key}.json"),
+                self.cache_dir.joinpath(f"{key}.data"))
+
+    def read_entry(self, url):
+        """Read a cached response.
+
+        :param url: URL of the response.
+        :type url: str
+        :returns:
+            tuple (metadata, content) of the cached response,
+            or None if the response is not cached or unreadable.
+        :rtype: tuple
+        """
+        metadata_path, content_path = self.get_entry_paths(url)
+        try:
+            with metadata_path.open() as metadata_handle:
+                metadata = json.load(metadata_handle)
+            content = content_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        if metadata.get("url") != url:
+            return None
+        return (metadata, content)
+
+    def write_entry(self, url, metadata, content=None):
+        """Write a cached response.
+
+        Failure to write the cache is not an error.
+
+        :param url: URL of the response.
+        :type url: str
+        :param metadata: Response time and validator headers.
+        :type metadata: dict
+        :param content:
+            Response content, or None if only the metadata of an existing
+            entry is updated.
+        :type content: bytes
+        """
+        if not self.pruned:
+            self.prune()
+
+        metadata_path, content_path = self.get_entry_paths(url)
+        metadata = dict(metadata, url=url)
+
+        files = [(metadata_path, json.dumps(metadata).encode("utf-8"))]
+        if content is not None:
+            # Content is replaced first so that metadata is never newer
+            # than the content it describes.
+            files.insert(0, (content_path, content))
+
+        try:
+            for path, data in files:
+                basic.write_file_atomic(path, data)
+        except OSError:
+            pass
+
+    def is_fresh(self, metadata, ttl=None):
+        """Determine whether a cached response can be used without
+        revalidating it.
+
+        :param metadata: Metadata of the cached response.
+        :type metadata: dict
+        :param ttl: Time-to-live in seconds, or None to use the default.
+        :type ttl: int
+        :rtype: bool
+        """
+        if ttl is None:
+            ttl = self.ttl
+        age = get_age(metadata)
+        return 0 <= age < ttl
+
+    def get(self, url, ttl=None):
+        """Retrieve data from a URL, using the cache where possible.
+
+        In offline mode, cached responses are used regardless of age.
+        A stale cached response is also used, with a warning, if the
+        server can not be reached or returns a server error.
+
+        :param url: URL for data to be retrieved.
+        :type url: str
+        :param ttl: Time-to-live in seconds, or None to use the default.
+        :type ttl: int
+        :returns: Data from the URL.
+        :rtype: bytes
+        :raises URLError: if the data can not be retrieved or is not cached.
+        """
+        entry = self.read_entry(url)
+        if entry is not None:
+            metadata, content = entry
+            if self.offline or self.is_fresh(metadata, ttl=ttl):
+                return content
+        elif self.offline:
+            raise urllib.error.URLError(
+                                f"No cached response for {url} in offline mode")
+
+        headers = {}
+        if entry is not None:
+            if metadata.get("etag") is not None:
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified") is not None:
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        request = urllib.request.Request(url, headers=headers)
+        request_time = time.time()
+        try:
+            with urllib.request.urlopen(request) as response:
+                content = response.read()
+                validators = {"etag": response.headers.get("ETag"),
+                              "last_modified":
+                                    response.headers.get("Last-Modified")}
+        except urllib.error.HTTPError as error:
+            if error.code == 304 and entry is not None:
+                self.write_entry(url, dict(metadata, time=request_time))
+                return entry[1]
+            if error.code >= 500 and entry is not None:
+                warn_stale_entry(url, metadata, error)
+                return entry[1]
+            raise
+        except urllib.error.URLError as error:
+            if entry is not None:
+                warn_stale_entry(url, metadata, error)
+                return entry[1]
+            raise
+
+        self.write_entry(url, dict(validators, time=request_time),
+                         content=content)
+        return content
+
+    def prune(self, max_age=None):
+        """Remove cached responses that are older than a maximum age.
+
+        Failure to remove a response is not an error.
+
+        :param max_age: Maximum age in seconds, or None to use the default.
+        :type max_age: int
+        """
+        self.pruned = True
+        if max_age is None:
+            max_age = self.max_age
+        if max_age is None or not self.cache_dir.is_dir():
+            return
+
+        for metadata_path in self.cache_dir.glob("*.json"):
+            try:
+                with metadata_path.open() as metadata_handle:
+                    metadata = json.load(metadata_handle)
+            except (OSError, ValueError):
+                metadata = {}
+
+            if 0 <= get_age(metadata) < max_age:
+                continue
+
+            # Metadata is removed first so that content is never
+            # described by missing metadata.
+            for path in (metadata_path, metadata_path.with_suffix(".data")):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Remove all cached responses."""
+        if not self.cache_dir.is_dir():
+            return
+
+        for path in self.cache_dir.iterdir():
+            if path.suffix in {".json", ".data", ".tmp"}:
+                path.unlink()
+
+
+def get_age(metadata):
+    """Get the age of a cached response.
+
+    :param metadata: Metadata of the cached response.
+    :type metadata: dict
+    :returns: Seconds since the response was retrieved or revalidated.
+    :rtype: float
+    """
+    return time.time() - metadata.get("time", 0)
+
+
+def warn_stale_entry(url, metadata, error):
+    """Log the use of a stale cached response.
+
+    :param url: URL of the response.
+    :type url: str
+    :param metadata: Metadata of the cached response.
+    :type metadata: dict
+    :param error: Error raised while revalidating the response.
+    :type error: URLError
+    """
+    age = get_age(metadata)
+    if age < 60 * 60:
+        age = f"{age / 60:.0f} minutes"
+    else:
+        age = f"{age / (60 * 60):.1f} hours"
+    logger.warning(f"Unable to retrieve {url} ({error}). "
+                   f"Using cached response from {age} ago.")
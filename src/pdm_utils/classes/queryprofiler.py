@@ -0,0 +1,162 @@
+"""Represents a collection of SQL statement execution statistics."""
+
+import re
+import threading
+import time
+
+from sqlalchemy import event
+from tabulate import tabulate
+
+# Statements executed at least this many times are reported as possible
+# N+1 query patterns (one query per item instead of one query per batch).
+N_PLUS_ONE_THRESHOLD = 25
+
+STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+PLACEHOLDER_LIST = re.compile(
+                    rf"\(\s*{PLACEHOLDER}(?:\s*,\s*{PLACEHOLDER})+\s*\)")
+WHITESPACE = re.compile(r"\s+")
+
+
+class QueryProfiler:
+    """Records per-statement counts, latencies, and rows for SQL engines."""
+
+    def __init__(self, n_plus_one_threshold=N_PLUS_ONE_THRESHOLD):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.statements = {}
+        self.targets = []
+        self._lock = threading.Lock()
+
+    def attach(self, target):
+        """Record statements executed by an engine.
+
+        :param target: SQLAlchemy Engine object, or the Engine class to
+                       record statements from every engine.
+        :type target: Engine
+        """
+        if target in self.targets:
+            return
+
+        event.listen(target, "before_cursor_execute", self.before_execute)
+        event.listen(target, "after_cursor_execute", self.after_execute)
+        self.targets.append(target)
+
+    def detach(self):
+        """Stop recording statements from all attached engines."""
+        for target in self.targets:
+            event.remove(target, "before_cursor_execute", self.before_execute)
+            event.remove(target, "after_cursor_execute", self.after_execute)
+        self.targets = []
+
+    def before_execute(self, conn, cursor, statement, parameters, context,
+                       executemany):
+        """Stores the statement start time on the executing connection."""
+        conn.info.setdefault("query_start_time", []).append(
+                                                        time.perf_counter())
+
+    def after_execute(self, conn, cursor, statement, parameters, context,
+                      executemany):
+        """Records the statement latency and rows returned."""
+        start_times = conn.info.get("query_start_time")
+        if not start_times:
+            return
+
+        elapsed = time.perf_counter() - start_times.pop()
+        rows = cursor.rowcount
+        if rows is None or rows < 0:
+            rows = 0
+
+        self.record(statement, elapsed, rows)
+
+    def record(self, statement, elapsed, rows):
+        """Add a single statement execution to the recorded statistics.
+
+        :param statement: SQL statement string.
+        :type statement: str
+        :param elapsed: Statement execution time in seconds.
+        :type elapsed: float
+        :param rows: Number of rows returned or affected.
+        :type rows: int
+        """
+        template = get_statement_template(statement)
+
+        with self._lock:
+            stats = self.statements.get(template)
+            if stats is None:
+                stats = {"count": 0, "total_time": 0.0, "max_time": 0.0,
+                         "rows": 0}
+                self.statements[template] = stats
+
+            stats["count"] += 1
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            stats["rows"] += rows
+
+    def get_n_plus_one(self):
+        """Get statement templates executed often enough to suggest N+1 use.
+
+        :returns: List of statement templates.
+        :rtype: list[str]
+        """
+        templates = []
+        for template, stats in self.statements.items():
+            if stats["count"] >= self.n_plus_one_threshold:
+                templates.append(template)
+        return templates
+
+    def report(self, width=80):
+        """Summarize recorded statements, slowest total time first.
+
+        :param width: Maximum number of statement characters displayed.
+        :type width: int
+        :returns: Formatted statement statistics report.
+        :rtype: str
+        """
+        ordered = sorted(self.statements.items(),
+                         key=lambda item: item[1]["total_time"], reverse=True)
+        n_plus_one = set(self.get_n_plus_one())
+
+        table = []
+        total_count = 0
+        total_time = 0.0
+        for template, stats in ordered:
+            total_count += stats["count"]
+            total_time += stats["total_time"]
+
+            statement = template
+            if len(statement) > width:
+                statement = statement[:width - 3] + "..."
+            flag = "N+1" if template in n_plus_one else ""
+
+            table.append([stats["count"], round(stats["total_time"], 4),
+                          round(stats["max_time"], 4), stats["rows"], flag,
+                          statement])
+
+        headers = ["Count", "Total (s)", "Max (s)", "Rows", "Flag",
+                   "Statement"]
+        lines = [f"{total_count} SQL statements executed "
+                 f"in {round(total_time, 4)} seconds "
+                 f"({len(ordered)} distinct statements)."]
+        if table:
+            lines.append(tabulate(table, headers=headers))
+        if n_plus_one:
+            lines.append(f"{len(n_plus_one)} statement(s) were executed at "
+                         f"least {self.n_plus_one_threshold} times and may "
+                         "indicate N+1 query patterns.")
+        return "\n".join(lines)
+
+
+def get_statement_template(statement):
+    """Get a statement template by replacing literal and list values.
+
+    :param statement: SQL statement string.
+    :type statement: str
+    :returns: Normalized SQL statement string.
+    :rtype: str
+    """
+    template = STRING_LITERAL.sub("?", statement)
+    template = NUMBER_LITERAL.sub("?", template)
+    template = PLACEHOLDER_LIST.sub("(...)", template)
+    template = WHITESPACE.sub(" ", template).strip()
+    return template
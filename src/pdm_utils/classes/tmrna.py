@@ -11,6 +11,7 @@ from Bio.Alphabet import IUPAC
 
 from pdm_utils.classes import evaluation
 from pdm_utils.classes.aragornhandler import AragornHandler
+from pdm_utils.classes.aragornhandler import get_search_records
 from pdm_utils.functions import basic
 
 # Extracts peptide tag from note field acid and anticodon from note field for Aragorn-determinate
@@ -436,19 +437,32 @@ class Tmrna:
             identifier = "aragorn"
 
         if len(self.seq) > 0:
-            ah = AragornHandler(self.id, str(self.seq))
-            ah.write_fasta()
-            ah.run_aragorn(m=True, t=False)  # search (linear) self.seq for tmRNAs
-            ah.read_output()
-            ah.parse_tmrnas()
-            if ah.tmrna_tally == 1:
-                self.aragorn_data = ah.tmrnas[0]
-            # else:
-                # print(f"Aragorn found {ah.tmrna_tally} tmRNAs in this region.")
-            self.aragorn_run = True
+            ah = AragornHandler(identifier, str(self.seq))
+            try:
+                ah.write_fasta()
+                ah.run_aragorn(m=True, t=False)  # search (linear) self.seq for tmRNAs
+                ah.read_output()
+            finally:
+                ah.remove_files()
+            self.set_aragorn_data(ah)
         else:
             print("Cannot run Aragorn on 0-length sequence.")
 
+    def set_aragorn_data(self, ah):
+        """
+        Parses the tmRNAs an AragornHandler object found in this tmRNA's
+        sequence, and keeps the result if exactly one was found.
+        :param ah: AragornHandler with output for this tmRNA's sequence
+        :type ah: AragornHandler
+        :return:
+        """
+        ah.parse_tmrnas()
+        if ah.tmrna_tally == 1:
+            self.aragorn_data = ah.tmrnas[0]
+        # else:
+            # print(f"Aragorn found {ah.tmrna_tally} tmRNAs in this region.")
+        self.aragorn_run = True
+
     def parse_peptide_tag(self):
         """
         Parse the `peptide_tag` attribute out of the note field.
@@ -910,3 +924,30 @@ class Tmrna:
         definition = f"Make sure there is only one region for {self.locus_tag} ({self.id})."
         definition = basic.join_strings([definition, eval_def])
         self.set_eval(eval_id, definition, result, status)
+
+
+def run_aragorn_batch(tmrnas, identifier="aragorn"):
+    """
+    Searches the sequences of several tmRNAs in a single Aragorn run,
+    with the same results as calling run_aragorn() on each tmRNA.
+    :param tmrnas: tmRNA features to be searched
+    :type tmrnas: list
+    :param identifier: name of the Aragorn input and output files
+    :type identifier: str
+    :return:
+    """
+    records = get_search_records(tmrnas)
+    if len(records) == 0:
+        return
+
+    ah = AragornHandler(identifier, "")
+    try:
+        ah.write_multi_fasta({record_id: str(tmrna.seq)
+                              for record_id, tmrna in records.items()})
+        ah.run_aragorn(m=True, t=False)
+        ah.read_output()
+    finally:
+        ah.remove_files()
+    handlers = ah.split_output()
+    for record_id, tmrna in records.items():
+        tmrna.set_aragorn_data(handlers[record_id])
@@ -10,6 +10,7 @@ from Bio.Seq import Seq
 from Bio.SeqFeature import SeqFeature, FeatureLocation, CompoundLocation
 from pdm_utils.classes import evaluation
 from pdm_utils.classes.aragornhandler import AragornHandler
+from pdm_utils.classes.aragornhandler import get_search_records
 from pdm_utils.classes.trnascansehandler import TRNAscanSEHandler
 from pdm_utils.functions import basic
 
@@ -76,9 +77,11 @@ class Trna:
         self.note = ""          # Raw note field
 
         # Aragorn data
+        self.aragorn_run = False
         self.aragorn_data = None
 
         # tRNAscan-SE data
+        self.trnascanse_run = False
         self.trnascanse_data = None
 
         # Which program(s) support the annotation?
@@ -490,18 +493,32 @@ class Trna:
 
         if len(self.seq) > 0:
             ah = AragornHandler(identifier, str(self.seq))
-            ah.write_fasta()
-            ah.run_aragorn()            # search (linear) self.seq for tRNAs
-            ah.read_output()
-            ah.parse_trnas()
-            if ah.trna_tally == 1:
-                self.aragorn_data = ah.trnas[0]
-                self.sources.add("aragorn")
-            # else:
-                # print(f"Aragorn found {ah.trna_tally} tRNAs in this region.")
+            try:
+                ah.write_fasta()
+                ah.run_aragorn()            # search (linear) self.seq for tRNAs
+                ah.read_output()
+            finally:
+                ah.remove_files()
+            self.set_aragorn_data(ah)
         else:
             print("Cannot run Aragorn on 0-length sequence.")
 
+    def set_aragorn_data(self, ah):
+        """
+        Parses the tRNAs an AragornHandler object found in this tRNA's
+        sequence, and keeps the result if exactly one was found.
+        :param ah: AragornHandler with output for this tRNA's sequence
+        :type ah: AragornHandler
+        :return:
+        """
+        ah.parse_trnas()
+        if ah.trna_tally == 1:
+            self.aragorn_data = ah.trnas[0]
+            self.sources.add("aragorn")
+        # else:
+            # print(f"Aragorn found {ah.trna_tally} tRNAs in this region.")
+        self.aragorn_run = True
+
     def run_trnascanse(self):
         """
         Uses a TRNAscanSEHandler object to negotiate the flow of
@@ -515,18 +532,32 @@ class Trna:
 
         if len(self.seq) > 0:
             th = TRNAscanSEHandler(identifier, str(self.seq))
-            th.write_fasta()
-            th.run_trnascanse()
-            th.read_output()
-            th.parse_trnas()
-            if th.trna_tally == 1:
-                self.trnascanse_data = th.trnas[0]
-                self.sources.add("trnascan")
-            # else:
-                # print(f"tRNAscan-SE found {th.trna_tally} tRNAs in this region.")
+            try:
+                th.write_fasta()
+                th.run_trnascanse()
+                th.read_output()
+            finally:
+                th.remove_files()
+            self.set_trnascanse_data(th)
         else:
             print("Cannot run tRNAscan-SE on 0-length sequence.")
 
+    def set_trnascanse_data(self, th):
+        """
+        Parses the tRNAs a TRNAscanSEHandler object found in this tRNA's
+        sequence, and keeps the result if exactly one was found.
+        :param th: TRNAscanSEHandler with output for this tRNA's sequence
+        :type th: TRNAscanSEHandler
+        :return:
+        """
+        th.parse_trnas()
+        if th.trna_tally == 1:
+            self.trnascanse_data = th.trnas[0]
+            self.sources.add("trnascan")
+        # else:
+            # print(f"tRNAscan-SE found {th.trna_tally} tRNAs in this region.")
+        self.trnascanse_run = True
+
     def set_amino_acid(self, value):
         """
         Sets the `amino_acid` attribute using the indicated value.
@@ -743,8 +774,12 @@ class Trna:
         :type eval_def: str
         :return:
         """
-        self.run_aragorn()
-        self.run_trnascanse()
+        # Features searched by run_aragorn_batch() or
+        # run_trnascanse_batch() are not searched again.
+        if not self.aragorn_run:
+            self.run_aragorn()
+        if not self.trnascanse_run:
+            self.run_trnascanse()
 
         result = f"This tRNA gene's DNA sequence "
 
@@ -1517,3 +1552,57 @@ class Trna:
                      f"{self.locus_tag} ({self.id})."
         definition = basic.join_strings([definition, eval_def])
         self.set_eval(eval_id, definition, result, status)
+
+
+def run_aragorn_batch(trnas, identifier="aragorn"):
+    """
+    Searches the sequences of several tRNAs in a single Aragorn run,
+    with the same results as calling run_aragorn() on each tRNA.
+    :param trnas: tRNA features to be searched
+    :type trnas: list
+    :param identifier: name of the Aragorn input and output files
+    :type identifier: str
+    :return:
+    """
+    records = get_search_records(trnas)
+    if len(records) == 0:
+        return
+
+    ah = AragornHandler(identifier, "")
+    try:
+        ah.write_multi_fasta({record_id: str(trna.seq)
+                              for record_id, trna in records.items()})
+        ah.run_aragorn()
+        ah.read_output()
+    finally:
+        ah.remove_files()
+    handlers = ah.split_output()
+    for record_id, trna in records.items():
+        trna.set_aragorn_data(handlers[record_id])
+
+
+def run_trnascanse_batch(trnas, identifier="trnascanse"):
+    """
+    Searches the sequences of several tRNAs in a single tRNAscan-SE run,
+    with the same results as calling run_trnascanse() on each tRNA.
+    :param trnas: tRNA features to be searched
+    :type trnas: list
+    :param identifier: name of the tRNAscan-SE input and output files
+    :type identifier: str
+    :return:
+    """
+    records = get_search_records(trnas)
+    if len(records) == 0:
+        return
+
+    th = TRNAscanSEHandler(identifier, "")
+    try:
+        th.write_multi_fasta({record_id: str(trna.seq)
+                              for record_id, trna in records.items()})
+        th.run_trnascanse()
+        th.read_output()
+    finally:
+        th.remove_files()
+    handlers = th.split_output()
+    for record_id, trna in records.items():
+        trna.set_trnascanse_data(handlers[record_id])
@@ -1,5 +1,6 @@
 import os
 import shlex
+import tempfile
 from subprocess import Popen
 import re
 
@@ -13,8 +14,8 @@ class TRNAscanSEHandler:
 
         # I/O attributes
         self.temp_dir = "/tmp/trnascanse"
-        self.input = os.path.join(self.temp_dir, self.id) + ".fasta"
-        self.output = os.path.join(self.temp_dir, self.id) + ".out"
+        self.input = None
+        self.output = None
         self.out_str = ""
 
         self.trna_tally = 0
@@ -23,16 +24,54 @@ class TRNAscanSEHandler:
         self.trnas = list()
         self.tmrnas = list()
 
+        # Sequences searched in a single run, keyed by FASTA identifier.
+        self.records = None
+
+    def make_input_file(self):
+        """
+        Creates a uniquely named input file, so that concurrent searches
+        of sequences with the same identifier do not share files. The
+        output file is named after the input file.
+        :return: open file descriptor of the input file
+        :rtype: int
+        """
+        os.makedirs(self.temp_dir, exist_ok=True)
+        handle, self.input = tempfile.mkstemp(dir=self.temp_dir,
+                                              prefix=f"{self.id}_",
+                                              suffix=".fasta")
+        self.output = os.path.splitext(self.input)[0] + ".out"
+        return handle
+
+    def remove_files(self):
+        """
+        Removes the input and output files once the output has been read.
+        :return:
+        """
+        for path in (self.output, self.input):
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
     def write_fasta(self):
         """
         Writes the search sequence to input file in FASTA format.
         :return:
         """
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir)
-        with open(self.input, "w") as fh:
+        with os.fdopen(self.make_input_file(), "w") as fh:
             fh.write(f">{self.id}\n{self.sequence}\n")
 
+    def write_multi_fasta(self, records):
+        """
+        Writes several search sequences to input file in FASTA format,
+        so that all of them are searched in a single tRNAscan-SE run.
+        :param records: search sequences keyed by FASTA identifier
+        :type records: dict
+        :return:
+        """
+        self.records = records
+        with os.fdopen(self.make_input_file(), "w") as fh:
+            for record_id, sequence in records.items():
+                fh.write(f">{record_id}\n{sequence}\n")
+
     def run_trnascanse(self, x=10):
         """
         Set up tRNAscan-SE command, then run it. Explanation of
@@ -54,6 +93,30 @@ class TRNAscanSEHandler:
         with open(self.output, "r") as fh:
             self.out_str = "".join(fh.readlines())
 
+    def split_output(self):
+        """
+        Splits `out_str` of a multi-FASTA run into the output for each
+        search sequence.
+        :return: TRNAscanSEHandler objects with the output for each
+                 sequence, keyed by FASTA identifier
+        :rtype: dict
+        """
+        handlers = dict()
+        for record_id, sequence in self.records.items():
+            handlers[record_id] = TRNAscanSEHandler(record_id, sequence)
+
+        # tRNAscan-SE names each tRNA after its sequence, e.g. "seq.trna1".
+        regex = re.compile(r"^(\S+)\.trna\d+\s")
+        handler = None
+        for line in self.out_str.splitlines(keepends=True):
+            match = regex.match(line)
+            if match is not None:
+                handler = handlers.get(match.group(1))
+            if handler is not None:
+                handler.out_str += line
+
+        return handlers
+
     def parse_trnas(self):
         """
         Searches `out_str` for matches to a regular expression for
@@ -21,6 +21,7 @@ pfx5 = "The new and old genomes are expected to have"
 pfx6 = "The bundled data is expected to contain"
 
 sfx1 = "that is already in the database"
+sfx2 = "that was imported from another flat file"
 
 EVAL_DESCRIPTIONS = {
     # Target genome to import
@@ -64,6 +65,10 @@ EVAL_DESCRIPTIONS = {
     "GNM-EVAL-038": (f"Since annotation author is True, {pfx3.lower()} one or more specific author(s) listed in the References fields."),
     "GNM-EVAL-039": (f"Since annotation author is True, {pfx4.lower()} to have generic authors (e.g. 'Lastname, Firstname') listed in the References fields."),
     "GNM-EVAL-040": (f"Since annotation author is False, {pfx4.lower()} one or more specific author(s) listed in the References fields."),
+    "GNM-EVAL-041": (f"{pfx1} cannot have a PhageID {sfx2}."),
+    "GNM-EVAL-042": (f"{pfx1} cannot have a Name {sfx2}."),
+    "GNM-EVAL-043": (f"{pfx1} cannot have a nucleotide sequence {sfx2}."),
+    "GNM-EVAL-044": (f"{pfx1} cannot have an Accession {sfx2}."),
 
     # Current genome in database
     "GNM2-EVAL-001": ("The genome to be replaced is only expected to have a 'draft' annotation status."),
@@ -88,8 +88,98 @@ def get_annotations_from_genes(alchemist, geneids):
     return annotations
 
 
-def get_count_phams_in_genes(alchemist, geneids, incounts=None):
-    phams = get_phams_from_genes(alchemist, geneids)
+def get_gene_values(alchemist, geneids, column, limit=8000):
+    """Get the values of a gene table column for each of a list of genes.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param geneids: GeneIDs to retrieve values for.
+    :type geneids: list[str]
+    :param column: Name of a gene table column.
+    :type column: str
+    :param limit: Number of GeneIDs conditioned per IN clause query.
+    :type limit: int
+    :returns: Column values aligned with geneids, None for missing genes.
+    :rtype: list
+    """
+    distinct_geneids = list(dict.fromkeys(geneids))
+    if not distinct_geneids:
+        return []
+
+    gene_obj = alchemist.metadata.tables["gene"]
+
+    geneid_obj = gene_obj.c.GeneID
+    value_obj = getattr(gene_obj.c, column)
+
+    query_columns = [geneid_obj]
+    if value_obj is not geneid_obj:
+        query_columns.append(value_obj)
+
+    values_query = select(query_columns)
+    results = querying.execute(alchemist.engine, values_query,
+                               in_column=geneid_obj, values=distinct_geneids,
+                               limit=limit, return_dict=False)
+
+    # GeneIDs are compared case-insensitively by the database.
+    value_map = {}
+    for result in results:
+        value_map[result[0]] = result[-1]
+        value_map.setdefault(basic.fold_value(result[0]), result[-1])
+
+    values = []
+    for gene in geneids:
+        value = value_map.get(gene)
+        if value is None:
+            value = value_map.get(basic.fold_value(gene))
+        values.append(value)
+
+    return values
+
+
+def get_gene_phams(alchemist, geneids, limit=8000):
+    """Get the PhamID of each of a list of genes with batched queries.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param geneids: GeneIDs to retrieve PhamIDs for.
+    :type geneids: list[str]
+    :param limit: Number of GeneIDs conditioned per IN clause query.
+    :type limit: int
+    :returns: PhamIDs aligned with geneids, None for missing genes.
+    :rtype: list[int]
+    """
+    return get_gene_values(alchemist, geneids, "PhamID", limit=limit)
+
+
+def get_gene_annotations(alchemist, geneids, limit=8000):
+    """Get the decoded Notes of each of a list of genes with batched queries.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param geneids: GeneIDs to retrieve annotations for.
+    :type geneids: list[str]
+    :param limit: Number of GeneIDs conditioned per IN clause query.
+    :type limit: int
+    :returns: Annotations aligned with geneids, None for missing genes.
+    :rtype: list[str]
+    """
+    notes = get_gene_values(alchemist, geneids, "Notes", limit=limit)
+
+    annotations = []
+    for note in notes:
+        if isinstance(note, bytes):
+            note = note.decode("utf-8")
+        annotations.append(note)
+
+    return annotations
+
+
+def get_count_phams_in_genes(alchemist, geneids, incounts=None,
+                             neighborhood=None):
+    if neighborhood is None:
+        phams = get_gene_phams(alchemist, geneids)
+    else:
+        phams = neighborhood.get_gene_values(geneids, neighborhood.phams)
 
     pham_histogram = {}
     if incounts is not None:
@@ -99,8 +189,13 @@ def get_count_phams_in_genes(alchemist, geneids, incounts=None):
     return pham_histogram
 
 
-def get_count_annotations_in_genes(alchemist, geneids, incounts=None):
-    annotations = get_annotations_from_genes(alchemist, geneids)
+def get_count_annotations_in_genes(alchemist, geneids, incounts=None,
+                                   neighborhood=None):
+    if neighborhood is None:
+        annotations = get_gene_annotations(alchemist, geneids)
+    else:
+        annotations = neighborhood.get_gene_values(geneids,
+                                                   neighborhood.notes)
 
     annotation_counts = {}
     if incounts is not None:
@@ -117,11 +212,16 @@ def get_count_annotations_in_pham(alchemist, pham, incounts=None):
     return count_annotations
 
 
-def get_relative_gene(alchemist, geneid, pos):
-    gene_obj = alchemist.metadata.tables["gene"]
-
-    geneid_obj = gene_obj.c.GeneID
+def get_relative_geneid(geneid, pos):
+    """Format the GeneID of the gene a number of positions away from a gene.
 
+    :param geneid: GeneID formatted as {PhageID}_CDS_{Number}.
+    :type geneid: str
+    :param pos: Number of genes away from the gene.
+    :type pos: int
+    :returns: GeneID of the relative gene.
+    :rtype: str
+    """
     geneid_format = re.compile("[\w\W]+_CDS_[0-9]+")
     if not re.match(geneid_format, geneid) is None:
         parsed_geneid = re.split("_", geneid)
@@ -132,63 +232,103 @@ def get_relative_gene(alchemist, geneid, pos):
     gene_num = int(parsed_geneid[2])
     rel_gene_pos = gene_num + pos
 
-    rel_geneid = "_".join(parsed_geneid[:2] + [str(rel_gene_pos)])
+    return "_".join(parsed_geneid[:2] + [str(rel_gene_pos)])
+
+
+def get_relative_gene(alchemist, geneid, pos):
+    gene_obj = alchemist.metadata.tables["gene"]
+
+    geneid_obj = gene_obj.c.GeneID
+
+    rel_geneid = get_relative_geneid(geneid, pos)
     geneid_query = select([geneid_obj]).where(geneid_obj == rel_geneid)
     rel_geneid = alchemist.engine.execute(geneid_query).scalar()
 
     return rel_geneid
 
 
-def get_adjacent_genes(alchemist, gene):
+def get_relative_genes(alchemist, geneids, pos, limit=8000):
+    """Get the genes a number of positions away from each of a list of genes.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param geneids: GeneIDs formatted as {PhageID}_CDS_{Number}.
+    :type geneids: list[str]
+    :param pos: Number of genes away from each gene.
+    :type pos: int
+    :param limit: Number of GeneIDs conditioned per IN clause query.
+    :type limit: int
+    :returns: Relative GeneIDs aligned with geneids, None for missing genes.
+    :rtype: list[str]
+    """
+    rel_geneids = [get_relative_geneid(geneid, pos) for geneid in geneids]
+    return get_gene_values(alchemist, rel_geneids, "GeneID", limit=limit)
+
+
+def get_adjacent_genes(alchemist, gene, neighborhood=None):
+    if neighborhood is not None:
+        return neighborhood.get_adjacent_genes(gene)
+
     left = get_relative_gene(alchemist, gene, -1)
     right = get_relative_gene(alchemist, gene, 1)
 
     return (left, right)
 
 
-def get_genes_adjacent_to_pham(alchemist, pham):
-    genes = get_genes_from_pham(alchemist, pham)
+def get_genes_adjacent_to_pham(alchemist, pham, neighborhood=None):
+    if neighborhood is not None:
+        return neighborhood.get_genes_adjacent_to_pham(pham)
 
-    left_genes = []
-    right_genes = []
-    for gene in genes:
-        adjacent_genes = get_adjacent_genes(alchemist, gene)
+    genes = get_genes_from_pham(alchemist, pham)
 
-        if not adjacent_genes[0] is None:
-            left_genes.append(adjacent_genes[0])
-        if not adjacent_genes[1] is None:
-            right_genes.append(adjacent_genes[1])
+    left_genes = [gene for gene in get_relative_genes(alchemist, genes, -1)
+                  if gene is not None]
+    right_genes = [gene for gene in get_relative_genes(alchemist, genes, 1)
+                   if gene is not None]
 
     return (left_genes, right_genes)
 
 
-def get_distinct_adjacent_phams(alchemist, pham):
-    adjacent_genes = get_genes_adjacent_to_pham(alchemist, pham)
+def get_distinct_adjacent_phams(alchemist, pham, neighborhood=None):
+    adjacent_genes = get_genes_adjacent_to_pham(alchemist, pham,
+                                                neighborhood=neighborhood)
 
-    left_phams = get_phams_from_genes(alchemist, adjacent_genes[0])
-    right_phams = get_phams_from_genes(alchemist, adjacent_genes[1])
+    if neighborhood is None:
+        left_phams = get_gene_phams(alchemist, adjacent_genes[0])
+        right_phams = get_gene_phams(alchemist, adjacent_genes[1])
+    else:
+        left_phams = neighborhood.get_gene_values(adjacent_genes[0],
+                                                  neighborhood.phams)
+        right_phams = neighborhood.get_gene_values(adjacent_genes[1],
+                                                   neighborhood.phams)
 
     return (left_phams, right_phams)
 
 
-def get_count_adjacent_phams_to_pham(alchemist, pham, incounts=None):
-    adjacent_genes = get_genes_adjacent_to_pham(alchemist, pham)
+def get_count_adjacent_phams_to_pham(alchemist, pham, incounts=None,
+                                     neighborhood=None):
+    adjacent_genes = get_genes_adjacent_to_pham(alchemist, pham,
+                                                neighborhood=neighborhood)
 
     adjacent_phams = ({}, {})
     if incounts is not None:
         adjacent_phams = incounts
 
     left_in = adjacent_phams[0]
-    get_count_phams_in_genes(alchemist, adjacent_genes[0], incounts=left_in)
+    get_count_phams_in_genes(alchemist, adjacent_genes[0], incounts=left_in,
+                             neighborhood=neighborhood)
 
     right_in = adjacent_phams[1]
-    get_count_phams_in_genes(alchemist, adjacent_genes[1], incounts=right_in)
+    get_count_phams_in_genes(alchemist, adjacent_genes[1], incounts=right_in,
+                             neighborhood=neighborhood)
 
     return adjacent_phams
 
 
-def get_count_adjacent_annotations_to_pham(alchemist, pham, incounts=None):
-    adjacent_genes = get_genes_adjacent_to_pham(alchemist, pham)
+def get_count_adjacent_annotations_to_pham(alchemist, pham, incounts=None,
+                                           neighborhood=None):
+    adjacent_genes = get_genes_adjacent_to_pham(alchemist, pham,
+                                                neighborhood=neighborhood)
 
     adjacent_annotations = ({}, {})
     if incounts is not None:
@@ -196,10 +336,12 @@ def get_count_adjacent_annotations_to_pham(alchemist, pham, incounts=None):
 
     left_in = adjacent_annotations[0]
     get_count_annotations_in_genes(alchemist, adjacent_genes[0],
-                                   incounts=left_in)
+                                   incounts=left_in,
+                                   neighborhood=neighborhood)
 
     right_in = adjacent_annotations[1]
     get_count_annotations_in_genes(alchemist, adjacent_genes[1],
-                                   incounts=right_in)
+                                   incounts=right_in,
+                                   neighborhood=neighborhood)
 
     return adjacent_annotations
@@ -4,9 +4,11 @@ modules in this package to prevent circular imports."""
 from collections import OrderedDict
 import csv
 import getpass
+import hashlib
 import os
 from pathlib import Path
 import sys
+import tempfile
 
 from pdm_utils.constants import constants
 
@@ -748,6 +750,58 @@ def lower_case(value):
     return value
 
 
+def get_database_cache_key(engine):
+    """Get the name that identifies a database in cache file names.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :returns: Database name joined to a hash of the database URL.
+    :rtype: str
+    """
+    url = engine.url
+    url_key = f"{url.drivername}://{url.host}:{url.port}/{url.database}"
+    url_hash = hashlib.sha1(url_key.encode("utf-8")).hexdigest()[:16]
+    database = Path(str(url.database)).stem
+    return f"{database}_{url_hash}"
+
+
+def write_file_atomic(path, data):
+    """Write data to a file by replacing it with a temporary file.
+
+    Processes reading the file concurrently never read a partially
+    written file.
+
+    :param path: Path to the file.
+    :type path: Path
+    :param data: Data to write to the file.
+    :type data: bytes
+    :raises OSError: if the file can not be written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as temp_handle:
+            temp_handle.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def fold_value(value):
+    """Converts a value to the form used for case-insensitive comparisons.
+
+    :param value: Value from a Filter object or a MySQL query.
+    :returns: Lowercase string value, or the unchanged non-string value.
+    """
+    if isinstance(value, str):
+        return value.lower()
+
+    return value
+
+
 def ask_yes_no(prompt="", response_attempt=1):
     """Function to get the user's yes/no response to a question.
 
@@ -1106,6 +1160,23 @@ def truncate_value(value, length, suffix):
     return value
 
 
+def get_seq_hash(seq):
+    """Compute the digest used to compare nucleotide sequences.
+
+    Sequences are compared case-insensitively, so the digest is computed
+    from the uppercase sequence.
+
+    :param seq: Nucleotide sequence.
+    :type seq: str, bytes, or Seq
+    :returns: Hexadecimal SHA-256 digest of the uppercase sequence.
+    :rtype: str
+    """
+    if isinstance(seq, bytes):
+        seq = seq.decode("utf-8")
+    seq = str(seq).upper()
+    return hashlib.sha256(seq.encode("utf-8")).hexdigest()
+
+
 # TODO this needs to be improved.
 # TODO unittest.
 def select_option(prompt, valid_response_set):
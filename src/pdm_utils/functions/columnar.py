@@ -0,0 +1,546 @@
+"""Functions to export and analyze columnar snapshots of phage gene data.
+
+A columnar snapshot is a directory of NumPy .npy files, one per column,
+that can be memory-mapped for fast, vectorized analyses without
+round-trips through the database.  String columns are dictionary-encoded:
+the column file stores integer codes into a sorted array of distinct
+values, and NULL values are stored as NULL_CODE.
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import select
+
+from pdm_utils.functions import fileio
+from pdm_utils.functions import mysqldb_basic
+
+# GLOBAL VARIABLES
+# -----------------------------------------------------------------------------
+COLUMNAR_SUFFIX = ".columns"
+COLUMNAR_MANIFEST = "manifest.json"
+COLUMNAR_CHUNK_SIZE = 5000
+
+COLUMNAR_COLUMNS = {"phage": ["PhageID", "Cluster", "Subcluster", "Status",
+                              "AnnotationAuthor", "RetrieveRecord"],
+                    "gene": ["GeneID", "PhageID", "PhamID", "Name", "Start",
+                             "Stop", "Orientation", "LocusTag", "Notes"],
+                    "pham": ["PhamID", "Color"]}
+
+# Integer columns are stored as int64, with NULL values stored as NULL_CODE.
+# String codes are stored as int32 indexes into the column dictionary.
+NULL_CODE = -1
+INTEGER_KIND = "integer"
+STRING_KIND = "string"
+
+
+# EXPORT FUNCTIONS
+# -----------------------------------------------------------------------------
+def write_columnar_snapshot(alchemist, export_path, db_name=None,
+                            columns=COLUMNAR_COLUMNS,
+                            chunk_size=COLUMNAR_CHUNK_SIZE, verbose=False):
+    """Output a memory-mappable columnar snapshot of the selected database.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param export_path: Path to a valid dir for snapshot creation.
+    :type export_path: Path
+    :param db_name: Name of the snapshot directory, without the suffix.
+    :type db_name: str
+    :param columns: Dictionary of table names mapped to lists of column names.
+    :type columns: dict{str:list[str]}
+    :param chunk_size: Number of rows retrieved per database fetch.
+    :type chunk_size: int
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :returns: Path to the written snapshot directory.
+    :rtype: Path
+    """
+    if db_name is None:
+        db_name = fileio.get_snapshot_name(alchemist.database)
+
+    snapshot_path = export_path.joinpath(f"{db_name}{COLUMNAR_SUFFIX}")
+    if snapshot_path.exists():
+        shutil.rmtree(snapshot_path)
+    snapshot_path.mkdir()
+
+    version_data = mysqldb_basic.get_first_row_data(alchemist.engine,
+                                                    "version")
+    manifest = {"version": {key: value for key, value in version_data.items()
+                            if isinstance(value, (int, str))},
+                "tables": {}}
+
+    source_engine = alchemist.engine.execution_options(stream_results=True)
+    for table_name, column_names in columns.items():
+        table = alchemist.metadata.tables.get(table_name)
+        if table is None:
+            continue
+
+        table_columns = [table.c[name] for name in column_names
+                         if name in table.c]
+        if verbose:
+            print(f"...Writing columns for table '{table_name}'...")
+
+        column_values = [[] for column in table_columns]
+        with source_engine.connect() as connection:
+            proxy = connection.execute(select(table_columns))
+            while True:
+                rows = proxy.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    for index in range(len(table_columns)):
+                        column_values[index].append(row[index])
+
+        table_manifest = {"rows": 0, "columns": {}}
+        for column, values in zip(table_columns, column_values):
+            kind = get_column_kind(column)
+            file_prefix = snapshot_path.joinpath(f"{table_name}.{column.name}")
+
+            if kind == INTEGER_KIND:
+                np.save(f"{file_prefix}.npy", encode_integers(values))
+            else:
+                codes, dictionary = encode_strings(values)
+                np.save(f"{file_prefix}.npy", codes)
+                np.save(f"{file_prefix}.dict.npy", dictionary)
+
+            table_manifest["rows"] = len(values)
+            table_manifest["columns"][column.name] = kind
+
+        manifest["tables"][table_name] = table_manifest
+
+    with snapshot_path.joinpath(COLUMNAR_MANIFEST).open(mode="w") as handle:
+        json.dump(manifest, handle, indent=2)
+
+    return snapshot_path
+
+
+def get_column_kind(column):
+    """Get the snapshot storage kind of a SQLAlchemy Column.
+
+    :param column: SQLAlchemy Column object.
+    :type column: Column
+    :returns: INTEGER_KIND or STRING_KIND.
+    :rtype: str
+    """
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return STRING_KIND
+
+    if issubclass(python_type, int):
+        return INTEGER_KIND
+    return STRING_KIND
+
+
+def encode_integers(values):
+    """Convert a list of integers, possibly containing None, to an array.
+
+    :param values: List of integer values.
+    :type values: list[int]
+    :returns: Array of int64 values with None stored as NULL_CODE.
+    :rtype: ndarray
+    """
+    return np.array([NULL_CODE if value is None else value
+                     for value in values], dtype=np.int64)
+
+
+def encode_strings(values):
+    """Dictionary-encode a list of strings or bytes, possibly containing None.
+
+    :param values: List of string or bytes values.
+    :type values: list[str]
+    :returns: Array of int32 codes and the sorted array of distinct strings.
+    :rtype: tuple(ndarray, ndarray)
+    """
+    codes = np.full(len(values), NULL_CODE, dtype=np.int32)
+
+    not_null = []
+    strings = []
+    for index, value in enumerate(values):
+        if value is None:
+            continue
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        not_null.append(index)
+        strings.append(str(value))
+
+    dictionary, inverse = np.unique(np.array(strings, dtype=np.str_),
+                                    return_inverse=True)
+    codes[not_null] = inverse
+    return (codes, dictionary)
+
+
+# LOADING FUNCTIONS
+# -----------------------------------------------------------------------------
+def is_columnar_snapshot(snapshot_path):
+    """Determine whether a path names a columnar snapshot directory.
+
+    :param snapshot_path: Path to a columnar snapshot directory.
+    :type snapshot_path: Path
+    :rtype: bool
+    """
+    if snapshot_path is None:
+        return False
+
+    return Path(snapshot_path).joinpath(COLUMNAR_MANIFEST).is_file()
+
+
+def load_columnar_snapshot(snapshot_path, mmap=True):
+    """Load a columnar snapshot, memory-mapping the column files.
+
+    :param snapshot_path: Path to a columnar snapshot directory.
+    :type snapshot_path: Path
+    :param mmap: A boolean to toggle memory-mapping instead of reading.
+    :type mmap: bool
+    :returns: Dictionary with 'version', 'tables', and 'dictionaries' keys.
+    :rtype: dict
+    """
+    snapshot_path = Path(snapshot_path)
+    with snapshot_path.joinpath(COLUMNAR_MANIFEST).open() as handle:
+        manifest = json.load(handle)
+
+    mmap_mode = None
+    if mmap:
+        mmap_mode = "r"
+
+    snapshot = {"version": manifest["version"], "tables": {},
+                "dictionaries": {}}
+    for table_name, table_manifest in manifest["tables"].items():
+        table_columns = {}
+        table_dictionaries = {}
+        for column_name, kind in table_manifest["columns"].items():
+            file_prefix = snapshot_path.joinpath(f"{table_name}.{column_name}")
+            table_columns[column_name] = np.load(f"{file_prefix}.npy",
+                                                 mmap_mode=mmap_mode)
+            if kind == STRING_KIND:
+                table_dictionaries[column_name] = np.load(
+                                                    f"{file_prefix}.dict.npy",
+                                                    mmap_mode=mmap_mode)
+
+        snapshot["tables"][table_name] = table_columns
+        snapshot["dictionaries"][table_name] = table_dictionaries
+
+    return snapshot
+
+
+def get_column(snapshot, column):
+    """Get the stored array for a column of a snapshot.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param column: Column name formatted as {Table}.{Column}.
+    :type column: str
+    :returns: Integer values, or codes for dictionary-encoded columns.
+    :rtype: ndarray
+    """
+    table_name, column_name = column.split(".")
+    try:
+        return snapshot["tables"][table_name][column_name]
+    except KeyError:
+        raise ValueError(f"Column '{column}' is not in the snapshot.")
+
+
+def get_dictionary(snapshot, column):
+    """Get the dictionary of distinct strings for an encoded column.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param column: Column name formatted as {Table}.{Column}.
+    :type column: str
+    :returns: Sorted array of distinct strings, or None for integer columns.
+    :rtype: ndarray
+    """
+    table_name, column_name = column.split(".")
+    return snapshot["dictionaries"].get(table_name, {}).get(column_name)
+
+
+def decode_column(snapshot, column, codes=None):
+    """Convert stored column values to their Python values.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param column: Column name formatted as {Table}.{Column}.
+    :type column: str
+    :param codes: Subset of stored values to decode, instead of the column.
+    :type codes: ndarray
+    :returns: List of decoded values, with NULL values as None.
+    :rtype: list
+    """
+    if codes is None:
+        codes = get_column(snapshot, column)
+
+    dictionary = get_dictionary(snapshot, column)
+    if dictionary is None:
+        return [None if value == NULL_CODE else int(value)
+                for value in codes]
+
+    return [None if code == NULL_CODE else str(dictionary[code])
+            for code in codes]
+
+
+def encode_values(snapshot, column, values):
+    """Convert Python values to the stored values of a snapshot column.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param column: Column name formatted as {Table}.{Column}.
+    :type column: str
+    :param values: Values to encode.
+    :type values: list
+    :returns: Array of stored values, with missing strings as NULL_CODE.
+    :rtype: ndarray
+    """
+    dictionary = get_dictionary(snapshot, column)
+    if dictionary is None:
+        return encode_integers(values)
+
+    strings = np.array([str(value) for value in values], dtype=np.str_)
+    return lookup_strings(dictionary, strings)
+
+
+def lookup_strings(dictionary, strings):
+    """Find the codes of strings in a sorted dictionary array.
+
+    :param dictionary: Sorted array of distinct strings.
+    :type dictionary: ndarray
+    :param strings: Array of strings to find.
+    :type strings: ndarray
+    :returns: Array of int32 codes, with missing strings as NULL_CODE.
+    :rtype: ndarray
+    """
+    codes = np.full(len(strings), NULL_CODE, dtype=np.int32)
+    if len(dictionary) == 0 or len(strings) == 0:
+        return codes
+
+    positions = np.searchsorted(dictionary, strings)
+    in_range = positions < len(dictionary)
+    found = np.zeros(len(strings), dtype=bool)
+    found[in_range] = (dictionary[positions[in_range]] == strings[in_range])
+    codes[found] = positions[found]
+    return codes
+
+
+# ANALYSIS FUNCTIONS
+# -----------------------------------------------------------------------------
+def get_pham_mask(snapshot, phams=None):
+    """Get a boolean mask of gene rows belonging to the selected phams.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param phams: PhamIDs to select, or None to select all phammed genes.
+    :type phams: list[int]
+    :rtype: ndarray
+    """
+    gene_phams = get_column(snapshot, "gene.PhamID")
+    if phams is None:
+        return gene_phams != NULL_CODE
+
+    return np.isin(gene_phams, np.array(list(phams), dtype=np.int64))
+
+
+def get_pham_sizes(snapshot, phams=None):
+    """Count the number of genes in each pham.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param phams: PhamIDs to count, or None to count all phams.
+    :type phams: list[int]
+    :returns: Dictionary of PhamIDs mapped to their number of genes.
+    :rtype: dict{int:int}
+    """
+    gene_phams = get_column(snapshot, "gene.PhamID")
+    gene_phams = gene_phams[get_pham_mask(snapshot, phams=phams)]
+
+    unique_phams, counts = np.unique(gene_phams, return_counts=True)
+    return dict(zip(unique_phams.tolist(), counts.tolist()))
+
+
+def get_discrepant_phams(snapshot, phams=None):
+    """Find phams whose genes have more than one distinct annotation.
+
+    NULL annotations are not counted as distinct annotations.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param phams: PhamIDs to review, or None to review all phams.
+    :type phams: list[int]
+    :returns: List of discrepant PhamIDs, in the order of phams if given.
+    :rtype: list[int]
+    """
+    gene_phams = get_column(snapshot, "gene.PhamID")
+    gene_notes = get_column(snapshot, "gene.Notes")
+
+    mask = get_pham_mask(snapshot, phams=phams) & (gene_notes != NULL_CODE)
+    pairs = np.stack([gene_phams[mask],
+                      gene_notes[mask].astype(np.int64)], axis=1)
+    distinct_pairs = np.unique(pairs, axis=0)
+
+    unique_phams, counts = np.unique(distinct_pairs[:, 0], return_counts=True)
+    discrepant = set(unique_phams[counts > 1].tolist())
+
+    if phams is None:
+        return sorted(discrepant)
+    return [pham for pham in phams if pham in discrepant]
+
+
+def get_annotation_counts(snapshot, pham):
+    """Count the annotations of the genes in a pham.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param pham: PhamID of the pham to count annotations for.
+    :type pham: int
+    :returns: Dictionary of annotations mapped to their number of genes.
+    :rtype: dict{str:int}
+    """
+    gene_notes = get_column(snapshot, "gene.Notes")
+    gene_notes = gene_notes[get_pham_mask(snapshot, phams=[pham])]
+
+    codes, counts = np.unique(gene_notes, return_counts=True)
+    annotations = decode_column(snapshot, "gene.Notes", codes=codes)
+    return dict(zip(annotations, counts.tolist()))
+
+
+def get_gene_phage_rows(snapshot):
+    """Get the phage table row of each gene in a snapshot.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :returns: Array of phage row indexes, with unmatched genes as NULL_CODE.
+    :rtype: ndarray
+    """
+    gene_dictionary = get_dictionary(snapshot, "gene.PhageID")
+    phage_dictionary = get_dictionary(snapshot, "phage.PhageID")
+    phage_codes = get_column(snapshot, "phage.PhageID")
+
+    # Translate gene PhageID codes to phage PhageID codes, then to rows.
+    # The extra trailing row_map entry maps missing (NULL_CODE) phages.
+    code_map = lookup_strings(phage_dictionary, gene_dictionary)
+    row_map = np.full(len(phage_dictionary) + 1, NULL_CODE, dtype=np.int64)
+    row_map[phage_codes] = np.arange(len(phage_codes))
+
+    gene_phages = get_column(snapshot, "gene.PhageID")
+    phage_rows = np.full(len(gene_phages), NULL_CODE, dtype=np.int64)
+    matched = gene_phages != NULL_CODE
+    phage_rows[matched] = row_map[code_map[gene_phages[matched]]]
+    return phage_rows
+
+
+def get_cluster_pham_matrix(snapshot, phams=None):
+    """Count the genes of each pham present in each cluster.
+
+    :param snapshot: Loaded columnar snapshot.
+    :type snapshot: dict
+    :param phams: PhamIDs to count, or None to count all phams.
+    :type phams: list[int]
+    :returns: Cluster names, PhamIDs, and a cluster by pham count matrix.
+    :rtype: tuple(list[str], list[int], ndarray)
+    """
+    phage_rows = get_gene_phage_rows(snapshot)
+    mask = get_pham_mask(snapshot, phams=phams) & (phage_rows != NULL_CODE)
+
+    gene_phams = get_column(snapshot, "gene.PhamID")[mask]
+    cluster_codes = get_column(snapshot, "phage.Cluster")[phage_rows[mask]]
+
+    unique_clusters, cluster_index = np.unique(cluster_codes,
+                                               return_inverse=True)
+    unique_phams, pham_index = np.unique(gene_phams, return_inverse=True)
+
+    matrix = np.zeros((len(unique_clusters), len(unique_phams)),
+                      dtype=np.int64)
+    np.add.at(matrix, (cluster_index, pham_index), 1)
+
+    clusters = decode_column(snapshot, "phage.Cluster", codes=unique_clusters)
+    return (clusters, unique_phams.tolist(), matrix)
+
+
+def find_phams(a_snapshot, b_snapshot, phams=None, show_per=False,
+               use_locus=False):
+    """Find the phams of a database that correspond to reference phams.
+
+    Genes are matched between the snapshots by GeneID, or by LocusTag.
+
+    :param a_snapshot: Loaded columnar snapshot of the reference database.
+    :type a_snapshot: dict
+    :param b_snapshot: Loaded columnar snapshot of a database.
+    :type b_snapshot: dict
+    :param phams: Reference PhamIDs to map, or None to map all phams.
+    :type phams: list[int]
+    :param show_per: Enables display gene coverage of the corresponding phams.
+    :type show_per: bool
+    :param use_locus: Toggles conversion between phams using LocusTag instead
+    :type use_locus: bool
+    :returns: Returns a dictionary mapping original phams to corresponding phams
+    :rtype: dict{int:str}
+    """
+    key_column = "gene.GeneID"
+    if use_locus:
+        key_column = "gene.LocusTag"
+
+    a_mask = get_pham_mask(a_snapshot, phams=phams)
+    a_keys = get_column(a_snapshot, key_column)[a_mask]
+    a_phams = get_column(a_snapshot, "gene.PhamID")[a_mask]
+
+    # Translate reference key codes to the key codes of the other snapshot.
+    code_map = lookup_strings(get_dictionary(b_snapshot, key_column),
+                              get_dictionary(a_snapshot, key_column))
+    b_codes = np.full(len(a_keys), NULL_CODE, dtype=np.int32)
+    has_key = a_keys != NULL_CODE
+    b_codes[has_key] = code_map[a_keys[has_key]]
+
+    # Join reference genes to all genes of the other snapshot sharing a key.
+    b_keys = get_column(b_snapshot, key_column)
+    b_order = np.argsort(b_keys, kind="stable")
+    sorted_b_keys = b_keys[b_order]
+    left = np.searchsorted(sorted_b_keys, b_codes, side="left")
+    right = np.searchsorted(sorted_b_keys, b_codes, side="right")
+    matches = np.where(b_codes == NULL_CODE, 0, right - left)
+
+    starts = np.repeat(left, matches)
+    offsets = np.arange(matches.sum()) - np.repeat(np.cumsum(matches) -
+                                                   matches, matches)
+    b_rows = b_order[starts + offsets]
+
+    joined_a_phams = np.repeat(a_phams, matches)
+    joined_b_phams = get_column(b_snapshot, "gene.PhamID")[b_rows]
+    phammed = joined_b_phams != NULL_CODE
+
+    pairs = np.stack([joined_a_phams[phammed], joined_b_phams[phammed]],
+                     axis=1)
+    unique_pairs, counts = np.unique(pairs, axis=0, return_counts=True)
+
+    corresponding = {}
+    for (a_pham, b_pham), count in zip(unique_pairs.tolist(),
+                                       counts.tolist()):
+        corresponding.setdefault(a_pham, []).append((b_pham, count))
+
+    if phams is None:
+        phams = np.unique(a_phams).tolist()
+
+    mapped_phams = {}
+    for pham in phams:
+        phams_list = corresponding.get(pham, [])
+
+        if len(phams_list) == 1:
+            if phams_list[0][0] == pham:
+                continue
+            corr_phams = str(phams_list[0][0])
+        elif len(phams_list) == 0:
+            corr_phams = "None"
+        else:
+            total_genes = sum([count for b_pham, count in phams_list])
+            join_phams = []
+            for b_pham, count in phams_list:
+                if show_per:
+                    percent = round((count / total_genes) * 100, 1)
+                    join_phams.append(f"{b_pham}({percent}%)")
+                else:
+                    join_phams.append(str(b_pham))
+            corr_phams = ";".join(join_phams)
+
+        mapped_phams[pham] = corr_phams
+
+    return mapped_phams
@@ -1,19 +1,51 @@
 import csv
+import gzip
+import hashlib
+import io
 import os
+import struct
+import subprocess
+import tempfile
 import textwrap
+import zlib
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
+from io import StringIO
 from pathlib import Path
 
 from Bio import SeqIO
 from Bio.SeqFeature import CompoundLocation
-
-from pdm_utils.classes.fileio import FeatureTableParser
-from pdm_utils.functions import multithread
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import ForeignKeyConstraint
+from sqlalchemy import Index
+from sqlalchemy import MetaData
+from sqlalchemy import select
+from sqlalchemy import Table
+from sqlalchemy import types
+
+from pdm_utils.classes.fileio import (BlockCompressionWriter,
+                                     FeatureTableParser)
+from pdm_utils.classes.progressbar import show_progress
+from pdm_utils.functions import mysqldb_basic, multithread
 
 # GLOBAL VARIABLES
 # -----------------------------------------------------------------------------
 TBL_EXCLUDED_QUALIFIERS = ["translation"]
 TBL_SPECIAL_QUALIFIERS = ["ribosomal_slippage"]
 
+COMPRESSION_FORMATS = ["gzip", "bgzf", "zstd"]
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "bgzf": ".gz", "zstd": ".zst"}
+GZIP_BLOCK_SIZE = 1048576
+# BGZF blocks are limited to 64KiB, leaving room for incompressible data.
+BGZF_BLOCK_SIZE = 65280
+BGZF_HEADER = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00"
+BGZF_EOF = (b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC"
+            b"\x02\x00\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00")
+
+SQLITE_SUFFIX = ".sqlite"
+SQLITE_CHUNK_SIZE = 5000
+
 
 # READING FUNCTIONS
 # -----------------------------------------------------------------------------
@@ -95,9 +127,131 @@ def reintroduce_fasta_duplicates(ts_to_gs, filepath):
     write_fasta(gs_to_ts, filepath)
 
 
+# COMPRESSION FUNCTIONS
+# -----------------------------------------------------------------------------
+def compress_gzip_block(block):
+    """Compresses a block of data into an independent gzip member.
+
+    :param block: Uncompressed data.
+    :type block: bytes
+    :returns: A complete gzip member that can be concatenated with others.
+    :rtype: bytes
+    """
+    return gzip.compress(block, mtime=0)
+
+
+def compress_bgzf_block(block):
+    """Compresses a block of data into a single BGZF block.
+
+    :param block: Uncompressed data of at most 65536 bytes.
+    :type block: bytes
+    :returns: A complete BGZF block.
+    :rtype: bytes
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0)
+    compressed = compressor.compress(block) + compressor.flush()
+
+    # BSIZE is the total block size minus one; header and footer are 26 bytes.
+    block_size = struct.pack("<H", len(compressed) + 25)
+    crc = struct.pack("<I", zlib.crc32(block) & 0xffffffff)
+    uncompressed_length = struct.pack("<I", len(block))
+
+    return b"".join([BGZF_HEADER, block_size, compressed, crc,
+                     uncompressed_length])
+
+
+def get_compressed_path(file_path, compression=None):
+    """Appends the suffix of a compression format to a file path.
+
+    :param file_path: Path to the uncompressed file.
+    :type file_path: Path
+    :param compression: Compression format name.
+    :type compression: str
+    :returns: Path with the compression format suffix appended.
+    :rtype: Path
+    """
+    if compression is None:
+        return file_path
+
+    suffix = COMPRESSION_SUFFIXES.get(compression)
+    if suffix is None:
+        raise ValueError(f"Compression format '{compression}' "
+                         "is not supported.")
+
+    return file_path.with_name("".join([file_path.name, suffix]))
+
+
+def open_binary_writer(file_path, compression=None, threads=1):
+    """Opens a binary file handle that compresses data as it is written.
+
+    gzip and bgzf output is compressed in independent blocks across
+    the given number of threads, and zstd output uses the native
+    multithreaded compressor from the optional zstandard package.
+
+    :param file_path: Path to the file to write, without compression suffix.
+    :type file_path: Path
+    :param compression: Compression format name.
+    :type compression: str
+    :param threads: Number of threads to compress data with.
+    :type threads: int
+    :returns: A writable binary file handle.
+    """
+    file_path = get_compressed_path(file_path, compression=compression)
+    file_handle = file_path.open(mode="wb")
+
+    if compression is None:
+        return file_handle
+    elif compression == "gzip":
+        return BlockCompressionWriter(file_handle, compress_gzip_block,
+                                      block_size=GZIP_BLOCK_SIZE,
+                                      threads=threads)
+    elif compression == "bgzf":
+        return BlockCompressionWriter(file_handle, compress_bgzf_block,
+                                      block_size=BGZF_BLOCK_SIZE,
+                                      threads=threads, eof=BGZF_EOF)
+    elif compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            file_handle.close()
+            file_path.unlink()
+            raise ValueError("zstd compression requires the "
+                             "'zstandard' package to be installed.")
+
+        # zstandard uses 0 threads to disable multithreaded compression.
+        compressor = zstandard.ZstdCompressor(
+                                    threads=(threads if threads > 1 else 0))
+        return compressor.stream_writer(file_handle)
+    else:
+        file_handle.close()
+        file_path.unlink()
+        raise ValueError(f"Compression format '{compression}' "
+                         "is not supported.")
+
+
+def open_text_writer(file_path, compression=None, threads=1):
+    """Opens a text file handle that compresses data as it is written.
+
+    :param file_path: Path to the file to write, without compression suffix.
+    :type file_path: Path
+    :param compression: Compression format name.
+    :type compression: str
+    :param threads: Number of threads to compress data with.
+    :type threads: int
+    :returns: A writable text file handle.
+    """
+    if compression is None:
+        return file_path.open(mode="w")
+
+    binary_handle = open_binary_writer(file_path, compression=compression,
+                                       threads=threads)
+    return io.TextIOWrapper(binary_handle)
+
+
 # WRITING FUNCTIONS
 # -----------------------------------------------------------------------------
-def export_data_dict(data_dicts, file_path, headers, include_headers=False):
+def export_data_dict(data_dicts, file_path, headers, include_headers=False,
+                     compression=None, threads=1):
     """Save a dictionary of data to file using specified column headers.
 
     Ensures the output file contains a specified number of columns,
@@ -117,13 +271,18 @@ def export_data_dict(data_dicts, file_path, headers, include_headers=False):
         Indicates whether the file should contain a
         row of column names derived from the headers parameter.
     :type include_headers: bool
+    :param compression: Compression format name.
+    :type compression: str
+    :param threads: Number of threads to compress data with.
+    :type threads: int
     """
 
     headers_dict = {}
     for header in headers:
         headers_dict[header] = header
     # with open(file_path, "w") as file_handle:
-    with file_path.open("w") as file_handle:
+    with open_text_writer(file_path, compression=compression,
+                          threads=threads) as file_handle:
         file_writer = csv.DictWriter(file_handle, headers)
         if include_headers:
             file_writer.writerow(headers_dict)
@@ -159,29 +318,346 @@ def write_fasta(ids_seqs, infile_path, name=None):
     file_handle.close()
 
 
-def write_database(alchemist, version, export_path, db_name=None):
+def dump_table(alchemist, table, file_path, compression=None, threads=1):
+    """Dumps a single table with mysqldump, streaming it to a file.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param table: Name of the table to dump.
+    :type table: str
+    :param file_path: Path to the file to write, without compression suffix.
+    :type file_path: Path
+    :param compression: Compression format name.
+    :type compression: str
+    :param threads: Number of threads to compress the dump with.
+    :type threads: int
+    :returns: SHA-256 hex digest of the uncompressed table dump.
+    :rtype: str
+    """
+    command = mysqldb_basic.mysqldump_command(alchemist.username,
+                                              alchemist.password,
+                                              alchemist.database)
+    command.extend(["--skip-comments", table])
+
+    sha256 = hashlib.sha256()
+    with tempfile.TemporaryFile() as stderr_handle:
+        with open_binary_writer(file_path, compression=compression,
+                                threads=threads) as handle:
+            with subprocess.Popen(command, stdout=subprocess.PIPE,
+                                  stderr=stderr_handle) as process:
+                for chunk in iter(lambda: process.stdout.read(65536), b""):
+                    sha256.update(chunk)
+                    handle.write(chunk)
+
+        if process.returncode != 0:
+            stderr_handle.seek(0)
+            error = stderr_handle.read().decode("utf-8", "replace").strip()
+            raise OSError(f"mysqldump of table '{table}' failed with exit "
+                          f"status {process.returncode}: {error}")
+
+    return sha256.hexdigest()
+
+
+def dump_tables(alchemist, tables, part_paths, compression=None, threads=1,
+                verbose=False):
+    """Dumps tables in parallel from one consistent state of the database.
+
+    All tables are read locked until every dump is finished, so the dumps
+    and row counts form one snapshot, as a single mysqldump run does.
+    The lock blocks writes from other sessions, but not the reads of the
+    mysqldump processes.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param tables: Names of the tables to dump.
+    :type tables: list[str]
+    :param part_paths: Paths to write each table dump to.
+    :type part_paths: dict{str:Path}
+    :param compression: Compression format name.
+    :type compression: str
+    :param threads:
+        Number of threads shared by the simultaneous table dumps and
+        their compression.
+    :type threads: int
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :returns: tuple (row_counts, digests) of dictionaries keyed by table.
+    :rtype: tuple
+    """
+    connection = alchemist.engine.connect()
+    try:
+        locks = ", ".join([f"`{table}` READ" for table in tables])
+        connection.execute(f"LOCK TABLES {locks}")
+
+        row_counts = {}
+        for table in tables:
+            row_counts[table] = mysqldb_basic.get_table_count(connection,
+                                                              table)
+
+        # The thread budget is split between simultaneous table dumps and
+        # the compression threads of each dump.
+        dump_threads = max([1, min([threads, len(tables)])])
+        compression_threads = max([1, threads // dump_threads])
+
+        digests = {}
+        with ThreadPoolExecutor(max_workers=dump_threads) as executor:
+            futures = {}
+            for table in sorted(tables, key=lambda table: row_counts[table],
+                                reverse=True):
+                futures[executor.submit(dump_table, alchemist, table,
+                                        part_paths[table],
+                                        compression=compression,
+                                        threads=compression_threads)] = table
+
+            for future in as_completed(futures):
+                table = futures[future]
+                digests[table] = future.result()
+                if verbose:
+                    print(f"...Dumped table '{table}' "
+                          f"({row_counts[table]} rows)...")
+    finally:
+        connection.execute("UNLOCK TABLES")
+        connection.close()
+
+    return (row_counts, digests)
+
+
+def write_database(alchemist, version, export_path, db_name=None,
+                   compression=None, threads=1, verbose=False):
     """Output .sql file from the selected database.
 
+    Tables are dumped in parallel, largest first, while writes to the
+    database are locked, and the table dumps are joined in table name
+    order.  The .version file records the version
+    on its first line, followed by the checksum of the .sql file and the
+    row count and checksum of each table dump.
+
     :param alchemist: A connected and fully built AlchemyHandler object.
     :type alchemist: AlchemyHandler
     :param version: Database version information.
     :type version: int
     :param export_path: Path to a valid dir for file creation.
     :type export_path: Path
+    :param compression: Compression format name.
+    :type compression: str
+    :param threads: Number of tables to dump simultaneously.
+    :type threads: int
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
     """
     if db_name is None:
         db_name = alchemist.database
 
+    tables = sorted(mysqldb_basic.get_tables(alchemist.engine,
+                                             alchemist.database))
+
     sql_path = export_path.joinpath(f"{db_name}.sql")
-    os.system(f"mysqldump -u {alchemist.username} -p{alchemist.password} "
-              f"--skip-comments {alchemist.database} > {str(sql_path)}")
-    version_path = sql_path.with_name(f"{db_name}.version")
+    with tempfile.TemporaryDirectory(dir=export_path) as temp_dir:
+        part_paths = {}
+        for table in tables:
+            part_paths[table] = Path(temp_dir, f"{table}.sql")
+
+        row_counts, digests = dump_tables(alchemist, tables, part_paths,
+                                          compression=compression,
+                                          threads=threads, verbose=verbose)
+
+        # Concatenated gzip members and zstd frames are valid streams.
+        sql_path = get_compressed_path(sql_path, compression=compression)
+        sql_sha256 = hashlib.sha256()
+        with sql_path.open(mode="wb") as sql_handle:
+            for table in tables:
+                part_path = get_compressed_path(part_paths[table],
+                                                compression=compression)
+                with part_path.open(mode="rb") as part_handle:
+                    for chunk in iter(lambda: part_handle.read(65536), b""):
+                        sql_sha256.update(chunk)
+                        sql_handle.write(chunk)
+
+    version_lines = [f"{version}",
+                     f"file\t{sql_path.name}\tsha256:{sql_sha256.hexdigest()}"]
+    for table in tables:
+        version_lines.append(f"table\t{table}\t{row_counts[table]}\t"
+                             f"sha256:{digests[table]}")
+
+    version_path = export_path.joinpath(f"{db_name}.version")
     version_path.touch()
-    version_path.write_text(f"{version}")
+    version_path.write_text("\n".join(version_lines) + "\n")
+
+
+def write_sqlite_database(alchemist, export_path, db_name=None,
+                          compression=None, chunk_size=SQLITE_CHUNK_SIZE,
+                          verbose=False):
+    """Output a SQLite snapshot file of the selected database.
+
+    The snapshot has the tables, keys, and indexes of the database, with
+    MySQL column types converted to their generic equivalents.  It can be
+    opened with an AlchemyHandler using the sqlite dialect.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param export_path: Path to a valid dir for file creation.
+    :type export_path: Path
+    :param db_name: Name of the snapshot file, without the suffix.
+    :type db_name: str
+    :param compression: Compression format name.
+    :type compression: str
+    :param chunk_size: Number of rows copied per batch insert.
+    :type chunk_size: int
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :returns: Path to the written snapshot file.
+    :rtype: Path
+    """
+    if db_name is None:
+        db_name = get_snapshot_name(alchemist.database)
+
+    sqlite_path = export_path.joinpath(f"{db_name}{SQLITE_SUFFIX}")
+    if sqlite_path.exists():
+        sqlite_path.unlink()
+
+    sqlite_metadata = build_sqlite_metadata(alchemist.metadata)
+    sqlite_engine = create_engine(f"sqlite:///{sqlite_path}")
+    source_engine = alchemist.engine.execution_options(stream_results=True)
+
+    # Indexes are built after the data is loaded, which is much faster
+    # than maintaining them during the inserts.
+    indexes = []
+    for table in sqlite_metadata.sorted_tables:
+        indexes.extend(table.indexes)
+        table.indexes = set()
+    sqlite_metadata.create_all(sqlite_engine)
+
+    with sqlite_engine.begin() as sqlite_connection:
+        sqlite_connection.execute("PRAGMA synchronous = OFF")
+        for table in sqlite_metadata.sorted_tables:
+            source_table = alchemist.metadata.tables[table.name]
+            if verbose:
+                print(f"...Copying table '{table.name}'...")
+
+            with source_engine.connect() as source_connection:
+                proxy = source_connection.execute(select([source_table]))
+                while True:
+                    rows = proxy.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    sqlite_connection.execute(table.insert(),
+                                              [dict(row) for row in rows])
+
+        for index in indexes:
+            index.create(sqlite_connection)
+
+    sqlite_engine.dispose()
+
+    if compression is None:
+        return sqlite_path
+
+    compressed_path = get_compressed_path(sqlite_path, compression)
+    with sqlite_path.open(mode="rb") as sqlite_handle:
+        with open_binary_writer(sqlite_path,
+                                compression=compression) as compressed_handle:
+            for chunk in iter(lambda: sqlite_handle.read(GZIP_BLOCK_SIZE),
+                              b""):
+                compressed_handle.write(chunk)
+    sqlite_path.unlink()
+
+    return compressed_path
+
+
+def get_snapshot_name(database):
+    """Get a default snapshot file name for a database.
+
+    :param database: Name of a MySQL database or path to a SQLite file.
+    :type database: str
+    :returns: Database name without any directories or SQLite suffix.
+    :rtype: str
+    """
+    snapshot_name = Path(database).name
+    if snapshot_name.endswith(SQLITE_SUFFIX):
+        snapshot_name = snapshot_name[:-len(SQLITE_SUFFIX)]
+    return snapshot_name
+
+
+def build_sqlite_metadata(metadata):
+    """Get a SQLite compatible copy of reflected MySQL MetaData.
+
+    Index names are prefixed with their table name, since SQLite index
+    names share a single namespace.
+
+    :param metadata: Reflected SQLAlchemy MetaData object.
+    :type metadata: MetaData
+    :returns: SQLAlchemy MetaData object with SQLite compatible tables.
+    :rtype: MetaData
+    """
+    sqlite_metadata = MetaData()
+    for table in metadata.sorted_tables:
+        columns = []
+        for column in table.columns:
+            columns.append(Column(column.name, get_sqlite_type(column.type),
+                                  primary_key=column.primary_key,
+                                  nullable=column.nullable,
+                                  autoincrement=False))
+
+        constraints = []
+        for constraint in table.foreign_key_constraints:
+            referred = [element.target_fullname
+                        for element in constraint.elements]
+            constraints.append(ForeignKeyConstraint(
+                                        constraint.column_keys, referred,
+                                        ondelete=constraint.ondelete,
+                                        onupdate=constraint.onupdate))
+
+        sqlite_table = Table(table.name, sqlite_metadata,
+                             *(columns + constraints))
+
+        for index in table.indexes:
+            index_columns = [sqlite_table.c[column.name]
+                             for column in index.columns]
+            Index(f"{table.name}_{index.name}", *index_columns,
+                  unique=index.unique)
+
+    return sqlite_metadata
+
+
+def get_sqlite_type(column_type):
+    """Get the generic SQLAlchemy type for a reflected MySQL column type.
+
+    :param column_type: Reflected SQLAlchemy column type object.
+    :type column_type: TypeEngine
+    :returns: Generic SQLAlchemy column type object.
+    :rtype: TypeEngine
+    """
+    if isinstance(column_type, types.Enum):
+        return types.String(max([len(value) for value in column_type.enums]
+                                + [1]))
+    if isinstance(column_type, types.String):
+        return types.String(column_type.length)
+    if isinstance(column_type, types.Integer):
+        return types.Integer()
+    if isinstance(column_type, types.Float):
+        return types.Float()
+    if isinstance(column_type, types.Numeric):
+        return types.Numeric(column_type.precision, column_type.scale)
+    if isinstance(column_type, types.DateTime):
+        return types.DateTime()
+    if isinstance(column_type, types.Date):
+        return types.Date()
+    if isinstance(column_type, types.Time):
+        return types.Time()
 
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        python_type = None
+
+    if python_type == bytes:
+        return types.LargeBinary()
+    return column_type
 
-def write_seqrecord(seqrecord, file_path, file_format):
-    file_handle = file_path.open(mode="w")
+
+def write_seqrecord(seqrecord, file_path, file_format, compression=None,
+                    threads=1):
+    file_handle = open_text_writer(file_path, compression=compression,
+                                   threads=threads)
 
     if isinstance(seqrecord, list):
         for record in seqrecord:
@@ -193,13 +669,32 @@ def write_seqrecord(seqrecord, file_path, file_format):
     file_handle.close()
 
 
-def write_feature_table(seqrecord_list, export_path, verbose=False):
+def format_seqrecord(seqrecord, file_format):
+    """Formats a SeqRecord into a string with a Biopython supported format.
+
+    :param seqrecord: Populated SeqRecord.
+    :type seqrecord: SeqRecord
+    :param file_format: Biopython supported file type.
+    :type file_format: str
+    :returns: The formatted SeqRecord text.
+    :rtype: str
+    """
+    string_handle = StringIO()
+    SeqIO.write(seqrecord, string_handle, file_format)
+
+    return string_handle.getvalue()
+
+
+def write_feature_table(seqrecord_list, export_path, compression=None,
+                        verbose=False):
     """Outputs files as five_column tab-delimited text files.
 
     :param seq_record_list: List of populated SeqRecords.
     :type seq_record_list: list[SeqRecord]
     :param export_path: Path to a dir for file creation.
     :type export_path: Path
+    :param compression: Compression format name.
+    :type compression: str
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
     """
@@ -210,7 +705,7 @@ def write_feature_table(seqrecord_list, export_path, verbose=False):
             print(f"...Writing {record.name}...")
         file_name = f"{record.name}.tbl"
         file_path = export_path.joinpath(file_name)
-        file_handle = file_path.open(mode='w')
+        file_handle = open_text_writer(file_path, compression=compression)
 
         accession = record.id
         version = record.annotations.get("sequence_version")
@@ -268,8 +763,8 @@ def write_feature_table(seqrecord_list, export_path, verbose=False):
 # -----------------------------------------------------------------------------
 
 def write_seqrecords(seqrecord_list, file_format, export_path,
-                     export_name=None, concatenate=False, threads=1,
-                     verbose=False):
+                     export_name=None, concatenate=False, compression=None,
+                     threads=1, verbose=False):
     """Outputs files with a particuar format from a SeqRecord list.
 
     :param seq_record_list: List of populated SeqRecords.
@@ -280,6 +775,8 @@ def write_seqrecords(seqrecord_list, file_format, export_path,
     :type export_path: Path
     :param concatenate: A boolean to toggle concatenation of SeqRecords.
     :type concaternate: bool
+    :param compression: Compression format name.
+    :type compression: str
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
     """
@@ -296,11 +793,107 @@ def write_seqrecords(seqrecord_list, file_format, export_path,
     if verbose:
         print(f"Writing selected data to files at '{export_path}'...")
 
+    # A single concatenated file is compressed in parallel blocks instead.
+    if concatenate:
+        file_name = f"{list(record_dictionary.keys())[0]}.{file_format}"
+        write_seqrecord(seqrecord_list, export_path.joinpath(file_name),
+                        file_format, compression=compression, threads=threads)
+        return
+
     work_items = []
     for record_name, records in record_dictionary.items():
         file_name = f"{record_name}.{file_format}"
         file_path = export_path.joinpath(file_name)
 
-        work_items.append((records, file_path, file_format))
+        work_items.append((records, file_path, file_format, compression))
     multithread.multithread(work_items, threads, write_seqrecord,
                             verbose=verbose)
+
+
+# MULTIPROCESS WRAPPERS
+# -----------------------------------------------------------------------------
+
+def build_and_format_seqrecord(index, build_seqrecord, data, file_format):
+    """Builds a SeqRecord from compact data and formats it into a string.
+
+    :param index: Position of the data in the original work list.
+    :type index: int
+    :param build_seqrecord: Module-level function that returns a SeqRecord.
+    :type build_seqrecord: Function
+    :param data: Tuple of arguments for the build_seqrecord function.
+    :type data: tuple
+    :param file_format: Biopython supported file type.
+    :type file_format: str
+    :returns: The work list index, SeqRecord name, and formatted text.
+    :rtype: tuple
+    """
+    record = build_seqrecord(*data)
+    return (index, record.name, format_seqrecord(record, file_format))
+
+
+def write_seqrecords_from_data(data_list, build_seqrecord, file_format,
+                               export_path, export_name=None,
+                               concatenate=False, compression=None,
+                               processes=1, verbose=False):
+    """Builds and outputs SeqRecords from compact data with multiple processes.
+
+    SeqRecord construction and formatting is CPU-bound, so each process
+    builds and formats its records locally from the compact data and only
+    the formatted text is returned to be written to file.
+
+    :param data_list: List of tuples of arguments for build_seqrecord.
+    :type data_list: list[tuple]
+    :param build_seqrecord: Module-level function that returns a SeqRecord.
+    :type build_seqrecord: Function
+    :param file_format: Biopython supported file type.
+    :type file_format: str
+    :param export_path: Path to a dir for file creation.
+    :type export_path: Path
+    :param export_name: Name of the file created during concatenation.
+    :type export_name: str
+    :param concatenate: A boolean to toggle concatenation of SeqRecords.
+    :type concaternate: bool
+    :param compression: Compression format name.
+    :type compression: str
+    :param processes: Number of processes to spawn during formatting.
+    :type processes: int
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    """
+    work_items = []
+    for index, data in enumerate(data_list):
+        work_items.append((index, build_seqrecord, data, file_format))
+
+    if verbose:
+        print(f"Writing selected data to files at '{export_path}'...")
+
+    # Exceptions raised while formatting a record are re-raised here
+    # by the executor, instead of leaving the export waiting on results.
+    processes = max([1, min([processes, os.cpu_count() or 1,
+                             len(work_items)])])
+    results = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(build_and_format_seqrecord, *work_item)
+                   for work_item in work_items]
+        for future in as_completed(futures):
+            results.append(future.result())
+            if verbose:
+                show_progress(len(results), len(futures))
+    results.sort(key=lambda result: result[0])
+
+    if concatenate:
+        if export_name is None:
+            export_name = export_path.name
+
+        file_path = export_path.joinpath(f"{export_name}.{file_format}")
+        with open_text_writer(file_path, compression=compression,
+                              threads=processes) as file_handle:
+            for index, record_name, record_text in results:
+                file_handle.write(record_text)
+                file_handle.write("\n")
+    else:
+        for index, record_name, record_text in results:
+            file_path = export_path.joinpath(f"{record_name}.{file_format}")
+            with open_text_writer(file_path,
+                                  compression=compression) as file_handle:
+                file_handle.write(record_text)
@@ -554,8 +554,9 @@ def parse_genome_data(seqrecord, filepath=pathlib.Path(),
             tmrna_ftr.set_nucleotide_sequence(parent_genome_seq=gnm.seq)
             tmrna_ftr.set_nucleotide_length(use_seq=True)
             tmrna_ftr.parse_peptide_tag()
-            tmrna_ftr.run_aragorn()
             tmrna_list.append(tmrna_ftr)
+        # All tmRNA sequences are searched in a single Aragorn run.
+        tmrna.run_aragorn_batch(tmrna_list, identifier=f"{gnm.id}_tmrna")
 
     gnm.translation_table = translation_table
     gnm.set_cds_features(cds_list)
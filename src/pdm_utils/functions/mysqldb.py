@@ -519,6 +519,23 @@ def create_seq_set(engine):
     return result_set
 
 
+def create_seq_hash_set(engine):
+    """Create set of genome sequence digests currently in a MySQL database.
+
+    Digests are computed by the MySQL server, so sequences are not
+    retrieved. Each digest matches the one from basic.get_seq_hash().
+
+    :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
+    :type engine: Engine
+    :returns: A set of unique SHA-256 digests of phage.Sequence.
+    :rtype: set
+    """
+    query = "SELECT SHA2(UPPER(CAST(Sequence AS CHAR)), 256) FROM phage"
+    result_set = mysqldb_basic.query_set(engine, query)
+    result_set.discard(None)
+    return result_set
+
+
 def create_update(table, field2, value2, field1, value1):
     """Create MySQL UPDATE statement.
 
@@ -735,6 +752,150 @@ def create_genome_statements(gnm, tkt_type=""):
     return stmts
 
 
+def convert_for_insert(value, check_set=set()):
+    """Convert a value for a parameterized insert.
+
+    :param value: Value that should be checked for conversion.
+    :type value: misc
+    :param check_set: Set of values to check against.
+    :type check_set: set
+    :returns: Returns either None or the value, coerced to str if it is a
+        BioPython Seq object.
+    :rtype: misc
+    """
+    if value in check_set:
+        value = None
+    elif isinstance(value, Seq):
+        value = str(value)
+    return value
+
+
+def create_phage_table_row(gnm):
+    """Create a phage table row dictionary for a parameterized insert.
+
+    Values match those in the statement from create_phage_table_insert().
+
+    :param gnm: A pdm_utils Genome object.
+    :type gnm: Genome
+    :returns: Dictionary where key = column name.
+    :rtype: dict
+    """
+    row = {"PhageID": gnm.id,
+           "Accession": gnm.accession,
+           "Name": gnm.name,
+           "HostGenus": gnm.host_genus,
+           "Sequence": convert_for_insert(gnm.seq),
+           "Length": gnm.length,
+           "GC": gnm.gc,
+           "Status": gnm.annotation_status,
+           "DateLastModified": gnm.date,
+           "RetrieveRecord": gnm.retrieve_record,
+           "AnnotationAuthor": gnm.annotation_author,
+           "Cluster": convert_for_insert(gnm.cluster,
+                                         check_set={"Singleton"}),
+           "Subcluster": convert_for_insert(gnm.subcluster,
+                                            check_set={"none"})}
+    return row
+
+
+def create_gene_table_row(cds_ftr):
+    """Create a gene table row dictionary for a parameterized insert.
+
+    Values match those in the statement from create_gene_table_insert().
+
+    :param cds_ftr: A pdm_utils Cds object.
+    :type cds_ftr: Cds
+    :returns: Dictionary where key = column name.
+    :rtype: dict
+    """
+    row = {"GeneID": cds_ftr.id,
+           "PhageID": cds_ftr.genome_id,
+           "Start": cds_ftr.start,
+           "Stop": cds_ftr.stop,
+           "Length": cds_ftr.length,
+           "Name": cds_ftr.name,
+           "Translation": convert_for_insert(cds_ftr.translation),
+           "Orientation": cds_ftr.orientation,
+           "Notes": cds_ftr.description,
+           "LocusTag": convert_for_insert(cds_ftr.locus_tag, check_set={""}),
+           "Parts": cds_ftr.parts}
+    return row
+
+
+def create_trna_table_row(trna_ftr):
+    """Create a trna table row dictionary for a parameterized insert.
+
+    Values match those in the statement from create_trna_table_insert().
+
+    :param trna_ftr: A pdm_utils Trna object.
+    :type trna_ftr: Trna
+    :returns: Dictionary where key = column name.
+    :rtype: dict
+    """
+    row = {"GeneID": trna_ftr.id,
+           "PhageID": trna_ftr.genome_id,
+           "Start": trna_ftr.start,
+           "Stop": trna_ftr.stop,
+           "Length": trna_ftr.length,
+           "Name": trna_ftr.name,
+           "Orientation": trna_ftr.orientation,
+           "Note": convert_for_insert(trna_ftr.note, check_set={""}),
+           "LocusTag": convert_for_insert(trna_ftr.locus_tag,
+                                          check_set={""}),
+           "AminoAcid": trna_ftr.amino_acid,
+           "Anticodon": trna_ftr.anticodon,
+           "Structure": convert_for_insert(trna_ftr.structure,
+                                           check_set={""}),
+           "Source": convert_for_insert(trna_ftr.use, check_set={None})}
+    return row
+
+
+def create_tmrna_table_row(tmrna_ftr):
+    """Create a tmrna table row dictionary for a parameterized insert.
+
+    Values match those in the statement from create_tmrna_table_insert().
+
+    :param tmrna_ftr: A pdm_utils Tmrna object.
+    :type tmrna_ftr: Tmrna
+    :returns: Dictionary where key = column name.
+    :rtype: dict
+    """
+    row = {"GeneID": tmrna_ftr.id,
+           "PhageID": tmrna_ftr.genome_id,
+           "Start": tmrna_ftr.start,
+           "Stop": tmrna_ftr.stop,
+           "Length": tmrna_ftr.length,
+           "Name": tmrna_ftr.name,
+           "Orientation": tmrna_ftr.orientation,
+           "Note": convert_for_insert(tmrna_ftr.note, check_set={""}),
+           "LocusTag": convert_for_insert(tmrna_ftr.locus_tag,
+                                          check_set={""}),
+           "PeptideTag": convert_for_insert(tmrna_ftr.peptide_tag,
+                                            check_set={""})}
+    return row
+
+
+def create_genome_rows(gnm):
+    """Create row dictionaries for all tables that store a genome's data.
+
+    :param gnm: A pdm_utils Genome object.
+    :type gnm: Genome
+    :returns:
+        Dictionary where key = table name and value = list of row
+        dictionaries, in an order that satisfies foreign keys.
+    :rtype: dict
+    """
+    rows = {"phage": [create_phage_table_row(gnm)], "gene": [], "trna": [],
+            "tmrna": []}
+    for cds_ftr in gnm.cds_features:
+        rows["gene"].append(create_gene_table_row(cds_ftr))
+    for trna_ftr in gnm.trna_features:
+        rows["trna"].append(create_trna_table_row(trna_ftr))
+    for tmrna_ftr in gnm.tmrna_features:
+        rows["tmrna"].append(create_tmrna_table_row(tmrna_ftr))
+    return rows
+
+
 
 def change_version(engine, amount=1):
     """Change the database version number.
@@ -852,17 +1013,7 @@ def execute_transaction(engine, statement_list=[]):
         trans.commit()
 
     except sqlalchemy.exc.DBAPIError as err:
-        err_stmt = err.statement
-        sqla_err_type = str(type(err))
-        pymysql_err_type = str(type(err.orig))
-        pymysql_err_code = err.orig.args[0]
-        pymysql_err_msg = err.orig.args[1]
-        msg = msg + ("A MySQL error was encountered. "
-                     f"SQLAlchemy Error type: {sqla_err_type}. "
-                     f"PyMySQL Error type: {pymysql_err_type}. "
-                     f"PyMYSQL Error code: {pymysql_err_code}. "
-                     f"PyMySQL Error message: {pymysql_err_msg}. "
-                     f"Statement: {err_stmt}")
+        msg = msg + get_dbapi_error_message(err)
         result = 1
     except TypeError as err:
         msg = msg + "A Python TypeError was encountered. "
@@ -889,3 +1040,85 @@ def execute_transaction(engine, statement_list=[]):
     #     for statement in statement_list:
     #         r1 = connection.execute(statement)
 
+
+def execute_genome_inserts(engine, gnm_list, tkt_type=""):
+    """Insert genome data with parameterized statements in one transaction.
+
+    Rows are inserted with one executemany() call per table for all
+    genomes, instead of one formatted INSERT statement per row.
+
+    :param engine:
+        SQLAlchemy Engine object able to connect to a MySQL database.
+    :type engine: Engine
+    :param gnm_list: List of pdm_utils Genome objects.
+    :type gnm_list: list
+    :param tkt_type: 'add' or 'replace'.
+    :type tkt_type: str
+    :returns:
+        tuple (result, message), as for execute_transaction().
+    :rtype: tuple
+    """
+    table_rows = {}
+    phage_ids = []
+    for gnm in gnm_list:
+        phage_ids.append(gnm.id)
+        for table, rows in create_genome_rows(gnm).items():
+            table_rows.setdefault(table, []).extend(rows)
+
+    msg = "Unable to execute MySQL statements. "
+    connection = engine.connect()
+    trans = connection.begin()
+    try:
+        if tkt_type == "replace":
+            phage_table = sqlalchemy.table("phage",
+                                           sqlalchemy.column("PhageID"))
+            connection.execute(phage_table.delete().where(
+                                    phage_table.c.PhageID.in_(phage_ids)))
+
+        for table, rows in table_rows.items():
+            if not rows:
+                continue
+            columns = [sqlalchemy.column(name) for name in rows[0].keys()]
+            table_clause = sqlalchemy.table(table, *columns)
+            connection.execute(table_clause.insert(), rows)
+        trans.commit()
+
+    except sqlalchemy.exc.DBAPIError as err:
+        msg = msg + get_dbapi_error_message(err)
+        result = 1
+    except TypeError as err:
+        msg = msg + "A Python TypeError was encountered. "
+        result = 1
+    else:
+        msg = "MySQL statements were successfully executed. "
+        result = 0
+
+    if result == 1:
+        print(msg)
+        print("Rolling back transaction...")
+        trans.rollback()
+    connection.close()
+
+    return result, msg
+
+
+def get_dbapi_error_message(err):
+    """Describe a SQLAlchemy DBAPIError raised while executing a statement.
+
+    :param err: SQLAlchemy DBAPIError object.
+    :type err: DBAPIError
+    :returns: Description of the error.
+    :rtype: str
+    """
+    err_stmt = err.statement
+    sqla_err_type = str(type(err))
+    pymysql_err_type = str(type(err.orig))
+    pymysql_err_code = err.orig.args[0]
+    pymysql_err_msg = err.orig.args[1]
+    msg = ("A MySQL error was encountered. "
+           f"SQLAlchemy Error type: {sqla_err_type}. "
+           f"PyMySQL Error type: {pymysql_err_type}. "
+           f"PyMYSQL Error code: {pymysql_err_code}. "
+           f"PyMySQL Error message: {pymysql_err_msg}. "
+           f"Statement: {err_stmt}")
+    return msg
@@ -2,6 +2,8 @@
 
 import subprocess
 
+import sqlalchemy
+
 from pdm_utils.functions import basic
 
 def drop_db(engine, database):
@@ -195,6 +197,10 @@ def get_tables(engine, database):
     :returns: Set of table names.
     :rtype: set
     """
+    # SQLite snapshots have no information_schema.
+    if engine.dialect.name == "sqlite":
+        return set(sqlalchemy.inspect(engine).get_table_names())
+
     query = ("SELECT table_name FROM information_schema.tables "
              f"WHERE table_schema = '{database}'")
     tables = query_set(engine, query)
@@ -213,6 +219,10 @@ def get_columns(engine, database, table_name):
     :returns: Set of column names.
     :rtype: set
     """
+    if engine.dialect.name == "sqlite":
+        columns = sqlalchemy.inspect(engine).get_columns(table_name)
+        return {column["name"] for column in columns}
+
     query = ("SELECT column_name FROM information_schema.columns WHERE "
               f"table_schema = '{database}' AND "
               f"table_name = '{table_name}'")
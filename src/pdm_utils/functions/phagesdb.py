@@ -5,8 +5,44 @@ import pathlib
 import urllib.request
 
 from pdm_utils.classes import genome
+from pdm_utils.classes.httpcache import HTTPCache
 from pdm_utils.constants import constants
 
+# GLOBAL VARIABLES
+# -----------------------------------------------------------------------------
+PHAGESDB_CACHE_DIR = pathlib.Path.home().joinpath(".pdm_utils",
+                                                  "phagesdb_cache")
+# Reference lists (host genera, clusters) are reused for this many seconds.
+# Phage-specific data is always revalidated, which only transfers the data
+# again if it changed on PhagesDB.
+PHAGESDB_CACHE_TTL = 24 * 60 * 60
+PHAGESDB_CACHE = HTTPCache(PHAGESDB_CACHE_DIR, ttl=PHAGESDB_CACHE_TTL)
+
+
+def set_offline(offline=True):
+    """Use cached PhagesDB responses without contacting PhagesDB.
+
+    :param offline: Indicates whether PhagesDB should not be contacted.
+    :type offline: bool
+    """
+    PHAGESDB_CACHE.offline = offline
+
+
+def request_url_data(url, ttl=None):
+    """Retrieve data from PhagesDB through the response cache.
+
+    :param url: URL for data to be retrieved.
+    :type url: str
+    :param ttl:
+        Seconds a cached response is used without revalidating it,
+        or None to use PHAGESDB_CACHE_TTL.
+    :type ttl: int
+    :returns: Data from the URL.
+    :rtype: bytes
+    """
+    return PHAGESDB_CACHE.get(url, ttl=ttl)
+
+
 def parse_phage_name(data_dict):
     """Retrieve Phage Name from PhagesDB.
 
@@ -240,9 +276,7 @@ def retrieve_genome_data(phage_url):
     :rtype: dict
     """
     try:
-        data_json = urllib.request.urlopen(phage_url)
-        data_dict = json.loads(data_json.read())
-        # TODO should data_dict.close() be called after retrieving data?
+        data_dict = json.loads(request_url_data(phage_url, ttl=0))
     except:
         data_dict = {}
     return data_dict
@@ -295,11 +329,9 @@ def get_phagesdb_data(url):
         an empty list is returned.
     :rtype: list
     """
-    data_json = urllib.request.urlopen(url)
     # Response is a bytes object that json.loads can't read without first
     # being decoded to a UTF-8 string.
-    data_dict = json.loads(data_json.read().decode("utf-8"))
-    data_json.close()
+    data_dict = json.loads(request_url_data(url, ttl=0).decode("utf-8"))
 
     # Returned dict:
     # Keys:
@@ -351,8 +383,7 @@ def retrieve_data_list(url):
     :rtype: list
     """
     try:
-        data_json = urllib.request.urlopen(url)
-        data_list = json.loads(data_json.read())
+        data_list = json.loads(request_url_data(url))
     except:
         data_list = []
     return data_list
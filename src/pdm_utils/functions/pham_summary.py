@@ -0,0 +1,414 @@
+"""Functions to maintain a cached summary of per-pham statistics.
+
+The summary is stored as a JSON file for each database, keyed by the
+database URL.  Pipelines that change pham membership, gene annotations,
+domains, or genome clusters refresh the rows of only the phams they
+touched.  The summary is rebuilt entirely if the database version, gene
+count, checksums of the summarized gene and phage data, or last
+gene_domain ID no longer match the stored values, so changes made
+outside of these pipelines are also detected.
+"""
+
+import json
+from pathlib import Path
+
+from sqlalchemy import bindparam
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from pdm_utils.functions import basic
+from pdm_utils.functions import mysqldb_basic
+
+# GLOBAL VARIABLES
+# -----------------------------------------------------------------------------
+PHAM_SUMMARY_DIR = Path.home().joinpath(".pdm_utils", "pham_summary")
+PHAM_SUMMARY_CHUNK_SIZE = 5000
+
+PHAM_QUERY = "SELECT PhamID FROM pham"
+GENOME_PHAMS_QUERY = ("SELECT DISTINCT PhamID FROM gene "
+                      "WHERE PhageID IN :values AND PhamID IS NOT NULL")
+GENE_PHAMS_QUERY = ("SELECT DISTINCT PhamID FROM gene "
+                    "WHERE GeneID IN :values AND PhamID IS NOT NULL")
+# Phams whose summaries include the data of a row, keyed by the table of
+# the row. Each query is conditioned on the primary key of the table.
+ROW_PHAMS_QUERIES = {
+    "gene": "SELECT PhamID FROM gene WHERE GeneID = :value",
+    "phage": "SELECT PhamID FROM gene WHERE PhageID = :value",
+    "pham": "SELECT PhamID FROM pham WHERE PhamID = :value",
+    "gene_domain": ("SELECT gene.PhamID FROM gene "
+                    "JOIN gene_domain ON gene.GeneID = gene_domain.GeneID "
+                    "WHERE gene_domain.ID = :value"),
+    "domain": ("SELECT gene.PhamID FROM gene "
+               "JOIN gene_domain ON gene.GeneID = gene_domain.GeneID "
+               "JOIN domain ON gene_domain.HitID = domain.HitID "
+               "WHERE domain.ID = :value")}
+# Order-independent checksums of the summarized gene and phage columns,
+# so that edits that keep the gene count are still detected.
+GENE_CHECKSUM_QUERY = ("SELECT SUM(CRC32(CONCAT_WS('|', GeneID, PhageID, "
+                       "PhamID, Notes))) FROM gene")
+PHAGE_CHECKSUM_QUERY = ("SELECT SUM(CRC32(CONCAT_WS('|', PhageID, "
+                        "Cluster))) FROM phage")
+GENE_DOMAIN_STATE_QUERY = "SELECT MAX(ID) FROM gene_domain"
+MEMBERS_QUERY = ("SELECT gene.PhamID, gene.PhageID, gene.Notes, "
+                 "phage.Cluster FROM gene "
+                 "JOIN phage ON gene.PhageID = phage.PhageID "
+                 "WHERE gene.PhamID IN :values")
+DOMAINS_QUERY = ("SELECT DISTINCT gene.PhamID, domain.Name FROM gene "
+                 "JOIN gene_domain ON gene.GeneID = gene_domain.GeneID "
+                 "JOIN domain ON gene_domain.HitID = domain.HitID "
+                 "WHERE gene.PhamID IN :values AND domain.Name IS NOT NULL")
+
+
+# SUMMARY COMPUTATION
+# -----------------------------------------------------------------------------
+def execute_chunked(engine, statement, values,
+                    chunk_size=PHAM_SUMMARY_CHUNK_SIZE):
+    """Execute a statement with an expanding IN clause over chunks of values.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param statement: SQL statement with an ':values' IN clause parameter.
+    :type statement: str
+    :param values: Values to condition the IN clause with.
+    :type values: list
+    :param chunk_size: Number of values conditioned per query.
+    :type chunk_size: int
+    :returns: Rows fetched from all chunks.
+    :rtype: list[tuple]
+    """
+    query = text(statement).bindparams(bindparam("values", expanding=True))
+
+    rows = []
+    for chunk in basic.partition_list(list(values), chunk_size):
+        if not chunk:
+            continue
+        rows.extend(engine.execute(query, values=chunk).fetchall())
+
+    return rows
+
+
+def get_genome_phams(engine, phage_ids):
+    """Get the phams that contain genes from a set of genomes.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param phage_ids: PhageIDs of the genomes.
+    :type phage_ids: list[str]
+    :returns: Set of PhamIDs.
+    :rtype: set[int]
+    """
+    rows = execute_chunked(engine, GENOME_PHAMS_QUERY, phage_ids)
+    return {row[0] for row in rows}
+
+
+def get_gene_phams(engine, geneids):
+    """Get the phams that contain a set of genes.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param geneids: GeneIDs of the genes.
+    :type geneids: list[str]
+    :returns: Set of PhamIDs.
+    :rtype: set[int]
+    """
+    rows = execute_chunked(engine, GENE_PHAMS_QUERY, geneids)
+    return {row[0] for row in rows}
+
+
+def get_row_phams(engine, table, key_value):
+    """Get the phams whose summaries include the data of a table row.
+
+    Rows of tables that are not summarized do not affect any phams.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param table: Name of the table of the row.
+    :type table: str
+    :param key_value: Primary key value of the row.
+    :type key_value: str
+    :returns: Set of PhamIDs.
+    :rtype: set[int]
+    """
+    statement = ROW_PHAMS_QUERIES.get(table)
+    if statement is None:
+        return set()
+
+    rows = engine.execute(text(statement), value=key_value).fetchall()
+    return {row[0] for row in rows if row[0] is not None}
+
+
+def compute_pham_summaries(engine, phams):
+    """Compute summary statistics for a set of phams with bulk queries.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param phams: PhamIDs to summarize.
+    :type phams: list[int]
+    :returns: Dictionary of PhamIDs mapped to summary data dictionaries.
+    :rtype: dict{int:dict}
+    """
+    summaries = {}
+    phages = {}
+    clusters = {}
+    for pham, phage_id, note, cluster in execute_chunked(engine,
+                                                         MEMBERS_QUERY,
+                                                         phams):
+        if isinstance(note, bytes):
+            note = note.decode("utf-8")
+
+        summary = summaries.get(pham)
+        if summary is None:
+            summary = {"Size": 0, "Annotations": {}, "Phages": [],
+                       "Clusters": [], "Domains": []}
+            summaries[pham] = summary
+            phages[pham] = set()
+            clusters[pham] = set()
+
+        summary["Size"] += 1
+        summary["Annotations"][note] = summary["Annotations"].get(note, 0) + 1
+        phages[pham].add(phage_id)
+        clusters[pham].add(cluster)
+
+    for pham, summary in summaries.items():
+        summary["Phages"] = sorted(phages[pham])
+        summary["Clusters"] = sorted(clusters[pham],
+                                     key=lambda cluster: (cluster is None,
+                                                          cluster))
+
+    for pham, name in execute_chunked(engine, DOMAINS_QUERY, phams):
+        summary = summaries.get(pham)
+        if summary is not None:
+            summary["Domains"].append(name)
+
+    for summary in summaries.values():
+        summary["Domains"].sort()
+
+    return summaries
+
+
+def get_distinct_annotation_count(summary):
+    """Count the distinct non-NULL annotations of a pham summary.
+
+    :param summary: Summary data dictionary for a pham.
+    :type summary: dict
+    :rtype: int
+    """
+    return len([note for note in summary["Annotations"] if note is not None])
+
+
+def get_discrepant_phams(summaries, phams):
+    """Find phams whose genes have more than one distinct annotation.
+
+    :param summaries: Dictionary of PhamIDs mapped to summary data.
+    :type summaries: dict{int:dict}
+    :param phams: PhamIDs to review.
+    :type phams: list[int]
+    :returns: List of discrepant PhamIDs, in the order of phams.
+    :rtype: list[int]
+    """
+    discrepant_phams = []
+    for pham in phams:
+        summary = summaries.get(pham)
+        if summary is None:
+            continue
+        if get_distinct_annotation_count(summary) > 1:
+            discrepant_phams.append(pham)
+
+    return discrepant_phams
+
+
+# SUMMARY CACHE
+# -----------------------------------------------------------------------------
+def get_pham_summary_path(engine, cache_dir=PHAM_SUMMARY_DIR):
+    """Get the summary cache file path for a database.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param cache_dir: Directory of pham summary cache files.
+    :type cache_dir: Path
+    :returns: Path to the pham summary cache file.
+    :rtype: Path
+    """
+    cache_key = basic.get_database_cache_key(engine)
+    return Path(cache_dir).joinpath(f"{cache_key}.json")
+
+
+def has_pham_summary(engine, cache_dir=PHAM_SUMMARY_DIR):
+    """Determine whether a database has a pham summary cache file.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param cache_dir: Directory of pham summary cache files.
+    :type cache_dir: Path
+    :rtype: bool
+    """
+    return get_pham_summary_path(engine, cache_dir=cache_dir).is_file()
+
+
+def get_database_state(engine):
+    """Get the values used to detect changes made outside of refreshes.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :returns:
+        Dictionary with the database Version, gene count, checksums of
+        the summarized gene and phage data, and the last gene_domain ID.
+    :rtype: dict
+    """
+    version_data = mysqldb_basic.get_first_row_data(engine, "version")
+    state = {"Version": version_data.get("Version"),
+             "GeneCount": mysqldb_basic.get_table_count(engine, "gene")}
+
+    for key, query in (("GeneChecksum", GENE_CHECKSUM_QUERY),
+                       ("PhageChecksum", PHAGE_CHECKSUM_QUERY),
+                       ("GeneDomainID", GENE_DOMAIN_STATE_QUERY)):
+        value = mysqldb_basic.scalar(engine, query)
+        # MySQL sums are decimals, which can not be stored as JSON.
+        state[key] = None if value is None else int(value)
+
+    return state
+
+
+def read_pham_summary(summary_path):
+    """Read a pham summary cache file.
+
+    :param summary_path: Path to the pham summary cache file.
+    :type summary_path: Path
+    :returns: Cached data with integer PhamID keys, or None if unreadable.
+    :rtype: dict
+    """
+    if not summary_path.is_file():
+        return None
+
+    try:
+        with summary_path.open() as summary_handle:
+            data = json.load(summary_handle)
+    except (OSError, ValueError):
+        return None
+
+    phams = {}
+    for pham, summary in data["phams"].items():
+        summary["Annotations"] = {note: count for note, count
+                                  in summary["Annotations"]}
+        phams[int(pham)] = summary
+    data["phams"] = phams
+    return data
+
+
+def write_pham_summary(summary_path, data):
+    """Write a pham summary cache file.
+
+    Failure to write the cache is not an error.
+
+    :param summary_path: Path to the pham summary cache file.
+    :type summary_path: Path
+    :param data: Cached data with 'state' and 'phams' keys.
+    :type data: dict
+    """
+    phams = {}
+    for pham, summary in data["phams"].items():
+        summary = dict(summary)
+        # JSON objects cannot have NULL keys, so annotations are pairs.
+        summary["Annotations"] = list(summary["Annotations"].items())
+        phams[str(pham)] = summary
+
+    summary = json.dumps({"state": data["state"], "phams": phams})
+    try:
+        basic.write_file_atomic(summary_path, summary.encode("utf-8"))
+    except OSError:
+        pass
+
+
+def build_pham_summary(engine, cache_dir=PHAM_SUMMARY_DIR):
+    """Compute and cache the summaries of all phams in a database.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param cache_dir: Directory of pham summary cache files.
+    :type cache_dir: Path
+    :returns: Dictionary of PhamIDs mapped to summary data dictionaries.
+    :rtype: dict{int:dict}
+    """
+    state = get_database_state(engine)
+    phams = [row[0] for row in engine.execute(PHAM_QUERY).fetchall()]
+    summaries = compute_pham_summaries(engine, phams)
+
+    write_pham_summary(get_pham_summary_path(engine, cache_dir=cache_dir),
+                       {"state": state, "phams": summaries})
+    return summaries
+
+
+def load_pham_summary(engine, cache_dir=PHAM_SUMMARY_DIR):
+    """Load cached pham summaries, rebuilding them if they are outdated.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param cache_dir: Directory of pham summary cache files.
+    :type cache_dir: Path
+    :returns: Dictionary of PhamIDs mapped to summary data dictionaries.
+    :rtype: dict{int:dict}
+    """
+    data = read_pham_summary(get_pham_summary_path(engine,
+                                                   cache_dir=cache_dir))
+    if data is not None and data["state"] == get_database_state(engine):
+        return data["phams"]
+
+    return build_pham_summary(engine, cache_dir=cache_dir)
+
+
+def remove_pham_summary(engine, cache_dir=PHAM_SUMMARY_DIR):
+    """Remove the pham summary cache file of a database.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param cache_dir: Directory of pham summary cache files.
+    :type cache_dir: Path
+    """
+    summary_path = get_pham_summary_path(engine, cache_dir=cache_dir)
+    if summary_path.is_file():
+        summary_path.unlink()
+
+
+def refresh_pham_summary(engine, phams, previous_state=None,
+                         cache_dir=PHAM_SUMMARY_DIR):
+    """Recompute the cached summaries of phams changed by a pipeline.
+
+    Nothing is done if the database does not have a summary cache yet,
+    since the full summary is built the first time it is loaded.  The
+    cache is removed instead if it was already outdated before the
+    pipeline made its changes.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param phams: PhamIDs whose members or annotations changed.
+    :type phams: set[int]
+    :param previous_state: Database state from before the changes were made.
+    :type previous_state: dict
+    :param cache_dir: Directory of pham summary cache files.
+    :type cache_dir: Path
+    """
+    summary_path = get_pham_summary_path(engine, cache_dir=cache_dir)
+    data = read_pham_summary(summary_path)
+    if data is None:
+        return
+
+    if previous_state is not None and data["state"] != previous_state:
+        summary_path.unlink()
+        return
+
+    try:
+        summaries = compute_pham_summaries(engine, phams)
+        state = get_database_state(engine)
+    except SQLAlchemyError:
+        summary_path.unlink()
+        return
+
+    for pham in phams:
+        summary = summaries.get(pham)
+        if summary is None:
+            data["phams"].pop(pham, None)
+        else:
+            data["phams"][pham] = summary
+
+    data["state"] = state
+    write_pham_summary(summary_path, data)
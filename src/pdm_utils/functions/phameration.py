@@ -459,6 +459,27 @@ def preserve_phams(old_phams, new_phams, old_colors, new_genes):
 
 
 # MMSEQS2 CLUSTERING FUNCTIONS
+def get_changed_phams(old_phams, new_phams):
+    """
+    Finds phams whose members differ between two phameration runs.
+    :param old_phams: pham data from before phameration
+    :type old_phams: dict
+    :param new_phams: pham data from after phameration
+    :type new_phams: dict
+    :return: changed_phams
+    """
+    changed_phams = set()
+    for key in new_phams.keys():
+        if set(new_phams[key]) != set(old_phams.get(key, [])):
+            changed_phams.add(key)
+
+    for key in old_phams.keys():
+        if key not in new_phams:
+            changed_phams.add(key)
+
+    return changed_phams
+
+
 def mmseqs_createdb(fasta, sequence_db):
     """
     Runs 'mmseqs createdb' to convert a FASTA file into an MMseqs2
@@ -7,6 +7,8 @@ from pathlib import Path
 from pdm_utils.classes.alchemyhandler import AlchemyHandler
 from pdm_utils.classes.filter import Filter
 from pdm_utils.functions import basic
+from pdm_utils.functions import fileio
+from pdm_utils.functions import mysqldb_basic
 
 
 # PIPELINE OUTPUT HANDLING
@@ -101,6 +103,13 @@ def _(value_list_input):
 
 # MYSQL FILTERS AND HANDLER FUNCTIONS
 def build_alchemist(database, ask_database=True, config=None, dialect="mysql"):
+    # SQLite snapshot files are opened in-process, without credentials.
+    if is_sqlite_database(database):
+        alchemist = AlchemyHandler(database=str(Path(database)),
+                                   dialect="sqlite")
+        alchemist.connect(pipeline=True)
+        return alchemist
+
     if config is not None:
         username = config["mysql"].get("user")
         password = config["mysql"].get("password")
@@ -120,6 +129,42 @@ def build_alchemist(database, ask_database=True, config=None, dialect="mysql"):
     return alchemist
 
 
+def is_sqlite_database(database):
+    """Determine whether a database argument names a SQLite snapshot file.
+
+    :param database: Name of a MySQL database or path to a SQLite file.
+    :type database: str
+    :returns: Whether the database is an existing SQLite snapshot file.
+    :rtype: bool
+    """
+    if database is None:
+        return False
+
+    database_path = Path(database)
+    return (database_path.suffix == fileio.SQLITE_SUFFIX and
+            database_path.is_file())
+
+
+def check_snapshot_version(snapshot, alchemist):
+    """Exit if a columnar snapshot does not have the database version.
+
+    Snapshot and database data can otherwise be mixed without warning.
+
+    :param snapshot: Columnar snapshot loaded with load_columnar_snapshot().
+    :type snapshot: dict
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    """
+    snapshot_version = snapshot["version"].get("Version")
+    version_data = mysqldb_basic.get_first_row_data(alchemist.engine,
+                                                    "version")
+    if snapshot_version != version_data.get("Version"):
+        print(f"Columnar snapshot version {snapshot_version} does not "
+              f"match version {version_data.get('Version')} "
+              f"of database {alchemist.database}.")
+        sys.exit(1)
+
+
 def build_filter(alchemist, key, filters, values=None, verbose=False):
     """Applies MySQL WHERE clause filters using a Filter.
 
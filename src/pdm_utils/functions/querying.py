@@ -1,9 +1,12 @@
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
 
 from networkx import Graph
 from networkx import shortest_path
 from sqlalchemy import and_
 from sqlalchemy import Column
+from sqlalchemy import Index
 from sqlalchemy import join
 from sqlalchemy import MetaData
 from sqlalchemy import select
@@ -26,6 +29,10 @@ from pdm_utils.functions import parsing
 COLUMN_TYPES = [Column, Table, functions.count, BinaryExpression,
                 UnaryExpression, Label, DeclarativeMeta, Grouping]
 
+# Value lists longer than this are loaded into a temporary table and
+# joined against, rather than split into many IN clause queries.
+TEMP_TABLE_THRESHOLD = 50000
+
 
 # SQLALCHEMY OBJECT RETRIEVAL
 # Functions that functionalize retrieval of SqlAlchemy objects.
@@ -117,12 +124,94 @@ def build_fromclause(db_graph, columns):
     :rtype: Table
     """
     table_list = get_table_list(columns)
-    table_pathing = get_table_pathing(db_graph, table_list)
-    joined_table = join_pathed_tables(db_graph, table_pathing)
+
+    # Join paths only depend on the graph and the ordered set of tables.
+    fromclause_cache = get_query_cache(db_graph, "fromclause")
+    cache_key = tuple(table_list)
+    joined_table = fromclause_cache.get(cache_key)
+    if joined_table is None:
+        table_pathing = get_table_pathing(db_graph, table_list)
+        joined_table = join_pathed_tables(db_graph, table_pathing)
+        fromclause_cache[cache_key] = joined_table
 
     return joined_table
 
 
+def get_query_cache(db_graph, cache_name):
+    """Get a named cache dictionary stored with a NetworkX Graph object.
+
+    Cached query structures are stored in the graph attribute dictionary,
+    so they are discarded along with the graph they were derived from.
+
+    :param db_graph: SQLAlchemy structured NetworkX Graph object.
+    :type db_graph: Graph
+    :param cache_name: Name of the cache to retrieve.
+    :type cache_name: str
+    :returns: Dictionary storing cached query structures.
+    :rtype: dict
+    """
+    query_caches = db_graph.graph.setdefault("query_cache", {})
+    return query_caches.setdefault(cache_name, {})
+
+
+def build_select_template(db_graph, columns, fromclause, template_name):
+    """Get a cached SELECT SQLAlchemy executable for columns and a FROM clause.
+
+    Statements selecting expressions other than plain Column objects are
+    not cached, since those expressions are rebuilt by each caller.
+
+    :param db_graph: SQLAlchemy structured NetworkX Graph object.
+    :type db_graph: Graph
+    :param columns: SQLAlchemy Column object(s) to select.
+    :type columns: list
+    :param fromclause: SQLAlchemy Table or Join object to select from.
+    :type fromclause: Table
+    :param template_name: Name of the statement template cache.
+    :type template_name: str
+    :returns: MySQL SELECT expression-related SQLAlchemy executable.
+    :rtype: Select
+    """
+    cacheable = True
+    for column in columns:
+        if not isinstance(column, Column):
+            cacheable = False
+            break
+
+    if not cacheable:
+        return select_columns(columns, fromclause, template_name)
+
+    template_cache = get_query_cache(db_graph, template_name)
+    cache_key = (tuple(columns), fromclause)
+    template = template_cache.get(cache_key)
+    if template is None:
+        template = select_columns(columns, fromclause, template_name)
+        template_cache[cache_key] = template
+
+    return template
+
+
+def select_columns(columns, fromclause, template_name):
+    """Get a SELECT SQLAlchemy executable for a statement template type.
+
+    :param columns: SQLAlchemy Column object(s) to select.
+    :type columns: list
+    :param fromclause: SQLAlchemy Table or Join object to select from.
+    :type fromclause: Table
+    :param template_name: Statement template type, 'select' or 'count'.
+    :type template_name: str
+    :returns: MySQL SELECT expression-related SQLAlchemy executable.
+    :rtype: Select
+    """
+    if template_name == "count":
+        # Converts SQLAlchemy Columns into SQLAlchemy COUNT-related objects
+        column_params = []
+        for column_param in columns:
+            column_params.append(func.count(column_param))
+        columns = column_params
+
+    return select(columns).select_from(fromclause)
+
+
 def build_onclause(db_graph, source_table, adjacent_table):
     """Creates a SQLAlchemy BinaryExpression object for a MySQL ON clause
        expression
@@ -461,7 +550,8 @@ def build_select(db_graph, columns, where=None, order_by=None, add_in=None,
                      + add_in_columns + having_columns + group_by_columns)
     fromclause = build_fromclause(db_graph, total_columns)
 
-    select_query = select(columns).select_from(fromclause)
+    select_query = build_select_template(db_graph, columns, fromclause,
+                                         "select")
     select_query = append_group_by_clauses(select_query, group_by)
     select_query = append_order_by_clauses(select_query, order_by)
     select_query = append_where_clauses(select_query, where)
@@ -496,12 +586,9 @@ def build_count(db_graph, columns, where=None, add_in=None):
     # Gathers all the tables from the SELECT, WHERE, and ORDER BY clauses
     total_columns = columns + where_columns + add_in_columns
     fromclause = build_fromclause(db_graph, total_columns)
-    # Converts SQLAlchemy Columns into SQLAlchemy COUNT-related objects
-    column_params = []
-    for column_param in columns:
-        column_params.append(func.count(column_param))
 
-    count_query = select(column_params).select_from(fromclause)
+    count_query = build_select_template(db_graph, columns, fromclause,
+                                        "count")
     count_query = append_where_clauses(count_query, where)
 
     return count_query
@@ -628,7 +715,7 @@ def append_group_by_clauses(executable, group_by_clauses):
 # Functions that execute SqlAlchemy select statements and handle outputs.
 # -----------------------------------------------------------------------------
 def execute(engine, executable, in_column=None, values=[], limit=8000,
-            return_dict=True):
+            return_dict=True, threads=1):
     """Use SQLAlchemy Engine to execute a MySQL query.
 
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -638,6 +725,8 @@ def execute(engine, executable, in_column=None, values=[], limit=8000,
     :type executable: str
     :param return_dict: Toggle whether execute returns dict or tuple.
     :type return_dict: Boolean
+    :param threads: Number of value chunk queries to run concurrently.
+    :type threads: int
     :returns: Results from execution of given MySQL query.
     :rtype: list[dict]
     :rtype: list[tuple]
@@ -650,7 +739,7 @@ def execute(engine, executable, in_column=None, values=[], limit=8000,
         results = execute_value_subqueries(engine, executable,
                                            in_column, values,
                                            return_dict=return_dict,
-                                           limit=limit)
+                                           limit=limit, threads=threads)
 
     else:
         proxy = engine.execute(executable)
@@ -667,7 +756,8 @@ def execute(engine, executable, in_column=None, values=[], limit=8000,
     return results
 
 
-def first_column(engine, executable, in_column=None, values=[], limit=8000):
+def first_column(engine, executable, in_column=None, values=[], limit=8000,
+                 threads=1):
     """Use SQLAlchemy Engine to execute and return the first column of fields.
 
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -675,6 +765,8 @@ def first_column(engine, executable, in_column=None, values=[], limit=8000):
     :param executable: Input an executable MySQL query.
     :type executable: Select
     :type executable: str
+    :param threads: Number of value chunk queries to run concurrently.
+    :type threads: int
     :returns: A column for a set of MySQL values.
     :rtype: list[str]
     """
@@ -685,7 +777,7 @@ def first_column(engine, executable, in_column=None, values=[], limit=8000):
 
         values = first_column_value_subqueries(engine, executable,
                                                in_column, values,
-                                               limit=limit)
+                                               limit=limit, threads=threads)
     else:
         proxy = engine.execute(executable)
         results = proxy.fetchall()
@@ -697,8 +789,69 @@ def first_column(engine, executable, in_column=None, values=[], limit=8000):
     return values
 
 
+def iter_rows(engine, executable, in_column=None, values=None,
+              chunk_size=1000, limit=8000, return_dict=True):
+    """Use SQLAlchemy Engine to execute a MySQL query and yield its rows.
+
+    Rows are streamed with a server-side cursor and fetched in chunks,
+    so the full result set is never held in memory.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :type executable: str
+    :param in_column: SQLAlchemy Column object.
+    :type in_column: Column
+    :param values: Values from specified MySQL column.
+    :type values: list
+    :param chunk_size: Number of rows fetched from the cursor at a time.
+    :type chunk_size: int
+    :param limit: SQLAlchemy IN clause query length limiter.
+    :type limit: int
+    :param return_dict: Toggle whether rows are yielded as dicts or tuples.
+    :type return_dict: Boolean
+    :returns: Generator of results from execution of given MySQL query.
+    :rtype: Generator[dict]
+    :rtype: Generator[tuple]
+    """
+    if values:
+        if not isinstance(in_column, Column):
+            raise ValueError("Column input is required to condition "
+                             "SQLAlchemy select for a set of values.")
+
+        if in_column.type.python_type == bytes:
+            values = basic.convert_to_encoded(values)
+
+        executables = []
+        for value_chunk in basic.partition_list(values, limit):
+            executables.append(executable.where(in_column.in_(value_chunk)))
+    else:
+        executables = [executable]
+
+    with engine.connect() as connection:
+        connection = connection.execution_options(stream_results=True)
+
+        for subquery in executables:
+            proxy = connection.execute(subquery)
+            try:
+                while True:
+                    results = proxy.fetchmany(chunk_size)
+                    if not results:
+                        break
+
+                    for result in results:
+                        if return_dict:
+                            result = dict(result)
+
+                        yield result
+            finally:
+                proxy.close()
+
+
 def execute_value_subqueries(engine, executable, in_column, source_values,
-                             return_dict=True, limit=8000):
+                             return_dict=True, limit=8000,
+                             temp_table_threshold=None, threads=1):
     """Query with a conditional on a set of values using subqueries.
 
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -714,6 +867,11 @@ def execute_value_subqueries(engine, executable, in_column, source_values,
     :type return_dict: Boolean
     :param limit: SQLAlchemy IN clause query length limiter.
     :type limit: int
+    :param temp_table_threshold: Value count above which a temporary table
+                                 is joined against instead of IN clauses.
+    :type temp_table_threshold: int
+    :param threads: Number of value chunk queries to run concurrently.
+    :type threads: int
     :returns: List of grouped data for each value constraint.
     :rtype: list
     """
@@ -731,14 +889,20 @@ def execute_value_subqueries(engine, executable, in_column, source_values,
     if in_column.type.python_type == bytes:
         source_values = basic.convert_to_encoded(source_values)
 
-    chunked_values = basic.partition_list(source_values, limit)
+    if temp_table_threshold is None:
+        temp_table_threshold = TEMP_TABLE_THRESHOLD
 
-    for value_chunk in chunked_values:
-        subquery = executable.where(in_column.in_(value_chunk))
-
-        proxy = engine.execute(subquery)
-        results = proxy.fetchall()
+    if len(source_values) > temp_table_threshold:
+        results = execute_temp_table_subquery(engine, executable, in_column,
+                                              source_values, limit=limit)
+        chunked_results = [results]
+    else:
+        chunked_results = execute_in_clause_subqueries(
+                                            engine, executable, in_column,
+                                            source_values, limit=limit,
+                                            threads=threads)
 
+    for results in chunked_results:
         for result in results:
             if return_dict:
                 result = dict(result)
@@ -749,7 +913,8 @@ def execute_value_subqueries(engine, executable, in_column, source_values,
 
 
 def first_column_value_subqueries(engine, executable, in_column, source_values,
-                                  limit=8000):
+                                  limit=8000, temp_table_threshold=None,
+                                  threads=1):
     """Query with a conditional on a set of values using subqueries.
 
     :param engine: SQLAlchemy Engine object used for executing queries.
@@ -765,6 +930,11 @@ def first_column_value_subqueries(engine, executable, in_column, source_values,
     :type return_dict: Boolean
     :param limit: SQLAlchemy IN clause query length limiter.
     :type limit: int
+    :param temp_table_threshold: Value count above which a temporary table
+                                 is joined against instead of IN clauses.
+    :type temp_table_threshold: int
+    :param threads: Number of value chunk queries to run concurrently.
+    :type threads: int
     :returns: Distinct values fetched from value constraints.
     :rtype: list
     """
@@ -782,14 +952,20 @@ def first_column_value_subqueries(engine, executable, in_column, source_values,
     if in_column.type.python_type == bytes:
         source_values = basic.convert_to_encoded(source_values)
 
-    chunked_values = basic.partition_list(source_values, limit)
-
-    for value_chunk in chunked_values:
-        subquery = executable.where(in_column.in_(value_chunk))
+    if temp_table_threshold is None:
+        temp_table_threshold = TEMP_TABLE_THRESHOLD
 
-        proxy = engine.execute(subquery)
-        results = proxy.fetchall()
+    if len(source_values) > temp_table_threshold:
+        results = execute_temp_table_subquery(engine, executable, in_column,
+                                              source_values, limit=limit)
+        chunked_results = [results]
+    else:
+        chunked_results = execute_in_clause_subqueries(
+                                            engine, executable, in_column,
+                                            source_values, limit=limit,
+                                            threads=threads)
 
+    for results in chunked_results:
         for result in results:
             values.append(result[0])
 
@@ -797,6 +973,112 @@ def first_column_value_subqueries(engine, executable, in_column, source_values,
     return values
 
 
+def execute_in_clause_subqueries(engine, executable, in_column,
+                                 source_values, limit=8000, threads=1):
+    """Query with a conditional on chunks of values using IN clauses.
+
+    With more than one thread, chunk queries are run concurrently, each on
+    its own connection checked out from the engine's connection pool.
+    The number of threads should not exceed the size of that pool.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :param in_column: SQLAlchemy Column object.
+    :type in_column: Column
+    :param source_values: Values from specified MySQL column.
+    :type source_values: list
+    :param limit: SQLAlchemy IN clause query length limiter.
+    :type limit: int
+    :param threads: Number of chunk queries to run concurrently.
+    :type threads: int
+    :returns: List of result rows for each chunk of values.
+    :rtype: list[list[RowProxy]]
+    """
+    chunked_values = basic.partition_list(source_values, limit)
+
+    subqueries = []
+    for value_chunk in chunked_values:
+        subqueries.append(executable.where(in_column.in_(value_chunk)))
+
+    threads = min(threads, len(subqueries))
+    if threads <= 1:
+        chunked_results = []
+        for subquery in subqueries:
+            chunked_results.append(fetch_all(engine, subquery))
+    else:
+        # map() returns results in submission order, matching the chunks.
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            engines = [engine] * len(subqueries)
+            chunked_results = list(executor.map(fetch_all, engines,
+                                                subqueries))
+
+    return chunked_results
+
+
+def fetch_all(engine, executable):
+    """Execute a query and fetch all of its result rows.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :returns: Result rows from the query.
+    :rtype: list[RowProxy]
+    """
+    proxy = engine.execute(executable)
+    return proxy.fetchall()
+
+
+def execute_temp_table_subquery(engine, executable, in_column, source_values,
+                                limit=8000):
+    """Query with a conditional on values loaded into a temporary table.
+
+    The values are bulk-inserted into a session-scoped temporary table
+    that the query is then conditioned against in a single execution.
+
+    :param engine: SQLAlchemy Engine object used for executing queries.
+    :type engine: Engine
+    :param executable: Input a executable MySQL query.
+    :type executable: Select
+    :param in_column: SQLAlchemy Column object.
+    :type in_column: Column
+    :param source_values: Values from specified MySQL column.
+    :type source_values: list
+    :param limit: Number of values inserted into the table per statement.
+    :type limit: int
+    :returns: Result rows from the conditioned query.
+    :rtype: list[RowProxy]
+    """
+    temp_table_name = f"pdm_utils_values_{uuid4().hex[:16]}"
+    value_column = Column("value", in_column.type)
+
+    table_args = []
+    # Indexes on BLOB and TEXT columns require a prefix length.
+    if in_column.type.python_type != bytes:
+        table_args.append(Index(f"{temp_table_name}_index", "value"))
+
+    temp_table = Table(temp_table_name, MetaData(), value_column,
+                       *table_args, prefixes=["TEMPORARY"])
+
+    # Temporary tables are only visible to the connection that created them.
+    with engine.connect() as connection:
+        temp_table.create(connection)
+        try:
+            for value_chunk in basic.partition_list(source_values, limit):
+                connection.execute(temp_table.insert(),
+                                   [{"value": value} for value in value_chunk])
+
+            subquery = executable.where(in_column.in_(
+                                            select([temp_table.c.value])))
+            results = connection.execute(subquery).fetchall()
+        finally:
+            temp_table.drop(connection)
+
+    return results
+
+
 def query(session, db_graph, table_map, where=None):
     """Use SQLAlchemy session to retrieve ORM objects from a mapped object.
 
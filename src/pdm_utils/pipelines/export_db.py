@@ -6,8 +6,8 @@ import time
 from pathlib import Path
 
 from pdm_utils.classes.filter import Filter
-from pdm_utils.functions import (configfile, fileio, flat_files, mysqldb,
-                                 mysqldb_basic, pham_alignment,
+from pdm_utils.functions import (columnar, configfile, fileio, flat_files,
+                                 mysqldb, mysqldb_basic, pham_alignment,
                                  pipelines_basic, querying)
 
 
@@ -36,7 +36,7 @@ TMRNA_QUERY = "SELECT * FROM tmrna"
 BIOPYTHON_PIPELINES = ["gb", "fasta", "clustal", "fasta-2line", "nexus",
                        "phylip", "pir", "stockholm", "tab"]
 FILTERABLE_PIPELINES = BIOPYTHON_PIPELINES + ["csv", "tbl"]
-PIPELINES = FILTERABLE_PIPELINES + ["sql"]
+PIPELINES = FILTERABLE_PIPELINES + ["sql", "sqlite", "npy"]
 FLAT_FILE_TABLES = ["phage", "gene"]
 FIVE_COLUMN_TABLES = ["phage"]
 
@@ -75,7 +75,7 @@ def main(unparsed_args_list):
     alchemist = pipelines_basic.build_alchemist(args.database, config=config)
 
     # Exporting as a SQL file is not constricted by schema version.
-    if args.pipeline != "sql":
+    if args.pipeline not in ["sql", "sqlite", "npy"]:
         mysqldb.check_schema_compatibility(alchemist.engine, "export")
 
     values = None
@@ -99,7 +99,8 @@ def main(unparsed_args_list):
                        raw_bytes=args.raw_bytes,
                        concatenate=args.concatenate, db_name=args.db_name,
                        verbose=args.verbose, dump=args.dump, force=args.force,
-                       threads=args.number_processes, phams_out=args.phams_out)
+                       threads=args.number_processes, phams_out=args.phams_out,
+                       compression=args.compress)
     else:
         pass
 
@@ -115,9 +116,15 @@ def parse_export(unparsed_args_list):
         Select a export pipeline option to export database data.
             Select csv to export data from a table into a .csv file.
             Select sql to dump the current database into a .sql file.
+            Select sqlite to write the current database to a SQLite file.
+            Select npy to write gene, phage, and pham columns to a
+            memory-mappable directory of NumPy files.
             Select a formatted file option to export individual entries.
         """
-    DATABASE_HELP = "Name of the MySQL database to export from."
+    DATABASE_HELP = """
+        Name of the MySQL database, or path to a SQLite snapshot file,
+        to export from.
+        """
 
     CONFIG_FILE_HELP = """
         Export option that enables use of a config file for sourcing
@@ -203,6 +210,10 @@ def parse_export(unparsed_args_list):
             Follow selection argument with formatted column expressions:
                 {Table}.{Column}={Value}
         """
+    COMPRESS_HELP = """
+        Export option that compresses exported files while they are written.
+            Follow selection argument with a compression format.
+        """
     RAW_BYTES_HELP = """
         Csv export option to conserve blob and encoded data from the database
         when exporting to a csv file.
@@ -227,10 +238,14 @@ def parse_export(unparsed_args_list):
     tbl_parser = subparsers.add_parser("tbl")
     csv_parser = subparsers.add_parser("csv")
     sql_parser = subparsers.add_parser("sql")
+    sqlite_parser = subparsers.add_parser("sqlite")
+    npy_parser = subparsers.add_parser("npy")
 
     subparser_list.append(tbl_parser)
     subparser_list.append(csv_parser)
     subparser_list.append(sql_parser)
+    subparser_list.append(sqlite_parser)
+    subparser_list.append(npy_parser)
 
     filterable_parsers.append(tbl_parser)
     filterable_parsers.append(csv_parser)
@@ -250,6 +265,8 @@ def parse_export(unparsed_args_list):
         subparser.add_argument("-f", "--force", action="store_true",
                                help=FORCE_HELP)
         subparser.add_argument("-np", "--number_processes", type=int)
+        subparser.add_argument("-z", "--compress", help=COMPRESS_HELP,
+                               choices=fileio.COMPRESSION_FORMATS)
 
     for subparser in filterable_parsers:
         table_choices = dict.fromkeys(BIOPYTHON_PIPELINES, FLAT_FILE_TABLES)
@@ -292,6 +309,10 @@ def parse_export(unparsed_args_list):
     sql_parser.add_argument("-n", "--db_name", type=str, help=DB_NAME_HELP)
     sql_parser.add_argument("-pho", "--phams_out", action="store_true")
 
+    sqlite_parser.add_argument("-n", "--db_name", type=str,
+                               help=DB_NAME_HELP)
+    npy_parser.add_argument("-n", "--db_name", type=str, help=DB_NAME_HELP)
+
     for subparser in subparser_list:
         subparser.set_defaults(
                         folder_name=DEFAULT_FOLDER_NAME, folder_path=None,
@@ -300,7 +321,7 @@ def parse_export(unparsed_args_list):
                         include_columns=[], exclude_columns=[],
                         sequence_columns=False, concatenate=False,
                         raw_bytes=False, db_name=None, phams_out=False,
-                        number_processes=1)
+                        number_processes=1, compress=None)
 
     parsed_args = parser.parse_args(unparsed_args_list[2:])
 
@@ -312,7 +333,8 @@ def execute_export(alchemist, pipeline, folder_path=None,
                    dump=False, force=False, table=DEFAULT_TABLE, filters="",
                    groups=[], sort=[], include_columns=[], exclude_columns=[],
                    sequence_columns=False, raw_bytes=False, concatenate=False,
-                   db_name=None, phams_out=False, threads=1):
+                   db_name=None, phams_out=False, threads=1,
+                   compression=None):
     """Executes the entirety of the file export pipeline.
 
     :param alchemist: A connected and fully built AlchemyHandler object.
@@ -349,6 +371,8 @@ def execute_export(alchemist, pipeline, folder_path=None,
     :type concaternate: bool
     :param threads: Number of processes/threads to spawn during the pipeline
     :type threads: int
+    :param compression: Compression format name for exported files.
+    :type compression: str
     """
     if verbose:
         print("Retrieving database version...")
@@ -379,7 +403,14 @@ def execute_export(alchemist, pipeline, folder_path=None,
         execute_sql_export(alchemist, export_path, folder_path, db_version,
                            db_name=db_name, dump=dump, force=force,
                            phams_out=phams_out, threads=threads,
-                           verbose=verbose)
+                           compression=compression, verbose=verbose)
+    elif pipeline == "sqlite":
+        execute_sqlite_export(alchemist, export_path, db_name=db_name,
+                              dump=dump, force=force,
+                              compression=compression, verbose=verbose)
+    elif pipeline == "npy":
+        execute_columnar_export(alchemist, export_path, db_name=db_name,
+                                dump=dump, force=force, verbose=verbose)
     elif pipeline in FILTERABLE_PIPELINES:
         conditionals_map = pipelines_basic.build_groups_map(
                                                 db_filter, export_path,
@@ -420,11 +451,13 @@ def execute_export(alchemist, pipeline, folder_path=None,
                                    table, concatenate=concatenate,
                                    data_cache=data_cache,
                                    export_name=export_name, threads=threads,
+                                   compression=compression,
                                    verbose=verbose, dump=dump)
             elif pipeline == "csv":
                 execute_csv_export(db_filter, mapped_path, export_path,
                                    csv_columns, table, raw_bytes=raw_bytes,
                                    data_cache=data_cache,
+                                   compression=compression, threads=threads,
                                    verbose=verbose, dump=dump)
     else:
         print("Unrecognized export pipeline, aborting export")
@@ -433,7 +466,8 @@ def execute_export(alchemist, pipeline, folder_path=None,
 
 def execute_csv_export(db_filter, export_path, folder_path, columns, csv_name,
                        data_cache=None, sort=[], raw_bytes=False,
-                       verbose=False, dump=False):
+                       compression=None, threads=1, verbose=False,
+                       dump=False):
     """Executes csv export of a MySQL database table with select columns.
 
     :param db_filter: A connected and fully built Filter object.
@@ -450,6 +484,10 @@ def execute_csv_export(db_filter, export_path, folder_path, columns, csv_name,
     :type sort: list[Column]
     :param values: List of values to fitler database results.
     :type values: list[str]
+    :param compression: Compression format name.
+    :type compression: str
+    :param threads: Number of threads to compress data with.
+    :type threads: int
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
     :param dump: A boolean value to toggle dump in current working dir.
@@ -486,13 +524,14 @@ def execute_csv_export(db_filter, export_path, folder_path, columns, csv_name,
 
         file_path = export_path.joinpath(f"{csv_name}.csv")
         fileio.export_data_dict(results, file_path, headers,
-                                include_headers=True)
+                                include_headers=True, compression=compression,
+                                threads=threads)
 
 
 def execute_ffx_export(alchemist, export_path, folder_path, values,
                        file_format, db_version, table, concatenate=False,
                        data_cache=None, verbose=False, dump=False,
-                       threads=1, export_name=None):
+                       threads=1, export_name=None, compression=None):
     """Executes SeqRecord export of the compilation of data from a MySQL entry.
 
     :param alchemist: A connected and fully build AlchemyHandler object.
@@ -515,6 +554,8 @@ def execute_ffx_export(alchemist, export_path, folder_path, values,
     :type sort: list[Column]
     :param concatenate: A boolean to toggle concatenation of SeqRecords.
     :type concaternate: bool
+    :param compression: Compression format name.
+    :type compression: str
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
     """
@@ -527,7 +568,18 @@ def execute_ffx_export(alchemist, export_path, folder_path, values,
     if verbose:
         print(f"Retrieving {export_name} data...")
 
-    if table == "phage":
+    if table == "phage" and file_format != "tbl" and threads > 1:
+        genome_data = get_genome_data(alchemist, values,
+                                      data_cache=data_cache, verbose=verbose)
+        genome_data = [data + [db_version] for data in genome_data]
+
+        fileio.write_seqrecords_from_data(
+                            genome_data, build_genome_seqrecord, file_format,
+                            export_path, export_name=export_name,
+                            concatenate=concatenate, compression=compression,
+                            processes=threads, verbose=verbose)
+        return
+    elif table == "phage":
         seqrecords = get_genome_seqrecords(alchemist, values,
                                            data_cache=data_cache,
                                            verbose=verbose)
@@ -540,7 +592,8 @@ def execute_ffx_export(alchemist, export_path, folder_path, values,
         sys.exit(1)
 
     if file_format == "tbl":
-        fileio.write_feature_table(seqrecords, export_path, verbose=verbose)
+        fileio.write_feature_table(seqrecords, export_path,
+                                   compression=compression, verbose=verbose)
     else:
         if verbose:
             print("Appending database version...")
@@ -548,12 +601,13 @@ def execute_ffx_export(alchemist, export_path, folder_path, values,
             append_database_version(record, db_version)
         fileio.write_seqrecords(seqrecords, file_format, export_path,
                                 export_name=export_name, verbose=verbose,
-                                concatenate=concatenate, threads=threads)
+                                concatenate=concatenate,
+                                compression=compression, threads=threads)
 
 
 def execute_sql_export(alchemist, export_path, folder_path, db_version,
                        db_name=None, dump=False, force=False, phams_out=False,
-                       threads=1, verbose=False):
+                       threads=1, compression=None, verbose=False):
     pipelines_basic.create_working_dir(export_path, dump=dump, force=force)
 
     if phams_out:
@@ -587,8 +641,68 @@ def execute_sql_export(alchemist, export_path, folder_path, db_version,
     if verbose:
         print("Writing SQL database file...")
 
-    fileio.write_database(alchemist, db_version["Version"], export_path,
-                          db_name=db_name)
+    try:
+        fileio.write_database(alchemist, db_version["Version"], export_path,
+                              db_name=db_name, compression=compression,
+                              threads=threads, verbose=verbose)
+    except OSError as error:
+        print("Unable to write SQL database file.")
+        print(error)
+        sys.exit(1)
+
+
+def execute_sqlite_export(alchemist, export_path, db_name=None, dump=False,
+                          force=False, compression=None, verbose=False):
+    """Executes SQLite snapshot export of a database.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param export_path: Path to a dir for file creation.
+    :type export_path: Path
+    :param db_name: Name of the exported snapshot file.
+    :type db_name: str
+    :param dump: A boolean value to toggle dump in current working dir.
+    :type dump: bool
+    :param force: A boolean to toggle aggresive building of directories.
+    :type force: bool
+    :param compression: Compression format name for the snapshot file.
+    :type compression: str
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    """
+    pipelines_basic.create_working_dir(export_path, dump=dump, force=force)
+
+    if verbose:
+        print("Writing SQLite database file...")
+
+    fileio.write_sqlite_database(alchemist, export_path, db_name=db_name,
+                                 compression=compression, verbose=verbose)
+
+
+def execute_columnar_export(alchemist, export_path, db_name=None, dump=False,
+                            force=False, verbose=False):
+    """Executes columnar NumPy snapshot export of a database.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param export_path: Path to a dir for file creation.
+    :type export_path: Path
+    :param db_name: Name of the exported snapshot directory.
+    :type db_name: str
+    :param dump: A boolean value to toggle dump in current working dir.
+    :type dump: bool
+    :param force: A boolean to toggle aggresive building of directories.
+    :type force: bool
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    """
+    pipelines_basic.create_working_dir(export_path, dump=dump, force=force)
+
+    if verbose:
+        print("Writing columnar snapshot files...")
+
+    columnar.write_columnar_snapshot(alchemist, export_path, db_name=db_name,
+                                     verbose=verbose)
 
 
 # EXPORT-SPECIFIC HELPER FUNCTIONS
@@ -613,6 +727,112 @@ def get_genome_seqrecords(alchemist, values, data_cache=None, verbose=False):
     return seqrecords
 
 
+def get_genome_data(alchemist, values, data_cache=None, verbose=False):
+    """Retrieves the compact table data needed to build genome SeqRecords.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param values: List of PhageIDs to retrieve data for.
+    :type values: list[str]
+    :param data_cache: Data retrieved for earlier groups of the export.
+    :type data_cache: dict
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :returns: List of [phage, gene, trna, tmrna] table data lists per genome.
+    :rtype: list[list]
+    """
+    if data_cache is None:
+        data_cache = {}
+
+    if verbose:
+        print("...Retrieving genome table data...")
+
+    # Genomes can be exported in several groups, e.g. when grouped by pham,
+    # so their table data is cached like the Genome objects of the
+    # serial path, under keys that can not collide with those.
+    query_values = [genome_id for genome_id in values
+                    if ("genome_data", genome_id) not in data_cache]
+
+    feature_data = {GENE_QUERY: {}, TRNA_QUERY: {}, TMRNA_QUERY: {}}
+    phage_data = {}
+    # An empty id_list would retrieve every row of the tables.
+    if query_values:
+        for feature_query in [GENE_QUERY, TRNA_QUERY, TMRNA_QUERY]:
+            query_data = {}
+            results = mysqldb_basic.retrieve_data(alchemist.engine,
+                                                  column="PhageID",
+                                                  query=feature_query,
+                                                  id_list=query_values)
+            for data_dict in results:
+                phage_features = query_data.get(data_dict["PhageID"], [])
+                phage_features.append(data_dict)
+                query_data[data_dict["PhageID"]] = phage_features
+
+            feature_data[feature_query] = query_data
+
+        results = mysqldb_basic.retrieve_data(alchemist.engine,
+                                              column="PhageID",
+                                              query=PHAGE_QUERY,
+                                              id_list=query_values)
+        for data_dict in results:
+            phage_data[data_dict["PhageID"]] = data_dict
+
+    for genome_id in query_values:
+        data_dict = phage_data.get(genome_id)
+        if data_dict is None:
+            continue
+
+        data_cache[("genome_data", genome_id)] = [
+                data_dict,
+                feature_data[GENE_QUERY].get(genome_id, []),
+                feature_data[TRNA_QUERY].get(genome_id, []),
+                feature_data[TMRNA_QUERY].get(genome_id, [])]
+
+    genome_data = []
+    for genome_id in values:
+        data = data_cache.get(("genome_data", genome_id))
+        if data is not None:
+            genome_data.append(data)
+
+    return genome_data
+
+
+def build_genome_seqrecord(phage_data, gene_data, trna_data, tmrna_data,
+                           db_version):
+    """Builds a genome SeqRecord from phage, gene, trna and tmrna table data.
+
+    :param phage_data: Dictionary of data retrieved from the phage table.
+    :type phage_data: dict
+    :param gene_data: List of dictionaries retrieved from the gene table.
+    :type gene_data: list[dict]
+    :param trna_data: List of dictionaries retrieved from the trna table.
+    :type trna_data: list[dict]
+    :param tmrna_data: List of dictionaries retrieved from the tmrna table.
+    :type tmrna_data: list[dict]
+    :param db_version: Dictionary containing database version information.
+    :type db_version: dict
+    :returns: A sorted, versioned genome SeqRecord.
+    :rtype: SeqRecord
+    """
+    genome = mysqldb.parse_phage_table_data(phage_data)
+
+    genome.cds_features = [mysqldb.parse_gene_table_data(data_dict)
+                           for data_dict in gene_data]
+    genome.trna_features = [mysqldb.parse_trna_table_data(data_dict)
+                            for data_dict in trna_data]
+    genome.tmrna_features = [mysqldb.parse_tmrna_table_data(data_dict)
+                             for data_dict in tmrna_data]
+    for feature in (genome.cds_features + genome.trna_features +
+                    genome.tmrna_features):
+        feature.genome_length = genome.length
+
+    seqrecord = flat_files.genome_to_seqrecord(genome)
+    flat_files.sort_seqrecord_features(seqrecord)
+    append_database_version(seqrecord, db_version)
+
+    return seqrecord
+
+
 # TODO Document and Unittest
 def get_cds_seqrecords(alchemist, values, data_cache=None, nucleotide=False,
                        verbose=False):
@@ -18,6 +18,7 @@ from pdm_utils.functions import basic
 from pdm_utils.functions import configfile
 from pdm_utils.functions import mysqldb
 from pdm_utils.functions import mysqldb_basic
+from pdm_utils.functions import pham_summary
 from pdm_utils.functions.basic import expand_path
 from pdm_utils.functions.parallelize import *
 
@@ -298,9 +299,17 @@ def main(argument_list):
     logger.info(f"Schema version is compatible.")
     logger.info("Command line arguments verified.")
 
+    # Domains are part of cached pham summaries.
+    refresh_summary = pham_summary.has_pham_summary(engine)
+    if refresh_summary:
+        summary_state = pham_summary.get_database_state(engine)
+
     if reset:
         logger.info("Clearing all domain data currently in the database.")
         clear_domain_data(engine)
+        if refresh_summary:
+            pham_summary.remove_pham_summary(engine)
+            refresh_summary = False
 
     # Get gene data that needs to be processed
     # in dict format where key = column name, value = stored value.
@@ -342,6 +351,11 @@ def main(argument_list):
             total_rolled_back += batch_rolled_back
 
         search_summary(total_rolled_back)
+        if refresh_summary:
+            geneids = [gene["GeneID"] for gene in cdd_genes]
+            pham_summary.refresh_pham_summary(
+                            engine, pham_summary.get_gene_phams(engine, geneids),
+                            previous_state=summary_state)
         engine.dispose()
 
     return
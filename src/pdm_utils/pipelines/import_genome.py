@@ -2,6 +2,7 @@
 into the MySQL database."""
 
 import argparse
+from concurrent.futures import (ProcessPoolExecutor, as_completed)
 import csv
 from datetime import datetime, date
 import logging
@@ -10,12 +11,14 @@ import pathlib
 import shutil
 import sys
 
+import sqlalchemy
 from tabulate import tabulate
 
 import pdm_utils     # to get version number.
 from pdm_utils.classes.alchemyhandler import AlchemyHandler
 from pdm_utils.classes import bundle
 from pdm_utils.classes import genomepair
+from pdm_utils.classes import trna
 from pdm_utils.constants import constants, eval_descriptions
 from pdm_utils.functions import basic
 from pdm_utils.functions import configfile
@@ -25,6 +28,7 @@ from pdm_utils.functions import flat_files
 from pdm_utils.functions import phagesdb
 from pdm_utils.functions import mysqldb
 from pdm_utils.functions import mysqldb_basic
+from pdm_utils.functions import pham_summary
 from pdm_utils.functions import eval_modes
 
 # Add a logger named after this module. Then add a null handler, which
@@ -115,7 +119,9 @@ def main(unparsed_args_list):
             description_field=args.description_field,
             eval_mode=args.eval_mode,
             output_folder=results_path,
-            interactive=args.interactive)
+            interactive=args.interactive,
+            verify_reference_sets=args.verify_reference_sets,
+            number_processes=args.number_processes)
 
     logger.info("Import complete.")
 
@@ -162,6 +168,12 @@ def parse_args(unparsed_args_list):
     interactive_help = (
         "Indicates whether interactive evaluation of data is permitted.")
     config_file_help = "Path to the file containing user-specific login data."
+    number_processes_help = (
+        "Number of processes used to evaluate flat files ahead of import. "
+        "Files are evaluated one at a time in interactive mode.")
+    verify_reference_sets_help = (
+        "Indicates whether the reference data sets updated during import "
+        "should be compared to the database after all files are processed.")
 
     parser = argparse.ArgumentParser(description=import_help)
     parser.add_argument("database", type=str, help=database_help)
@@ -193,6 +205,10 @@ def parse_args(unparsed_args_list):
         default=False, help=interactive_help)
     parser.add_argument("-c", "--config_file", type=pathlib.Path,
                         help=config_file_help, default=None)
+    parser.add_argument("-vr", "--verify_reference_sets", action="store_true",
+        default=False, help=verify_reference_sets_help)
+    parser.add_argument("-np", "--number_processes", type=int, default=1,
+        help=number_processes_help)
 
 
     # Assumed command line arg structure:
@@ -208,7 +224,8 @@ def parse_args(unparsed_args_list):
 def data_io(engine=None, genome_folder=pathlib.Path(),
     import_table_file=pathlib.Path(), genome_id_field="", host_genus_field="",
     prod_run=False, description_field="", eval_mode="",
-    output_folder=pathlib.Path(), interactive=False):
+    output_folder=pathlib.Path(), interactive=False,
+    verify_reference_sets=False, number_processes=1):
     """Set up output directories, log files, etc. for import.
 
     :param engine: SQLAlchemy Engine object able to connect to a MySQL database.
@@ -237,6 +254,13 @@ def data_io(engine=None, genome_folder=pathlib.Path(),
         Indicates whether user is able to interact with genome evaluations
         at run time.
     :type interactive: bool
+    :param verify_reference_sets:
+        Indicates whether the reference data sets updated during import
+        are compared to the database after all files are processed.
+    :type verify_reference_sets: bool
+    :param number_processes:
+        Number of processes used to evaluate flat files ahead of import.
+    :type number_processes: int
     """
 
     logger.info("Setting up environment.")
@@ -293,7 +317,9 @@ def data_io(engine=None, genome_folder=pathlib.Path(),
                         genome_id_field=genome_id_field,
                         host_genus_field=host_genus_field,
                         interactive=interactive,
-                        log_folder_paths_dict=log_folder_paths_dict)
+                        log_folder_paths_dict=log_folder_paths_dict,
+                        verify_reference_sets=verify_reference_sets,
+                        number_processes=number_processes)
     success_ticket_list = results_tuple[0]
     failed_ticket_list = results_tuple[1]
     success_filepath_list = results_tuple[2]
@@ -510,7 +536,9 @@ def prepare_tickets(import_table_file=pathlib.Path(), eval_data_dict=None,
 def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
                               prod_run=False, genome_id_field="",
                               host_genus_field="", interactive=False,
-                              log_folder_paths_dict=None):
+                              log_folder_paths_dict=None,
+                              verify_reference_sets=False,
+                              number_processes=1):
     """Process GenBank-formatted flat files and import tickets.
 
     :param ticket_dict:
@@ -529,6 +557,8 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
     :param log_folder_paths_dict:
         Dictionary indicating paths to success and fail folders.
     :type log_folder_paths_dict: dict
+    :param verify_reference_sets: same as for data_io().
+    :param number_processes: same as for data_io().
     :returns:
         tuple of five objects
         WHERE
@@ -567,43 +597,39 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
     # Retrieve valid cluster, subcluster, host data from PhagesDB.
     external_ref_data = get_phagesdb_reference_sets()
 
-    # To minimize memory usage, each flat_file is evaluated one by one.
-    bundle_count = 1
-    file_count = 1
-    for filepath in files_in_folder:
-        replace_gnm_pair_key = file_ref + "_" + retain_ref
-        progress = f"Processing data for file #{file_count}: {filepath.name}."
-        print("\n\n" + progress)
-        logger.info(progress)
-
-        bndl = prepare_bundle(filepath=filepath, ticket_dict=ticket_dict,
-                              engine=engine,
-                              genome_id_field=genome_id_field,
-                              host_genus_field=host_genus_field,
-                              id=bundle_count,
-                              file_ref=file_ref, ticket_ref=ticket_ref,
-                              retrieve_ref=retrieve_ref, retain_ref=retain_ref,
-                              interactive=interactive,
-                              id_conversion_dict=constants.PHAGE_ID_DICT)
-
-        # Create sets of unique values for different data fields.
-        # Since data from each parsed flat file is imported into the
-        # database one file at a time, these sets are not static.
-        # So these sets should be recomputed for every flat file evaluated.
-        # Retrieve valid data from MySQL and merge with the valid external data.
-        mysql_ref_data = get_mysql_reference_sets(engine)
-        ref_data = basic.merge_set_dicts(external_ref_data, mysql_ref_data)
-        logger.info(f"Checking file: {filepath.name}.")
-        run_checks(bndl,
-                   accession_set=ref_data["accession_set"],
-                   phage_id_set=ref_data["phage_id_set"],
-                   seq_set=ref_data["seq_set"],
-                   host_genus_set=ref_data["host_genera_set"],
-                   cluster_set=ref_data["cluster_set"],
-                   subcluster_set=ref_data["subcluster_set"],
-                   file_ref=file_ref, ticket_ref=ticket_ref,
-                   retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+    # Create sets of unique values for different data fields.
+    # Since data from each parsed flat file is imported into the
+    # database one file at a time, these sets are not static.
+    # So these sets are retrieved from MySQL once, and then updated
+    # with each genome that is successfully imported.
+    mysql_ref_data = get_mysql_reference_sets(engine)
+
+    if number_processes > 1 and interactive:
+        logger.info("Flat files are evaluated one at a time "
+                    "since interactive evaluation is permitted.")
+        number_processes = 1
+
+    # To minimize memory usage, each flat_file is evaluated one by one,
+    # or in batches of files when using multiple processes.
+    evaluated_files = evaluate_flat_files(
+                            files_in_folder, ticket_dict, external_ref_data,
+                            mysql_ref_data, engine=engine,
+                            genome_id_field=genome_id_field,
+                            host_genus_field=host_genus_field,
+                            interactive=interactive,
+                            number_processes=number_processes,
+                            file_ref=file_ref, ticket_ref=ticket_ref,
+                            retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+    # Phams losing the genes of replaced genomes are refreshed in the
+    # cached pham summary, if the database has one, after all files
+    # have been imported.
+    changed_phams = None
+    if prod_run and pham_summary.has_pham_summary(engine):
+        summary_state = pham_summary.get_database_state(engine)
+        changed_phams = set()
 
+    bundle_count = 1
+    for filepath, bndl in evaluated_files:
         review_bundled_objects(bndl, interactive=interactive)
 
         # TODO this section below could probably be improved.
@@ -613,7 +639,8 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
         # data to MySQL), which can probably be simplified.
         bndl.check_for_errors()
         result = import_into_db(bndl, engine=engine,
-                                gnm_key=file_ref, prod_run=prod_run)
+                                gnm_key=file_ref, prod_run=prod_run,
+                                changed_phams=changed_phams)
         bndl.check_for_errors()
         dict_of_eval_lists = bndl.get_evaluations()
         logfile_path = get_logfile_path(bndl, paths_dict=log_folder_paths_dict,
@@ -622,6 +649,10 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
         evaluation_dict[bndl.id] = dict_of_eval_lists
 
         if result:
+            if prod_run:
+                update_mysql_reference_sets(mysql_ref_data, bndl,
+                                            file_ref=file_ref,
+                                            retain_ref=retain_ref)
             success_ticket_list.append(bndl.ticket.data_dict)
             success_filepath_list.append(filepath)
         else:
@@ -629,7 +660,13 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
                 failed_ticket_list.append(bndl.ticket.data_dict)
             failed_filepath_list.append(filepath)
         bundle_count += 1
-        file_count += 1
+
+    if changed_phams is not None:
+        pham_summary.refresh_pham_summary(engine, changed_phams,
+                                          previous_state=summary_state)
+
+    if verify_reference_sets and prod_run:
+        check_mysql_reference_sets(engine, mysql_ref_data)
 
     # Tickets were popped off the ticket dictionary as they were matched
     # to flat files. If there are any tickets left, errors need to be counted.
@@ -660,6 +697,263 @@ def process_files_and_tickets(ticket_dict, files_in_folder, engine=None,
             failed_filepath_list, evaluation_dict)
 
 
+def evaluate_flat_files(files_in_folder, ticket_dict, external_ref_data,
+                        mysql_ref_data, engine=None, genome_id_field="",
+                        host_genus_field="", interactive=False,
+                        number_processes=1, file_ref="", ticket_ref="",
+                        retrieve_ref="", retain_ref=""):
+    """Evaluate flat files in order, optionally with a pool of processes.
+
+    Evaluated Bundles are generated one at a time in the order of the
+    files, so each genome can be imported before the next Bundle is
+    generated. With multiple processes, batches of up to
+    number_processes files are evaluated ahead of import using the
+    reference data available before the batch. Genomes imported from
+    earlier files of the batch are then checked for before each Bundle
+    is generated.
+
+    :param files_in_folder: same as for process_files_and_tickets().
+    :param ticket_dict: same as for process_files_and_tickets().
+    :param external_ref_data: Dictionary of sets from PhagesDB.
+    :type external_ref_data: dict
+    :param mysql_ref_data:
+        Dictionary of sets from MySQL, updated as genomes are imported.
+    :type mysql_ref_data: dict
+    :param engine: same as for data_io().
+    :param genome_id_field: same as for data_io().
+    :param host_genus_field: same as for data_io().
+    :param interactive: same as for data_io().
+    :param number_processes: same as for data_io().
+    :param file_ref: same as for prepare_bundle().
+    :param ticket_ref: same as for prepare_bundle().
+    :param retrieve_ref: same as for prepare_bundle().
+    :param retain_ref: same as for prepare_bundle().
+    :returns: Generator of tuples of each file path and its evaluated Bundle.
+    :rtype: generator
+    """
+    number_processes = max(number_processes, 1)
+    file_count = 1
+    for file_batch in basic.partition_list(files_in_folder, number_processes):
+        bundles = [None] * len(file_batch)
+        if number_processes > 1:
+            batch_ref_data = {key: set(value)
+                              for key, value in mysql_ref_data.items()}
+            bundles = evaluate_flat_file_batch(
+                            file_batch, ticket_dict,
+                            basic.merge_set_dicts(external_ref_data,
+                                                  mysql_ref_data),
+                            engine=engine, genome_id_field=genome_id_field,
+                            host_genus_field=host_genus_field,
+                            start_id=file_count,
+                            file_ref=file_ref, ticket_ref=ticket_ref,
+                            retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+
+        for filepath, bndl in zip(file_batch, bundles):
+            progress = (f"Processing data for file #{file_count}: "
+                        f"{filepath.name}.")
+            print("\n\n" + progress)
+            logger.info(progress)
+
+            # A bundle evaluated in a batch is discarded if its ticket was
+            # matched to an earlier file, so the file is evaluated again.
+            if bndl is not None and not claim_ticket(bndl, ticket_dict,
+                                                     file_ref=file_ref):
+                bndl = None
+
+            if bndl is None:
+                ref_data = basic.merge_set_dicts(external_ref_data,
+                                                 mysql_ref_data)
+                bndl = evaluate_flat_file(
+                            filepath, ticket_dict, ref_data, engine=engine,
+                            genome_id_field=genome_id_field,
+                            host_genus_field=host_genus_field,
+                            id=file_count, interactive=interactive,
+                            file_ref=file_ref, ticket_ref=ticket_ref,
+                            retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+            else:
+                imported_ref_data = {
+                            key: mysql_ref_data[key] - batch_ref_data[key]
+                            for key in mysql_ref_data.keys()}
+                if any(imported_ref_data.values()):
+                    check_imported_genomes(bndl, imported_ref_data,
+                                           file_ref=file_ref)
+
+            yield filepath, bndl
+            file_count += 1
+
+
+def evaluate_flat_file_batch(file_batch, ticket_dict, ref_data, engine=None,
+                             genome_id_field="", host_genus_field="",
+                             start_id=1, file_ref="", ticket_ref="",
+                             retrieve_ref="", retain_ref=""):
+    """Evaluate a batch of flat files with a pool of processes.
+
+    :param file_batch: List of flat file paths.
+    :type file_batch: list
+    :param ticket_dict: same as for process_files_and_tickets().
+    :param ref_data: Dictionary of merged reference sets.
+    :type ref_data: dict
+    :param engine: same as for data_io().
+    :param genome_id_field: same as for data_io().
+    :param host_genus_field: same as for data_io().
+    :param start_id: Identifier to be assigned to the first Bundle.
+    :type start_id: int
+    :param file_ref: same as for prepare_bundle().
+    :param ticket_ref: same as for prepare_bundle().
+    :param retrieve_ref: same as for prepare_bundle().
+    :param retain_ref: same as for prepare_bundle().
+    :returns: List of evaluated Bundles, in the order of the files.
+    :rtype: list
+    """
+    # Pooled connections cannot be shared with child processes,
+    # so each process connects to the database separately.
+    url = None
+    if engine is not None:
+        url = engine.url
+        engine.dispose()
+
+    work_items = []
+    for index in range(len(file_batch)):
+        work_items.append((index, file_batch[index], ticket_dict, ref_data,
+                           url, genome_id_field, host_genus_field,
+                           start_id + index, file_ref, ticket_ref,
+                           retrieve_ref, retain_ref))
+
+    # Exceptions raised while evaluating a file are re-raised here
+    # by the executor, instead of leaving the import waiting on results.
+    processes = max([1, min([len(work_items), os.cpu_count() or 1])])
+    results = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(evaluate_flat_file_process, *work_item)
+                   for work_item in work_items]
+        for future in as_completed(futures):
+            results.append(future.result())
+    results.sort(key=lambda result: result[0])
+    return [result[1] for result in results]
+
+
+def evaluate_flat_file_process(index, filepath, ticket_dict, ref_data, url,
+                               genome_id_field, host_genus_field, id,
+                               file_ref, ticket_ref, retrieve_ref,
+                               retain_ref):
+    """Evaluate a flat file in a child process.
+
+    :param index: Position of the file in its batch.
+    :type index: int
+    :param url: URL of the database, or None to not connect.
+    :type url: URL
+    :returns: Tuple of the index and the evaluated Bundle.
+    :rtype: tuple
+    """
+    engine = None
+    if url is not None:
+        engine = sqlalchemy.create_engine(url)
+
+    bndl = evaluate_flat_file(filepath, ticket_dict, ref_data, engine=engine,
+                              genome_id_field=genome_id_field,
+                              host_genus_field=host_genus_field, id=id,
+                              file_ref=file_ref, ticket_ref=ticket_ref,
+                              retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+
+    if engine is not None:
+        engine.dispose()
+    return (index, bndl)
+
+
+def evaluate_flat_file(filepath, ticket_dict, ref_data, engine=None,
+                       genome_id_field="", host_genus_field="", id=None,
+                       interactive=False, file_ref="", ticket_ref="",
+                       retrieve_ref="", retain_ref=""):
+    """Prepare and check the data of a flat file.
+
+    :param filepath: same as for prepare_bundle().
+    :param ticket_dict: same as for prepare_bundle().
+    :param ref_data: Dictionary of merged reference sets.
+    :type ref_data: dict
+    :param engine: same as for data_io().
+    :param genome_id_field: same as for data_io().
+    :param host_genus_field: same as for data_io().
+    :param id: same as for prepare_bundle().
+    :param interactive: same as for data_io().
+    :param file_ref: same as for prepare_bundle().
+    :param ticket_ref: same as for prepare_bundle().
+    :param retrieve_ref: same as for prepare_bundle().
+    :param retain_ref: same as for prepare_bundle().
+    :returns: The evaluated Bundle.
+    :rtype: Bundle
+    """
+    bndl = prepare_bundle(filepath=filepath, ticket_dict=ticket_dict,
+                          engine=engine,
+                          genome_id_field=genome_id_field,
+                          host_genus_field=host_genus_field,
+                          id=id,
+                          file_ref=file_ref, ticket_ref=ticket_ref,
+                          retrieve_ref=retrieve_ref, retain_ref=retain_ref,
+                          interactive=interactive,
+                          id_conversion_dict=constants.PHAGE_ID_DICT)
+
+    logger.info(f"Checking file: {filepath.name}.")
+    run_checks(bndl,
+               accession_set=ref_data["accession_set"],
+               phage_id_set=ref_data["phage_id_set"],
+               seq_hash_set=ref_data["seq_hash_set"],
+               host_genus_set=ref_data["host_genera_set"],
+               cluster_set=ref_data["cluster_set"],
+               subcluster_set=ref_data["subcluster_set"],
+               file_ref=file_ref, ticket_ref=ticket_ref,
+               retrieve_ref=retrieve_ref, retain_ref=retain_ref)
+    return bndl
+
+
+def claim_ticket(bndl, ticket_dict, file_ref=""):
+    """Remove the ticket matched to a Bundle evaluated in another process.
+
+    :param bndl: same as for run_checks().
+    :param ticket_dict: same as for process_files_and_tickets().
+    :param file_ref: same as for prepare_bundle().
+    :returns:
+        Whether the Bundle was matched to the same ticket that is
+        still available in the ticket dictionary.
+    :rtype: bool
+    """
+    if file_ref not in bndl.genome_dict.keys():
+        return True
+
+    tkt = ticket_dict.pop(bndl.genome_dict[file_ref].id, None)
+    return (tkt is None) == (bndl.ticket is None)
+
+
+def check_imported_genomes(bndl, imported_ref_data, file_ref=""):
+    """Check a genome against genomes imported after it was evaluated.
+
+    :param bndl: same as for run_checks().
+    :param imported_ref_data:
+        Dictionary of sets of values from the imported genomes.
+    :type imported_ref_data: dict
+    :param file_ref: same as for prepare_bundle().
+    """
+    tkt = bndl.ticket
+    if tkt is None or tkt.type != "add":
+        return
+    if file_ref not in bndl.genome_dict.keys():
+        return
+
+    gnm = bndl.genome_dict[file_ref]
+    gnm.check_attribute("id", imported_ref_data["phage_id_set"],
+                        expect=False, eval_id="GNM-EVAL-041",
+                        eval_def=EDD["GNM-EVAL-041"])
+    gnm.check_attribute("name", imported_ref_data["phage_id_set"],
+                        expect=False, eval_id="GNM-EVAL-042",
+                        eval_def=EDD["GNM-EVAL-042"])
+    gnm.check_attribute("seq_hash", imported_ref_data["seq_hash_set"],
+                        expect=False, eval_id="GNM-EVAL-043",
+                        eval_def=EDD["GNM-EVAL-043"])
+    if gnm.accession != "":
+        gnm.check_attribute("accession", imported_ref_data["accession_set"],
+                            expect=False, eval_id="GNM-EVAL-044",
+                            eval_def=EDD["GNM-EVAL-044"])
+
+
 def get_phagesdb_reference_sets():
     """Get multiple sets of data from PhagesDB for reference.
 
@@ -701,16 +995,76 @@ def get_mysql_reference_sets(engine):
     subclusters = mysqldb_basic.get_distinct(engine, "phage", "Subcluster",
                                             null="none")
     host_genera = mysqldb_basic.get_distinct(engine, "phage", "HostGenus")
-    seqs = mysqldb.create_seq_set(engine)
+    seq_hashes = mysqldb.create_seq_hash_set(engine)
     dict = {"phage_id_set": phage_ids,
             "accession_set": accessions,
-            "seq_set": seqs,
+            "seq_hash_set": seq_hashes,
             "host_genera_set": host_genera,
             "cluster_set": clusters,
             "subcluster_set": subclusters}
     return dict
 
 
+def update_mysql_reference_sets(ref_data, bndl, file_ref="", retain_ref=""):
+    """Update MySQL reference sets with a genome imported into the database.
+
+    :param ref_data: Dictionary of sets from get_mysql_reference_sets().
+    :type ref_data: dict
+    :param bndl: same as for run_checks().
+    :param file_ref: same as for prepare_bundle().
+    :param retain_ref: same as for prepare_bundle().
+    """
+    gnm = bndl.genome_dict[file_ref]
+
+    # Accessions are unique to each genome, so the accession of a
+    # replaced genome is no longer present in the database.
+    # Other values of a replaced genome may still be used by other genomes,
+    # and are retained.
+    if bndl.ticket.type == "replace" and retain_ref in bndl.genome_dict.keys():
+        old_accession = bndl.genome_dict[retain_ref].accession
+        if old_accession != "" and old_accession != gnm.accession:
+            ref_data["accession_set"].discard(old_accession)
+
+    ref_data["phage_id_set"].add(gnm.id)
+    ref_data["accession_set"].add(gnm.accession)
+    ref_data["seq_hash_set"].add(gnm.seq_hash)
+    ref_data["host_genera_set"].add(gnm.host_genus)
+    ref_data["cluster_set"].add(gnm.cluster)
+    ref_data["subcluster_set"].add(gnm.subcluster)
+
+
+def check_mysql_reference_sets(engine, ref_data):
+    """Compare updated MySQL reference sets to the database.
+
+    :param engine: same as for data_io().
+    :param ref_data: Dictionary of sets from get_mysql_reference_sets().
+    :type ref_data: dict
+    :returns: Names of the reference sets that differ from the database.
+    :rtype: list
+    """
+    mysql_ref_data = get_mysql_reference_sets(engine)
+
+    inconsistent_sets = []
+    for key in mysql_ref_data.keys():
+        missing = mysql_ref_data[key] - ref_data[key]
+        if len(missing) > 0:
+            inconsistent_sets.append(key)
+            logger.warning(f"{len(missing)} value(s) in the database "
+                           f"were not in the reference set '{key}'.")
+
+        extra = ref_data[key] - mysql_ref_data[key]
+        if len(extra) > 0:
+            if key not in inconsistent_sets:
+                inconsistent_sets.append(key)
+            logger.info(f"{len(extra)} value(s) in the reference set '{key}' "
+                        "are no longer in the database.")
+
+    if len(inconsistent_sets) == 0:
+        logger.info("Reference sets are consistent with the database.")
+
+    return inconsistent_sets
+
+
 def get_logfile_path(bndl, paths_dict=None, filepath=None, file_ref=None):
     """Choose the path to output the file-specific log.
 
@@ -889,7 +1243,7 @@ def prepare_bundle(filepath=pathlib.Path(), ticket_dict={}, engine=None,
 
 
 def run_checks(bndl, accession_set=set(), phage_id_set=set(),
-               seq_set=set(), host_genus_set=set(), cluster_set=set(),
+               seq_hash_set=set(), host_genus_set=set(), cluster_set=set(),
                subcluster_set=set(), file_ref="", ticket_ref="",
                retrieve_ref="", retain_ref=""):
     """Run checks on the different types of data in a Bundle object.
@@ -900,8 +1254,8 @@ def run_checks(bndl, accession_set=set(), phage_id_set=set(),
     :type accession_set: set
     :param phage_id_set: Set of PhageIDs to check against.
     :type phage_id_set: set
-    :param seq_set: Set of nucleotide sequences to check against.
-    :type seq_set: set
+    :param seq_hash_set: Set of nucleotide sequence digests to check against.
+    :type seq_hash_set: set
     :param host_genus_set: Set of host genera to check against.
     :type host_genus_set: set
     :param cluster_set: Set of Clusters to check against.
@@ -929,7 +1283,8 @@ def run_checks(bndl, accession_set=set(), phage_id_set=set(),
             gnm = bndl.genome_dict[file_ref]
             check_genome(gnm, tkt.type, eval_flags,
                          accession_set=accession_set, phage_id_set=phage_id_set,
-                         seq_set=seq_set, host_genus_set=host_genus_set,
+                         seq_hash_set=seq_hash_set,
+                         host_genus_set=host_genus_set,
                          cluster_set=cluster_set, subcluster_set=subcluster_set)
 
             # Check each type of feature.
@@ -937,6 +1292,14 @@ def run_checks(bndl, accession_set=set(), phage_id_set=set(),
                 check_cds(gnm.cds_features[x], eval_flags,
                           description_field=tkt.description_field)
 
+            # All tRNA sequences are searched in a single Aragorn and
+            # tRNAscan-SE run, instead of one run of each per feature.
+            if eval_flags["check_trna"]:
+                trna.run_aragorn_batch(gnm.trna_features,
+                                       identifier=f"{gnm.id}_trna")
+                trna.run_trnascanse_batch(gnm.trna_features,
+                                          identifier=f"{gnm.id}_trna")
+
             for x in range(len(gnm.trna_features)):
                 check_trna(gnm.trna_features[x], eval_flags)
 
@@ -1390,7 +1753,7 @@ def check_ticket(tkt, type_set=set(), description_field_set=set(),
 
 
 def check_genome(gnm, tkt_type, eval_flags, phage_id_set=set(),
-                 seq_set=set(), host_genus_set=set(),
+                 seq_hash_set=set(), host_genus_set=set(),
                  cluster_set=set(), subcluster_set=set(),
                  accession_set=set()):
     """Check a Genome object parsed from file for errors.
@@ -1403,8 +1766,8 @@ def check_genome(gnm, tkt_type, eval_flags, phage_id_set=set(),
     :type eval_flags: dicts
     :param phage_id_set: Set of PhageIDs to check against.
     :type phage_id_set: set
-    :param seq_set: Set of genome sequences to check against.
-    :type seq_set: set
+    :param seq_hash_set: Set of genome sequence digests to check against.
+    :type seq_hash_set: set
     :param host_genus_set: Set of host genera to check against.
     :type host_genus_set: set
     :param cluster_set: Set of clusters to check against.
@@ -1423,7 +1786,8 @@ def check_genome(gnm, tkt_type, eval_flags, phage_id_set=set(),
         gnm.check_attribute("name", phage_id_set | {""}, expect=False,
                             eval_id="GNM-EVAL-002",
                             eval_def=EDD["GNM-EVAL-002"])
-        gnm.check_attribute("seq", seq_set | {constants.EMPTY_GENOME_SEQ},
+        empty_seq_hash = basic.get_seq_hash(constants.EMPTY_GENOME_SEQ)
+        gnm.check_attribute("seq_hash", seq_hash_set | {empty_seq_hash},
                             expect=False, eval_id="GNM-EVAL-003",
                             eval_def=EDD["GNM-EVAL-003"])
         gnm.check_attribute("annotation_status", {"final"}, expect=False,
@@ -1449,7 +1813,7 @@ def check_genome(gnm, tkt_type, eval_flags, phage_id_set=set(),
         gnm.check_attribute("id", phage_id_set, expect=True,
                             eval_id="GNM-EVAL-006",
                             eval_def=EDD["GNM-EVAL-006"])
-        gnm.check_attribute("seq", seq_set, expect=True,
+        gnm.check_attribute("seq_hash", seq_hash_set, expect=True,
                             eval_id="GNM-EVAL-007",
                             eval_def=EDD["GNM-EVAL-007"])
         gnm.check_attribute("annotation_status", {"draft"}, expect=False,
@@ -1932,7 +2296,8 @@ def check_tmrna(tmrna_ftr, eval_flags):
             eval_def=EDD["TMRNA-EVAL-012"])
 
 
-def import_into_db(bndl, engine=None, gnm_key="", prod_run=False):
+def import_into_db(bndl, engine=None, gnm_key="", prod_run=False,
+                   changed_phams=None):
     """Import data into the MySQL database.
 
     :param bndl: same as for run_checks().
@@ -1941,6 +2306,10 @@ def import_into_db(bndl, engine=None, gnm_key="", prod_run=False):
         Identifier for the Genome object in the Bundle's genome dictionary.
     :type gnm_key: str
     :param prod_run: same as for data_io().
+    :param changed_phams:
+        Set to which the PhamIDs of phams that lost the genes of a
+        successfully replaced genome are added.
+    :type changed_phams: set
     """
     if bndl._errors == 0:
         import_gnm = bndl.genome_dict[gnm_key]
@@ -1953,18 +2322,31 @@ def import_into_db(bndl, engine=None, gnm_key="", prod_run=False):
 
         # Update the date field to reflect the day of import.
         import_gnm.date = IMPORT_DATE
+        # The formatted statements are only used for logging. Data is
+        # imported with parameterized bulk inserts.
         bndl.sql_statements = mysqldb.create_genome_statements(
                                 import_gnm, bndl.ticket.type)
         if prod_run:
             logger.info("Importing data into the database for "
                         f"genome: {import_gnm.id}.")
-            execute_result, msg = mysqldb.execute_transaction(engine,
-                                        bndl.sql_statements)
+
+            # Phams losing the genes of a replaced genome are collected
+            # before the genome is deleted.
+            replaced_phams = set()
+            if changed_phams is not None and bndl.ticket.type == "replace":
+                replaced_phams = pham_summary.get_genome_phams(
+                                                    engine, [import_gnm.id])
+
+            execute_result, msg = mysqldb.execute_genome_inserts(
+                                        engine, [import_gnm],
+                                        tkt_type=bndl.ticket.type)
             if execute_result == 1:
                 result = False
                 logger.error("Error importing data. " + msg)
             else:
                 result = True
+                if changed_phams is not None:
+                    changed_phams.update(replaced_phams)
                 logger.info("Data successfully imported. " + msg)
                 logger.info("The following MySQL statements were executed:")
                 for statement in bndl.sql_statements:
@@ -6,9 +6,11 @@ import time
 from pathlib import Path
 
 from pdm_utils.functions import basic
+from pdm_utils.functions import columnar
 from pdm_utils.functions import configfile
 from pdm_utils.functions import fileio
 from pdm_utils.functions import pipelines_basic
+from pdm_utils.functions import querying
 
 #GLOBAL VARIABLES
 #-----------------------------------------------------------------------------
@@ -38,7 +40,8 @@ def main(unparsed_args_list):
                         args.adatabase, args.bdatabase, values=values,
                         filters=args.filters, groups=args.groups, 
                         sort=args.sort, show_per=args.show_percentages,
-                        use_locus=args.use_locus, verbose=args.verbose)
+                        use_locus=args.use_locus, snapshots=args.snapshots,
+                        verbose=args.verbose)
 
 def parse_pham_finder(unparsed_args_list):
     """Parses pham_finder arguments and stores them with an argparse object.
@@ -107,6 +110,12 @@ def parse_pham_finder(unparsed_args_list):
     USE_LOCUS_HELP = """
         Pham finder option that converts between phams using LocusTags.
         """
+    SNAPSHOTS_HELP = """
+        Pham finder option that maps phams using columnar snapshots
+        exported with the export npy pipeline.
+            Follow selection argument with the paths to the snapshot
+            directories of the reference and the other database.
+        """
 
     parser = argparse.ArgumentParser()
     parser.add_argument("adatabase", type=str, 
@@ -141,12 +150,14 @@ def parse_pham_finder(unparsed_args_list):
                         help=SHOW_PERCENTAGES_HELP)
     parser.add_argument("-ul", "--use_locus", action="store_true",
                         help=USE_LOCUS_HELP)
+    parser.add_argument("-sn", "--snapshots", nargs=2, type=Path,
+                        help=SNAPSHOTS_HELP)
 
     parser.set_defaults(folder_name=DEFAULT_FOLDER_NAME,
                         folder_path=DEFAULT_FOLDER_PATH,
                         config_file=None, verbose=False, input=[],
                         filters="", groups=[], sort=[],
-                        show_percentages=False)
+                        show_percentages=False, snapshots=None)
 
     parsed_args = parser.parse_args(unparsed_args_list[2:])
     return parsed_args
@@ -155,7 +166,8 @@ def parse_pham_finder(unparsed_args_list):
 def execute_pham_finder(alchemist, folder_path, folder_name, 
                         adatabase, bdatabase, values=None,
                         filters="", groups=[], sort=[],
-                        show_per=False, use_locus=False, verbose=False):
+                        show_per=False, use_locus=False, snapshots=None,
+                        verbose=False):
     """Executes the entirety of the file export pipeline.
 
     :param alchemist: A connected and fully build AlchemyHandler object.
@@ -185,7 +197,22 @@ def execute_pham_finder(alchemist, folder_path, folder_name,
     :type show_per: bool
     :param use_locus: Toggles conversion between phams using LocusTag instead
     :type use_locus: bool
+    :param snapshots: Paths to columnar snapshots of the two databases.
+    :type snapshots: list[Path]
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
     """
+    if snapshots is not None:
+        for snapshot in snapshots:
+            if not columnar.is_columnar_snapshot(snapshot):
+                print(f"'{snapshot}' is not a valid columnar snapshot.")
+                sys.exit(1)
+
+        if verbose:
+            print("Loading columnar snapshots...")
+        snapshots = [columnar.load_columnar_snapshot(snapshot)
+                     for snapshot in snapshots]
+
     if not (adatabase in alchemist.databases and \
             bdatabase in alchemist.databases):
         print("User credentials does not have access to both "
@@ -195,11 +222,15 @@ def execute_pham_finder(alchemist, folder_path, folder_name,
 
     alchemist.database = adatabase
     alchemist.connect()
+    if snapshots is not None:
+        pipelines_basic.check_snapshot_version(snapshots[0], alchemist)
     a_filter = pipelines_basic.build_filter(alchemist, "gene.PhamID", filters,
                                             values=values, verbose=verbose)
 
     alchemist.database = bdatabase
     alchemist.connect()
+    if snapshots is not None:
+        pipelines_basic.check_snapshot_version(snapshots[1], alchemist)
     if use_locus:
         b_filter = pipelines_basic.build_filter(alchemist, "gene.LocusTag", "")
     else:
@@ -224,6 +255,14 @@ def execute_pham_finder(alchemist, folder_path, folder_name,
                                         groups=groups,
                                         verbose=verbose)
 
+    b_index = None
+    if snapshots is None:
+        if verbose:
+            print(f"Indexing gene phams in {bdatabase}...")
+        b_index = build_gene_pham_index(load_gene_phams(
+                                            b_filter.engine, b_filter.graph,
+                                            get_key_column(use_locus)))
+
     if verbose:
         print("Prepared query and path structure, beginning export...")
 
@@ -245,7 +284,14 @@ def execute_pham_finder(alchemist, folder_path, folder_name,
             sort_columns = get_sort_columns(alchemist, sort)
             a_filter.sort(sort_columns)
 
-        mapped_phams = find_phams(a_filter, b_filter, show_per=show_per)
+        if snapshots is None:
+            mapped_phams = find_phams(a_filter, b_filter, show_per=show_per,
+                                      use_locus=use_locus, b_index=b_index)
+        else:
+            mapped_phams = columnar.find_phams(snapshots[0], snapshots[1],
+                                               phams=a_filter.values,
+                                               show_per=show_per,
+                                               use_locus=use_locus)
         if not mapped_phams:
             print("Phams are consistent between the two databases "
                  f"for '{mapped_path}'.")
@@ -263,46 +309,52 @@ def execute_pham_finder(alchemist, folder_path, folder_name,
         fileio.export_data_dict(out_data_dicts, file_path, PHAM_FINDER_HEADER,
                                 include_headers=True)
 
-#TODO Owen Needs unittests
-def find_phams(a_filter, b_filter, show_per=False, use_locus=False):
+def find_phams(a_filter, b_filter, show_per=False, use_locus=False,
+               b_index=None):
     """Find phams helper function that finds phams via GeneID intermediates.
 
+    Genes of the reference phams and genes of the other database are each
+    loaded with a single bulk query and joined in memory.
+
     :param a_filter: Fully built Filter connected to the reference database.
     :type a_filter: Filter
     :param b_filter: Fully build Filter connected to a database.
     :type b_filter: Filter
     :param show_per: Enables display gene coverage of the corresponding phams.
     :type show_per: bool
+    :param use_locus: Toggles conversion between phams using LocusTag instead
+    :type use_locus: bool
+    :param b_index: Gene pham index of the database, built if not provided.
+    :type b_index: dict{str:list[int]}
     :returns: Returns a dictionary mapping original phams to corresponding phams
     :rtype: dict{int:str}
     """
-    if use_locus:
-        genes = a_filter.retrieve("gene.GeneID")
-    else:
-        genes = a_filter.retrieve("gene.GeneID")
+    key_column = get_key_column(use_locus)
+
+    if b_index is None:
+        b_index = build_gene_pham_index(load_gene_phams(
+                                                b_filter.engine,
+                                                b_filter.graph, key_column))
+
+    a_genes = load_gene_phams(a_filter.engine, a_filter.graph, key_column,
+                              phams=a_filter.values)
+
+    corresponding = {}
+    for key, pham in a_genes:
+        pham_counts = corresponding.setdefault(pham, {})
+        if key is None:
+            continue
+
+        for join_pham in b_index.get(basic.fold_value(key), []):
+            pham_counts[join_pham] = pham_counts.get(join_pham, 0) + 1
 
     mapped_phams = {}
-    for pham, data_dict in genes.items():
-        if use_locus:
-            values = data_dict["LocusTag"]
-            values.remove(None)
-            b_filter.values = values
-        else:
-            b_filter.values = data_dict["GeneID"]        
-
-        if show_per:
-            pham_groups = b_filter.group("gene.PhamID")
-            phams_list = list(pham_groups.keys())
-            total_genes = 0
-            
-            for grouped_genes in pham_groups.values():
-                total_genes += len(grouped_genes)
-        else:
-            phams_list = b_filter.transpose("gene.PhamID")
+    for pham in a_filter.values:
+        pham_counts = corresponding.get(pham, {})
+        phams_list = sorted(pham_counts.keys())
 
         if len(phams_list) == 1:
             if phams_list[0] == pham:
-                print(f"{phams_list[0]} == {pham}")
                 continue
             else:
                 corr_phams = str(phams_list[0])
@@ -310,19 +362,84 @@ def find_phams(a_filter, b_filter, show_per=False, use_locus=False):
             corr_phams = "None"
         else:
             if show_per:
+                total_genes = sum(pham_counts.values())
                 for i in range(len(phams_list)):
                     join_pham = phams_list[i]
-                    percent = (len(pham_groups[join_pham])\
-                                  /total_genes) * 100
+                    percent = (pham_counts[join_pham]/total_genes) * 100
                     percent = round(percent, 1)
-                    phams_list[i] = "".join([str(join_pham), 
-                                        "(", str(percent), "%)"])
+                    phams_list[i] = "".join([str(join_pham),
+                                             "(", str(percent), "%)"])
             corr_phams = ";".join([str(join_pham) for join_pham in phams_list])
 
         mapped_phams[pham] = corr_phams
-        
+
     return mapped_phams
 
+
+def get_key_column(use_locus=False):
+    """Gets the name of the column used to match genes between databases.
+
+    :param use_locus: Toggles conversion between phams using LocusTag instead
+    :type use_locus: bool
+    :returns: MySQL column name.
+    :rtype: str
+    """
+    if use_locus:
+        return "gene.LocusTag"
+
+    return "gene.GeneID"
+
+
+def load_gene_phams(engine, graph, key_column, phams=None):
+    """Loads the gene identifier and PhamID of genes in a database.
+
+    :param engine: SQLAlchemy Engine object able to connect to a database.
+    :type engine: Engine
+    :param graph: SQLAlchemy structured NetworkX Graph object.
+    :type graph: Graph
+    :param key_column: MySQL column name of the gene identifier.
+    :type key_column: str
+    :param phams: PhamIDs to load genes from, or None to load all genes.
+    :type phams: list[int]
+    :returns: Gene identifier and PhamID of each gene.
+    :rtype: list[tuple]
+    """
+    metadata = graph.graph["metadata"]
+    key_obj = querying.get_column(metadata, key_column)
+    pham_obj = querying.get_column(metadata, "gene.PhamID")
+
+    query = querying.build_select(graph, [key_obj, pham_obj])
+    if phams is None:
+        return querying.execute(engine, query, return_dict=False)
+
+    if not phams:
+        return []
+
+    return querying.execute(engine, query, in_column=pham_obj, values=phams,
+                            return_dict=False)
+
+
+def build_gene_pham_index(genes):
+    """Indexes the phams of genes by their gene identifier.
+
+    Identifiers are compared case-insensitively, as they are by MySQL.
+    Genes without an identifier or a pham are not indexed.
+
+    :param genes: Gene identifier and PhamID of each gene.
+    :type genes: list[tuple]
+    :returns: Dictionary of folded gene identifiers mapped to PhamIDs.
+    :rtype: dict{str:list[int]}
+    """
+    gene_index = {}
+    for key, pham in genes:
+        if key is None or pham is None:
+            continue
+
+        gene_index.setdefault(basic.fold_value(key), []).append(pham)
+
+    return gene_index
+
+
 if __name__ == "__main__":
     main(sys.argv)
     
@@ -1,16 +1,24 @@
 """Pipeline to review discrepant or outdated cds product annotations. """
 
 import argparse
+import os
 import sys
 import textwrap
 import time
+from concurrent.futures import (ProcessPoolExecutor, as_completed)
 from pathlib import Path
 
+from sqlalchemy import func
+
+from pdm_utils.classes.geneneighborhood import GeneNeighborhood
+from pdm_utils.classes.progressbar import show_progress
 from pdm_utils.functions import annotation
 from pdm_utils.functions import basic
+from pdm_utils.functions import columnar
 from pdm_utils.functions import configfile
 from pdm_utils.functions import fileio
 from pdm_utils.functions import mysqldb_basic
+from pdm_utils.functions import pham_summary
 from pdm_utils.functions import pipelines_basic
 from pdm_utils.functions import querying
 
@@ -71,7 +79,8 @@ def main(unparsed_args_list):
                    filters=args.filters, groups=args.groups, sort=args.sort,
                    s_report=s_report, gr_reports=gr_reports,
                    production=args.production, psr_reports=psr_reports,
-                   verbose=args.verbose)
+                   snapshot=args.snapshot, use_summary=args.pham_summary,
+                   threads=args.number_processes, verbose=args.verbose)
 
 
 def parse_pham_review(unparsed_args_list):
@@ -129,6 +138,27 @@ def parse_pham_review(unparsed_args_list):
         review.
         """
 
+    SNAPSHOT_HELP = """
+        Review option to review phams and count pham annotations
+        using a columnar snapshot exported with the export npy pipeline.
+            Follow selection argument with the path to the snapshot
+            directory.
+        """
+
+    PHAM_SUMMARY_HELP = """
+        Review option to review phams and count pham annotations
+        using cached pham summaries, which are built on first use
+        and refreshed by the phamerate, import, update and find_domains
+        pipelines. Summaries are rebuilt if the database was changed
+        in other ways.
+        """
+
+    NUMBER_PROCESSES_HELP = """
+        Review option to set the number of processes used to write
+        gene and pham summary reports.
+            Follow selection argument with the number of processes.
+        """
+
     REVIEW_HELP = """
         Review option to toggle review of phams.  If enabled,
         phams inputted or auto-generated will not be reviewed
@@ -190,6 +220,12 @@ def parse_pham_review(unparsed_args_list):
 
     parser.add_argument("-nr", "--no_review", action="store_true",
                         help=REVIEW_HELP)
+    parser.add_argument("-sn", "--snapshot", type=Path,
+                        help=SNAPSHOT_HELP)
+    parser.add_argument("-ps", "--pham_summary", action="store_true",
+                        help=PHAM_SUMMARY_HELP)
+    parser.add_argument("-np", "--number_processes", type=int,
+                        help=NUMBER_PROCESSES_HELP)
     parser.add_argument("-if", "--import_files", dest="input",
                         type=pipelines_basic.convert_file_path,
                         help=IMPORT_FILE_HELP)
@@ -209,7 +245,8 @@ def parse_pham_review(unparsed_args_list):
                         folder_path=None,
                         input=[], filters="", groups=[], sort=[],
                         config_file=None,
-                        no_review=False, gene_report=False,
+                        no_review=False, gene_report=False, snapshot=None,
+                        pham_summary=False, number_processes=1,
                         summary_report=False, verbose=False)
 
     parsed_args = parser.parse_args(unparsed_args_list[2:])
@@ -221,6 +258,7 @@ def execute_pham_review(
                    folder_name=DEFAULT_FOLDER_NAME, no_review=False, values=[],
                    filters="", groups=[], sort=[], s_report=False,
                    gr_reports=False, psr_reports=False, production=False,
+                   snapshot=None, use_summary=False, threads=1,
                    verbose=False, force=False):
     """Executes the entirety of the pham review pipeline.
 
@@ -247,9 +285,32 @@ def execute_pham_review(
     :type gr_reports: bool
     :param production: Toggles additional filters for production-level review
     :type production: bool
+    :param snapshot: Path to a columnar snapshot of the database.
+    :type snapshot: Path
+    :param use_summary: A boolean to toggle use of cached pham summaries.
+    :type use_summary: bool
+    :param threads: Number of processes to write pham reports with.
+    :type threads: int
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
     """
+    if snapshot is not None:
+        if not columnar.is_columnar_snapshot(snapshot):
+            print(f"'{snapshot}' is not a valid columnar snapshot.")
+            sys.exit(1)
+        if verbose:
+            print("Loading columnar snapshot...")
+        snapshot = columnar.load_columnar_snapshot(snapshot)
+        # Phams are reviewed in the snapshot, but reports are built from
+        # the database, so both must describe the same database version.
+        pipelines_basic.check_snapshot_version(snapshot, alchemist)
+
+    summaries = None
+    if use_summary:
+        if verbose:
+            print("Loading pham summaries...")
+        summaries = pham_summary.load_pham_summary(alchemist.engine)
+
     db_filter = pipelines_basic.build_filter(alchemist, "gene.PhamID", filters,
                                                         values=values,
                                                         verbose=verbose)
@@ -268,7 +329,8 @@ def execute_pham_review(
             print(f"Identified {db_filter.hits()} phams to review...")
 
     if not no_review:
-        review_phams(db_filter, verbose=verbose)
+        review_phams(db_filter, snapshot=snapshot, summaries=summaries,
+                     verbose=verbose)
 
     if sort:
         db_filter.sort(sort)
@@ -288,6 +350,13 @@ def execute_pham_review(
     original_phams = db_filter.values
     gr_data_cache = {}
     psr_data_cache = {}
+
+    neighborhood = None
+    if psr_reports:
+        if verbose:
+            print("Indexing gene neighborhoods...")
+        neighborhood = GeneNeighborhood()
+        neighborhood.build(alchemist, phams=original_phams)
     for mapped_path in conditionals_map.keys():
         conditionals = conditionals_map[mapped_path]
         db_filter.values = original_phams
@@ -295,7 +364,9 @@ def execute_pham_review(
 
         pipelines_basic.create_working_dir(mapped_path, force=force)
 
-        review_data = get_review_data(alchemist, db_filter, verbose=verbose)
+        review_data = get_review_data(alchemist, db_filter,
+                                      snapshot=snapshot, summaries=summaries,
+                                      verbose=verbose)
         write_report(review_data, mapped_path, REVIEW_HEADER,
                      csv_name="FunctionReport", verbose=verbose)
 
@@ -310,21 +381,29 @@ def execute_pham_review(
                                        psr_reports=psr_reports,
                                        gr_data_cache=gr_data_cache,
                                        psr_data_cache=psr_data_cache,
-                                       verbose=verbose)
+                                       neighborhood=neighborhood,
+                                       threads=threads, verbose=verbose)
 
 
 def execute_pham_report_export(alchemist, db_filter, export_path,
                                gr_reports=False, gr_data_cache={},
                                psr_reports=False, psr_data_cache={},
-                               verbose=False):
+                               neighborhood=None, threads=1, verbose=False):
     """Executes export of gene data for a reviewed pham.
 
+    Report data for all phams is retrieved up front, and the reports
+    for each pham are then written by a pool of worker processes.
+
     :param alchemist: A connected and fully built AlchemyHandler object.
     :type alchemist: AlchemyHandler
     :param export_path: Path to a valid dir for new file creation.
     :type export_path: Path
     :param gr_data_cache: Total data extracted for gene reports.
     :type gr_data_cache: dict
+    :param neighborhood: Gene order index used for adjacent gene data.
+    :type neighborhood: GeneNeighborhood
+    :param threads: Number of processes to write pham reports with.
+    :type threads: int
     :param verbose: A boolean value to toggle progress print statements.
     :type verbose: bool
     """
@@ -333,50 +412,95 @@ def execute_pham_report_export(alchemist, db_filter, export_path,
     pham_report_path = export_path.joinpath("PhamReports")
     pham_report_path.mkdir()
 
+    if gr_reports:
+        uncached_phams = [pham for pham in phams if pham not in gr_data_cache]
+        if uncached_phams:
+            gr_data_cache.update(get_gr_data(alchemist, uncached_phams,
+                                             verbose=verbose))
+    if psr_reports:
+        uncached_phams = [pham for pham in phams
+                          if pham not in psr_data_cache]
+        if uncached_phams:
+            psr_data_cache.update(get_psr_data(alchemist, uncached_phams,
+                                               neighborhood=neighborhood,
+                                               verbose=verbose))
+
+    work_items = []
     for pham in phams:
         pham_path = pham_report_path.joinpath(str(pham))
-        pham_path.mkdir()
-
-        db_filter.values = [pham]
 
+        gr_data = None
         if gr_reports:
-            gr_data = gr_data_cache.get(pham)
-            if gr_data is None:
-                gr_data = get_gr_data(alchemist, db_filter, verbose=verbose)
-                gr_data_cache[pham] = gr_data
-
-            write_report(gr_data, pham_path, GR_HEADER,
-                         csv_name=f"{pham}_GeneReport",
-                         verbose=verbose)
+            gr_data = gr_data_cache.get(pham, [])
+        psr_data = None
         if psr_reports:
             psr_data = psr_data_cache.get(pham)
-            if psr_data is None:
-                psr_data = get_psr_data(alchemist, db_filter, verbose=verbose)
-                psr_data_cache[pham] = psr_data
 
-            write_pham_summary_report(psr_data, pham_path, verbose=verbose)
+        work_items.append((pham, pham_path, gr_data, psr_data, verbose))
+
+    threads = max([1, min([threads, os.cpu_count() or 1, len(work_items)])])
+    if threads > 1:
+        if verbose:
+            print(f"Writing reports for {len(work_items)} phams...")
+        # Exceptions raised while writing reports are re-raised here
+        # by the executor, instead of leaving the export waiting on results.
+        with ProcessPoolExecutor(max_workers=threads) as executor:
+            futures = [executor.submit(write_pham_reports, *work_item)
+                       for work_item in work_items]
+            for completed, future in enumerate(as_completed(futures), 1):
+                future.result()
+                if verbose:
+                    show_progress(completed, len(futures))
+    else:
+        for work_item in work_items:
+            write_pham_reports(*work_item)
 
 
-def review_phams(db_filter, verbose=False):
+def review_phams(db_filter, snapshot=None, summaries=None, verbose=False):
     """Finds and stores phams with discrepant function calls in a Filter.
 
+    :param db_filter: A connected Filter loaded with PhamIDs to review.
+    :type db_filter: Filter
+    :param snapshot: Loaded columnar snapshot used instead of the database.
+    :type snapshot: dict
+    :param summaries: Cached pham summaries used instead of the database.
+    :type summaries: dict{int:dict}
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
     """
-    notes = db_filter.get_column("gene.Notes")
-
     if verbose:
         print("Reviewing phams...")
 
-    reviewed_phams = []
-    for index in range(len(db_filter.values)):
-        pham = db_filter.values[index]
+    if snapshot is not None or summaries is not None:
+        if snapshot is not None:
+            reviewed_phams = columnar.get_discrepant_phams(
+                                        snapshot, phams=db_filter.values)
+        else:
+            reviewed_phams = pham_summary.get_discrepant_phams(
+                                        summaries, db_filter.values)
         if verbose:
-            print(f"...Analyzing Pham {pham}...")
+            print(f"Detected {len(reviewed_phams)} disrepent phams...")
+
+        db_filter.values = reviewed_phams
+        return
 
-        query = querying.build_count(db_filter.graph, notes.distinct(),
-                                     where=(db_filter.key == pham))
-        func_count = mysqldb_basic.scalar(db_filter.engine, query)
+    if not db_filter.values:
+        return
+
+    notes = db_filter.get_column("gene.Notes")
+
+    # Discrepant phams are selected by the database in one grouped query
+    # per chunk of filter values, instead of one count query per pham.
+    query = querying.build_select(db_filter.graph, db_filter.key,
+                                  add_in=notes, group_by=db_filter.key,
+                                  having=(func.count(notes.distinct()) > 1))
+    discrepant_phams = set(querying.first_column(db_filter.engine, query,
+                                                 in_column=db_filter.key,
+                                                 values=db_filter.values))
 
-        if func_count <= 1:
+    reviewed_phams = []
+    for pham in db_filter.values:
+        if pham not in discrepant_phams:
             continue
 
         if verbose:
@@ -427,6 +551,29 @@ def write_summary_report(alchemist, summary_data, export_path, verbose=False):
     s_file.close()
 
 
+def write_pham_reports(pham, pham_path, gr_data, psr_data, verbose=False):
+    """Writes the gene and summary reports for a reviewed pham.
+
+    :param pham: PhamID of the reviewed pham.
+    :type pham: int
+    :param pham_path: Path to the new dir for the pham reports.
+    :type pham_path: Path
+    :param gr_data: Formatted gene report data, or None to skip the report.
+    :type gr_data: list[dict]
+    :param psr_data: Formatted pham summary data, or None to skip the report.
+    :type psr_data: dict
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    """
+    pham_path.mkdir()
+
+    if gr_data is not None:
+        write_report(gr_data, pham_path, GR_HEADER,
+                     csv_name=f"{pham}_GeneReport", verbose=verbose)
+    if psr_data is not None:
+        write_pham_summary_report(psr_data, pham_path, verbose=verbose)
+
+
 def write_pham_summary_report(psr_data, export_path, verbose=False):
     if verbose:
         print(f"Writing SummaryReport.txt in {export_path.name}")
@@ -454,7 +601,8 @@ def write_pham_summary_report(psr_data, export_path, verbose=False):
 
 
 # TODO Documentation
-def get_review_data(alchemist, db_filter, verbose=False):
+def get_review_data(alchemist, db_filter, snapshot=None, summaries=None,
+                    verbose=False):
     """
     """
     if verbose:
@@ -468,7 +616,12 @@ def get_review_data(alchemist, db_filter, verbose=False):
         if verbose:
             print(f"...Processing data for pham {pham}...")
         row_dict = row_dicts[pham]
-        row_dict["Notes"] = annotation.get_count_annotations_in_pham(
+        if snapshot is not None:
+            row_dict["Notes"] = columnar.get_annotation_counts(snapshot, pham)
+        elif summaries is not None and pham in summaries:
+            row_dict["Notes"] = dict(summaries[pham]["Annotations"])
+        else:
+            row_dict["Notes"] = annotation.get_count_annotations_in_pham(
                                                             alchemist, pham)
 
         format_review_data(row_dict, pham)
@@ -501,49 +654,104 @@ def get_summary_data(alchemist, db_filter, verbose=False):
     return summary_data
 
 
-def get_gr_data(alchemist, db_filter, verbose=False):
-    pham = db_filter.values[0]
-    if verbose:
-        print(f"Retrieving genes in pham {pham}...")
-    db_filter.transpose("gene.GeneID", set_values=True)
+def get_gr_data(alchemist, phams, verbose=False):
+    """Retrieves gene report data for a set of phams in bulk.
 
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param phams: PhamIDs to retrieve gene data for.
+    :type phams: list[int]
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :returns: Dictionary of PhamIDs mapped to formatted gene report data.
+    :rtype: dict{int:list[dict]}
+    """
+    if verbose:
+        print(f"Retrieving genes in {len(phams)} phams...")
+    pham_obj = querying.get_column(alchemist.metadata, "gene.PhamID")
+    gene_obj = querying.get_column(alchemist.metadata, "gene.GeneID")
     pg_columns = get_gr_data_columns(alchemist)
-    row_dicts = db_filter.retrieve(pg_columns)
 
-    gr_data = []
-    for gene in row_dicts.keys():
-        if verbose:
-            print(f"...Processing data for gene {gene}...")
+    query = querying.build_select(alchemist.graph,
+                                  [pham_obj, gene_obj] + pg_columns)
+    results = querying.execute(alchemist.engine, query, in_column=pham_obj,
+                               values=phams, return_dict=False)
+
+    gr_data = {}
+    for pham in phams:
+        gr_data[pham] = []
 
-        row_dict = row_dicts[gene]
+    for result in results:
+        pham = result[0]
+        gene = result[1]
+
+        row_dict = {}
+        for column, value in zip(pg_columns, result[2:]):
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            row_dict[column.name] = [value]
 
         format_gr_data(row_dict, gene)
-        gr_data.append(row_dict)
+        gr_data.setdefault(pham, []).append(row_dict)
 
-    db_filter.values = [pham]
-    db_filter.key = "gene.PhamID"
     return gr_data
 
 
-def get_psr_data(alchemist, db_filter, verbose=False):
-    pham = db_filter.values[0]
-    adjacent_genes = annotation.get_genes_adjacent_to_pham(alchemist, pham)
-    psr_data = {}
+def get_psr_data(alchemist, phams, neighborhood=None, verbose=False):
+    """Retrieves pham summary report data for a set of phams in bulk.
+
+    :param alchemist: A connected and fully built AlchemyHandler object.
+    :type alchemist: AlchemyHandler
+    :param phams: PhamIDs to retrieve summary data for.
+    :type phams: list[int]
+    :param neighborhood: Gene order index used for adjacent gene data.
+    :type neighborhood: GeneNeighborhood
+    :param verbose: A boolean value to toggle progress print statements.
+    :type verbose: bool
+    :returns: Dictionary of PhamIDs mapped to formatted pham summary data.
+    :rtype: dict{int:dict}
+    """
+    if verbose:
+        print(f"Retrieving conserved domains in {len(phams)} phams...")
+    pham_obj = querying.get_column(alchemist.metadata, "gene.PhamID")
+    name_obj = querying.get_column(alchemist.metadata, "domain.Name")
+    description_obj = querying.get_column(alchemist.metadata,
+                                          "domain.Description")
+
+    query = querying.build_distinct(alchemist.graph,
+                                    [pham_obj, name_obj, description_obj])
+    results = querying.execute(alchemist.engine, query, in_column=pham_obj,
+                               values=phams, return_dict=False)
+
+    cdd_domains = {}
+    for pham in phams:
+        cdd_domains[pham] = {}
 
-    psr_data["left_annotations"] = annotation.get_count_annotations_in_genes(
-                                                alchemist, adjacent_genes[0])
-    psr_data["right_annotations"] = annotation.get_count_annotations_in_genes(
-                                                alchemist, adjacent_genes[1])
+    for pham, name, description in results:
+        if name is None:
+            continue
+        if isinstance(description, bytes):
+            description = description.decode("utf-8")
 
-    db_filter.values = [pham]
-    db_filter.transpose("domain.Name", set_values=True)
-    cdd_domains = db_filter.retrieve("domain.Description")
-    psr_data["cdd_domains"] = cdd_domains
+        descriptions = cdd_domains.setdefault(pham, {}).setdefault(
+                                            name, {"Description": []})
+        if description not in descriptions["Description"]:
+            descriptions["Description"].append(description)
 
-    format_psr_data(psr_data)
+    psr_data = {}
+    for pham in phams:
+        adjacent_annotations = \
+                annotation.get_count_adjacent_annotations_to_pham(
+                                                alchemist, pham,
+                                                neighborhood=neighborhood)
+        pham_data = {}
+        pham_data["left_annotations"] = adjacent_annotations[0]
+        pham_data["right_annotations"] = adjacent_annotations[1]
+        pham_data["cdd_domains"] = cdd_domains[pham]
+
+        format_psr_data(pham_data)
+        psr_data[pham] = pham_data
 
-    db_filter.values = [pham]
-    db_filter.key = "gene.PhamID"
     return psr_data
 
 
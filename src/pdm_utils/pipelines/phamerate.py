@@ -8,6 +8,7 @@ import os
 import shutil
 
 from pdm_utils.classes.alchemyhandler import AlchemyHandler
+from pdm_utils.functions import pham_summary
 from pdm_utils.functions.configfile import *
 from pdm_utils.functions.phameration import *
 from pdm_utils.functions.parallelize import *
@@ -153,6 +154,9 @@ def main(argument_list):
     # Refresh temp_dir
     refresh_tempdir(tmp)
 
+    # Record the database state so the pham summary cache can be refreshed
+    summary_state = pham_summary.get_database_state(engine)
+
     # Get old pham data and un-phamerated genes
     old_phams = get_pham_geneids(engine)
     old_colors = get_pham_colors(engine)
@@ -317,6 +321,11 @@ Initial database summary:
     print("Phixing phalsely hued phams...", end=" ")
     fix_colored_orphams(engine)
 
+    # Refresh cached summaries of phams whose members changed
+    changed_phams = get_changed_phams(old_phams, new_phams)
+    pham_summary.refresh_pham_summary(engine, changed_phams,
+                                      previous_state=summary_state)
+
     # Close all connections in the connection pool.
     engine.dispose()
 
@@ -10,6 +10,7 @@ from pdm_utils.functions import basic
 from pdm_utils.functions import configfile
 from pdm_utils.functions import mysqldb
 from pdm_utils.functions import mysqldb_basic
+from pdm_utils.functions import pham_summary
 from pdm_utils.functions import querying
 
 
@@ -51,8 +52,15 @@ def main(unparsed_args):
         succeeded = 0
         failed = 0
 
+        # Updated fields may be part of cached pham summaries.
+        changed_phams = None
+        if pham_summary.has_pham_summary(engine):
+            summary_state = pham_summary.get_database_state(engine)
+            changed_phams = set()
+
         for dict in list_of_update_tickets:
-            status = update_field(alchemist, dict)
+            status = update_field(alchemist, dict,
+                                  changed_phams=changed_phams)
 
             if status == 1:
                 processed += 1
@@ -61,6 +69,10 @@ def main(unparsed_args):
                 processed += 1
                 failed += 1
 
+        if changed_phams is not None:
+            pham_summary.refresh_pham_summary(engine, changed_phams,
+                                              previous_state=summary_state)
+
         engine.dispose()
         print("\nDone iterating through tickets.")
         if succeeded > 0:
@@ -69,13 +81,16 @@ def main(unparsed_args):
             print(f"{failed} / {processed} tickets failed to be handled.")
 
 
-def update_field(alchemist, update_ticket):
+def update_field(alchemist, update_ticket, changed_phams=None):
     """Attempts to update a field using information from an update_ticket.
 
     :param alchemist: A connected and fully build AlchemyHandler object.
     :type alchemist: AlchemyHandler
     :param update_ticket: Dictionary with instructions to update a field.
     :type update_ticket: dict
+    :param changed_phams:
+        Set to which the PhamIDs of phams affected by the update are added.
+    :type changed_phams: set
     """
     try:
         table_map = alchemist.mapper.classes[update_ticket["table"]]
@@ -120,7 +135,20 @@ def update_field(alchemist, update_ticket):
 
     statement = update(table_obj).where(key_value_clause).values(
                                     {field.name : update_ticket["value"]})
+
+    # Phams are collected before and after the update, since the update
+    # can move a row from one pham to another.
+    if changed_phams is not None:
+        changed_phams.update(pham_summary.get_row_phams(
+                        alchemist.engine, table_obj.name,
+                        update_ticket["key_value"]))
     alchemist.engine.execute(statement)
+    if changed_phams is not None:
+        new_key_value = update_ticket["key_value"]
+        if field is key_field:
+            new_key_value = update_ticket["value"]
+        changed_phams.update(pham_summary.get_row_phams(
+                        alchemist.engine, table_obj.name, new_key_value))
     return 1
 
 
@@ -4,6 +4,11 @@ then passes all command line arguments to the main pipeline module.
 """
 import argparse
 
+from sqlalchemy.engine.base import Engine
+
+from pdm_utils.classes.queryprofiler import QueryProfiler
+from pdm_utils.functions import phagesdb
+
 from pdm_utils.pipelines import compare_db
 from pdm_utils.pipelines import convert_db
 from pdm_utils.pipelines import export_db
@@ -25,44 +30,76 @@ VALID_PIPELINES = {"compare", "convert", "export", "find_domains",
                    "get_gb_records", "import", "phamerate", "push",
                    "revise", "pham_review", "update"}
 
+PROFILE_SQL_FLAG = "--profile-sql"
+PHAGESDB_OFFLINE_FLAG = "--phagesdb-offline"
+RUN_FLAGS = {PROFILE_SQL_FLAG, PHAGESDB_OFFLINE_FLAG}
+
 
 def main(unparsed_args):
     """Run a pdm_utils pipeline."""
     args = parse_args(unparsed_args)
 
-    if args.pipeline == "compare":
+    # Run flags are consumed here so that pipeline parsers,
+    # which parse the complete argument list, never see them.
+    unparsed_args = remove_run_flags(unparsed_args)
+    if args.phagesdb_offline:
+        phagesdb.set_offline()
+
+    profiler = None
+    if args.profile_sql:
+        profiler = QueryProfiler()
+        profiler.attach(Engine)
+
+    try:
+        run_pipeline(args.pipeline, unparsed_args)
+    finally:
+        if profiler is not None:
+            profiler.detach()
+            print("\n\nSQL profile:")
+            print(profiler.report())
+    print("\n\nPipeline completed")
+
+
+def run_pipeline(pipeline, unparsed_args):
+    """Run the main function of a pdm_utils pipeline.
+
+    :param pipeline: Name of the pdm_utils pipeline to run.
+    :type pipeline: str
+    :param unparsed_args: raw command line args
+    :type unparsed_args: list
+    """
+    if pipeline == "compare":
         compare_db.main(unparsed_args)
-    elif args.pipeline == "convert":
+    elif pipeline == "convert":
         convert_db.main(unparsed_args)
-    elif args.pipeline == "export":
+    elif pipeline == "export":
         export_db.main(unparsed_args)
-    elif args.pipeline == "find_domains":
+    elif pipeline == "find_domains":
         find_domains.main(unparsed_args)
-    elif args.pipeline == "find_phams":
+    elif pipeline == "find_phams":
         pham_finder.main(unparsed_args)
-    elif args.pipeline == "freeze":
+    elif pipeline == "freeze":
         freeze_db.main(unparsed_args)
-    elif args.pipeline == "get_data":
+    elif pipeline == "get_data":
         get_data.main(unparsed_args)
-    elif args.pipeline == "get_db":
+    elif pipeline == "get_db":
         get_db.main(unparsed_args)
-    elif args.pipeline == "get_gb_records":
+    elif pipeline == "get_gb_records":
         get_gb_records.main(unparsed_args)
-    elif args.pipeline == "import":
+    elif pipeline == "import":
         import_genome.main(unparsed_args)
-    elif args.pipeline == "phamerate":
+    elif pipeline == "phamerate":
         phamerate.main(unparsed_args)
-    elif args.pipeline == "push":
+    elif pipeline == "push":
         push_db.main(unparsed_args)
-    elif args.pipeline == "revise":
+    elif pipeline == "revise":
         revise.main(unparsed_args)
-    elif args.pipeline == "pham_review":
+    elif pipeline == "pham_review":
         pham_review.main(unparsed_args)
-    elif args.pipeline == "update":
+    elif pipeline == "update":
         update_field.main(unparsed_args)
     else:
         pass
-    print("\n\nPipeline completed")
 
 
 def parse_args(unparsed_args):
@@ -75,14 +112,35 @@ def parse_args(unparsed_args):
     run_help = "Command line script to call a pdm_utils pipeline."
     usage = "python3 -m pdm_utils [pipeline]"
     pipeline_help = "Name of the pdm_utils pipeline to run."
+    profile_sql_help = ("Report SQL statement counts and latencies "
+                        "when the pipeline exits.")
+    phagesdb_offline_help = ("Use cached PhagesDB data "
+                             "without contacting PhagesDB.")
 
     parser = argparse.ArgumentParser(description=run_help, usage=usage)
     parser.add_argument("pipeline", type=str, choices=list(VALID_PIPELINES),
                         help=pipeline_help)
+    parser.add_argument(PROFILE_SQL_FLAG, action="store_true",
+                        help=profile_sql_help)
+    parser.add_argument(PHAGESDB_OFFLINE_FLAG, action="store_true",
+                        help=phagesdb_offline_help)
 
     # Assumed command line arg structure:
     # python3 -m pdm_utils.run <pipeline> <additional args...>
     # sys.argv:      [0]            [1]         [2...]
-    args = parser.parse_args(unparsed_args[1:2])
+    args = parser.parse_args(remove_run_flags(unparsed_args)[1:2])
+    args.profile_sql = PROFILE_SQL_FLAG in unparsed_args
+    args.phagesdb_offline = PHAGESDB_OFFLINE_FLAG in unparsed_args
 
     return args
+
+
+def remove_run_flags(unparsed_args):
+    """Remove the flags handled by this script from command line args.
+
+    :param unparsed_args: raw command line args
+    :type unparsed_args: list
+    :returns: Command line args without the run flags.
+    :rtype: list
+    """
+    return [arg for arg in unparsed_args if arg not in RUN_FLAGS]
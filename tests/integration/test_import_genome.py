@@ -413,10 +413,11 @@ class TestImportGenome1(unittest.TestCase):
         test_db_utils.insert_data(PHAGE, phage_data3)
 
         ref_dict = import_genome.get_mysql_reference_sets(self.engine)
-        exp_keys = {"phage_id_set", "accession_set", "seq_set",
+        exp_keys = {"phage_id_set", "accession_set", "seq_hash_set",
                     "host_genera_set", "cluster_set", "subcluster_set"}
         exp_phage_ids = {"D29", "Trixie", "L5"}
-        exp_seqs = {"AAAA", "TTTT", "CCCC"}
+        exp_seqs = {basic.get_seq_hash("AAAA"), basic.get_seq_hash("TTTT"),
+                    basic.get_seq_hash("CCCC")}
         exp_accessions = {"ABC", "EFG", ""}
         exp_host_genera = {"Mycobacterium", "Gordonia"}
         exp_clusters = {"A", "B", "Singleton", "UNK"}
@@ -428,7 +429,7 @@ class TestImportGenome1(unittest.TestCase):
         with self.subTest():
             self.assertEqual(ref_dict["accession_set"], exp_accessions)
         with self.subTest():
-            self.assertEqual(ref_dict["seq_set"], exp_seqs)
+            self.assertEqual(ref_dict["seq_hash_set"], exp_seqs)
         with self.subTest():
             self.assertEqual(ref_dict["host_genera_set"], exp_host_genera)
         with self.subTest():
@@ -67,6 +67,7 @@ from Bio.SeqRecord import SeqRecord
 
 from pdm_utils import run
 from pdm_utils.constants import constants
+from pdm_utils.functions import basic
 from pdm_utils.functions import eval_modes
 from pdm_utils.pipelines import import_genome
 
@@ -408,7 +409,7 @@ class TestImportGenome1(unittest.TestCase):
         self.mysql_ref_data = {
             "phage_id_set": set(),
             "accession_set": set(),
-            "seq_set": set(),
+            "seq_hash_set": set(),
             "host_genera_set": set(),
             "cluster_set": set(),
             "subcluster_set": set()}
@@ -1078,7 +1079,8 @@ class TestImportGenome1(unittest.TestCase):
         self.mysql_ref_data["host_genera_set"] = {"Mycobacterium"}
         self.mysql_ref_data["cluster_set"] = {"C"}
         self.mysql_ref_data["subcluster_set"] = {"C1"}
-        self.mysql_ref_data["seq_set"] = {self.alice_seq}
+        self.mysql_ref_data["seq_hash_set"] = {
+                                        basic.get_seq_hash(self.alice_seq)}
         mysql_ref_mock.return_value = self.mysql_ref_data
         getpass_mock.side_effect = [USER, PWD]
         SeqIO.write(self.alice_record, alice_flat_file_path, "genbank")
@@ -1108,7 +1110,7 @@ class TestImportGenome1(unittest.TestCase):
         self.mysql_ref_data["cluster_set"] = {"C"}
         self.mysql_ref_data["subcluster_set"] = {"C1"}
         new_seq = self.alice_seq + "AAA"
-        self.mysql_ref_data["seq_set"] = {new_seq}
+        self.mysql_ref_data["seq_hash_set"] = {basic.get_seq_hash(new_seq)}
         mysql_ref_mock.return_value = self.mysql_ref_data
         getpass_mock.side_effect = [USER, PWD]
         SeqIO.write(self.alice_record, alice_flat_file_path, "genbank")
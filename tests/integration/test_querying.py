@@ -542,6 +542,27 @@ class TestQuerying(unittest.TestCase):
         self.assertFalse("Alice" in results)
         self.assertFalse("Myrna" in results)
 
+    def test_execute_temp_table_subquery(self):
+        """Verify execute_temp_table_subquery() retrieves expected data.
+        """
+        where_clause = querying.build_where_clause(self.graph,
+                                                   "phage.Cluster=A")
+        phageid = querying.get_column(self.metadata, "phage.PhageID")
+        select = querying.build_select(self.graph, phageid,
+                                       where=where_clause)
+
+        results = querying.first_column_value_subqueries(self.engine, select,
+                                                         phageid,
+                                                         ["Trixie", "D29",
+                                                          "Alice", "Myrna"],
+                                                         limit=2,
+                                                         temp_table_threshold=0)
+
+        self.assertTrue("Trixie" in results)
+        self.assertTrue("D29" in results)
+        self.assertFalse("Alice" in results)
+        self.assertFalse("Myrna" in results)
+
     def test_query_1(self):
         """Verify query() correctly queries for SQLAlchemy ORM instances.
         """
@@ -75,6 +75,83 @@ class TestAnnotationRetrieval(unittest.TestCase):
         mock_get_relative_gene.assert_any_call(
                                    self.mock_alchemist, "Trixie_CDS_2", -1)
 
+    @patch("pdm_utils.functions.annotation.querying.execute")
+    def test_get_gene_values_1(self, mock_execute):
+        """Verify get_gene_values() queries distinct genes once."""
+        mock_execute.return_value = [("Trixie_CDS_1", 1), ("L5_CDS_1", 2)]
+
+        values = annotation.get_gene_values(
+                            self.mock_alchemist,
+                            ["Trixie_CDS_1", "L5_CDS_1", "Trixie_CDS_1"],
+                            "PhamID")
+
+        mock_execute.assert_called_once()
+        with self.subTest():
+            self.assertEqual(mock_execute.call_args[1]["values"],
+                             ["Trixie_CDS_1", "L5_CDS_1"])
+        with self.subTest():
+            self.assertEqual(values, [1, 2, 1])
+
+    @patch("pdm_utils.functions.annotation.querying.execute")
+    def test_get_gene_values_2(self, mock_execute):
+        """Verify get_gene_values() aligns missing and case-folded genes."""
+        mock_execute.return_value = [("TRIXIE_CDS_1", 1)]
+
+        values = annotation.get_gene_values(
+                            self.mock_alchemist,
+                            ["Trixie_CDS_1", "Trixie_CDS_5"], "PhamID")
+
+        self.assertEqual(values, [1, None])
+
+    @patch("pdm_utils.functions.annotation.querying.execute")
+    def test_get_gene_values_3(self, mock_execute):
+        """Verify get_gene_values() does not query for an empty gene list."""
+        values = annotation.get_gene_values(self.mock_alchemist, [], "PhamID")
+
+        mock_execute.assert_not_called()
+        self.assertEqual(values, [])
+
+    @patch("pdm_utils.functions.annotation.get_gene_values")
+    def test_get_gene_annotations_1(self, mock_get_gene_values):
+        """Verify get_gene_annotations() decodes Notes values."""
+        mock_get_gene_values.return_value = [b"terminase", None]
+
+        annotations = annotation.get_gene_annotations(
+                            self.mock_alchemist, ["L5_CDS_1", "L5_CDS_2"])
+
+        self.assertEqual(annotations, ["terminase", None])
+
+    @patch("pdm_utils.functions.annotation.get_gene_values")
+    def test_get_relative_genes_1(self, mock_get_gene_values):
+        """Verify get_relative_genes() looks up all relative genes at once."""
+        annotation.get_relative_genes(self.mock_alchemist,
+                                      ["Trixie_CDS_2", "L5_CDS_10"], -1)
+
+        mock_get_gene_values.assert_called_once_with(
+                                   self.mock_alchemist,
+                                   ["Trixie_CDS_1", "L5_CDS_9"], "GeneID",
+                                   limit=8000)
+
+    def test_get_relative_genes_2(self):
+        """Verify get_relative_genes() raises ValueError at bad GeneID input."""
+        with self.assertRaises(ValueError):
+            annotation.get_relative_genes(self.mock_alchemist,
+                                          ["Trixie_CDS_2", "BAD_GENE"], 1)
+
+    @patch("pdm_utils.functions.annotation.get_relative_genes")
+    @patch("pdm_utils.functions.annotation.get_genes_from_pham")
+    def test_get_genes_adjacent_to_pham_1(self, mock_get_genes_from_pham,
+                                          mock_get_relative_genes):
+        """Verify get_genes_adjacent_to_pham() removes missing genes."""
+        mock_get_genes_from_pham.return_value = ["L5_CDS_1", "L5_CDS_5"]
+        mock_get_relative_genes.side_effect = [[None, "L5_CDS_4"],
+                                               ["L5_CDS_2", None]]
+
+        adjacent_genes = annotation.get_genes_adjacent_to_pham(
+                                                    self.mock_alchemist, 1)
+
+        self.assertEqual(adjacent_genes, (["L5_CDS_4"], ["L5_CDS_2"]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,9 +3,18 @@
 
 from pdm_utils.functions import basic
 from datetime import datetime
+from pathlib import Path
+import shutil
 import unittest
+from unittest.mock import patch
 import re
 
+from sqlalchemy import create_engine
+
+TMPDIR_PREFIX = "pdm_utils_tests_unit_basic_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location
+TMPDIR_BASE = "/tmp"
+
 
 
 
@@ -1428,6 +1437,15 @@ class TestBasicFunctions1(unittest.TestCase):
         output_value = basic.lower_case(input_value)
         self.assertEqual(output_value, 1)
 
+    def test_fold_value_1(self):
+        """Verify strings are lowercased and other values are unchanged."""
+        with self.subTest():
+            self.assertEqual(basic.fold_value("Trixie_CDS_1"), "trixie_cds_1")
+        with self.subTest():
+            self.assertEqual(basic.fold_value(1), 1)
+        with self.subTest():
+            self.assertIsNone(basic.fold_value(None))
+
 
 
 
@@ -1453,6 +1471,23 @@ class TestBasicFunctions1(unittest.TestCase):
 
 
 
+
+    def test_get_seq_hash_1(self):
+        """Verify the digest does not depend on sequence case or type."""
+        exp_hash = ("9820f5a84cc404330e6d97bde13b580f"
+                    "e9bf68b9ca0974624593f6324553088c")
+        with self.subTest():
+            self.assertEqual(basic.get_seq_hash("atgc"), exp_hash)
+        with self.subTest():
+            self.assertEqual(basic.get_seq_hash(b"AtGc"), exp_hash)
+
+    def test_get_seq_hash_2(self):
+        """Verify different sequences have different digests."""
+        self.assertNotEqual(basic.get_seq_hash("ATGC"),
+                            basic.get_seq_hash("ATGCA"))
+
+
+
     def test_convert_list_to_dict_1(self):
         """Verify list with dictionaries with unique intended keys is
         converted correctly."""
@@ -1661,5 +1696,50 @@ class TestBytesHandling(unittest.TestCase):
                                  self.test_values[index])
 
 
+
+class TestCacheFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_get_database_cache_key_1(self):
+        """Verify databases with the same name on different hosts have
+        different keys."""
+        engine1 = create_engine("mysql+pymysql://user@host1/Actino_Draft")
+        engine2 = create_engine("mysql+pymysql://user@host2/Actino_Draft")
+        key1 = basic.get_database_cache_key(engine1)
+        key2 = basic.get_database_cache_key(engine2)
+        with self.subTest():
+            self.assertTrue(key1.startswith("Actino_Draft_"))
+        with self.subTest():
+            self.assertNotEqual(key1, key2)
+
+    def test_write_file_atomic_1(self):
+        """Verify a file is created along with its parent directory."""
+        path = self.test_dir.joinpath("cache", "data.json")
+        basic.write_file_atomic(path, b"data")
+        self.assertEqual(path.read_bytes(), b"data")
+
+    @patch("pdm_utils.functions.basic.os.replace")
+    def test_write_file_atomic_2(self, replace_mock):
+        """Verify a failed write leaves the file and no temporary file."""
+        replace_mock.side_effect = OSError
+        path = self.test_dir.joinpath("data.json")
+        path.write_bytes(b"old data")
+        with self.subTest():
+            with self.assertRaises(OSError):
+                basic.write_file_atomic(path, b"data")
+        with self.subTest():
+            self.assertEqual(path.read_bytes(), b"old data")
+        with self.subTest():
+            self.assertEqual(list(self.test_dir.iterdir()), [path])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,199 @@
+"""Unit tests for the columnar snapshot export and analysis functions."""
+import shutil
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+from sqlalchemy import Column, create_engine, Integer, LargeBinary, MetaData
+from sqlalchemy import String, Table
+
+from pdm_utils.functions import columnar
+
+TMPDIR_PREFIX = "pdm_utils_tests_unit_columnar_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location
+TMPDIR_BASE = "/tmp"
+
+
+def build_snapshot(test_dir, name, genes):
+    """Write a columnar snapshot of a small SQLite database."""
+    metadata = MetaData()
+    phage = Table("phage", metadata,
+                  Column("PhageID", String(25), primary_key=True),
+                  Column("Cluster", String(5)))
+    gene = Table("gene", metadata,
+                 Column("GeneID", String(35), primary_key=True),
+                 Column("PhageID", String(25)),
+                 Column("PhamID", Integer),
+                 Column("LocusTag", String(35)),
+                 Column("Notes", LargeBinary))
+    version = Table("version", metadata,
+                    Column("Version", Integer, primary_key=True),
+                    Column("SchemaVersion", Integer))
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    engine.execute(phage.insert(), [{"PhageID": "Trixie", "Cluster": "A"},
+                                    {"PhageID": "L5", "Cluster": "A"},
+                                    {"PhageID": "Alice", "Cluster": None}])
+    engine.execute(gene.insert(), genes)
+    engine.execute(version.insert(), [{"Version": 7, "SchemaVersion": 10}])
+
+    alchemist = Mock()
+    alchemist.database = name
+    alchemist.metadata = metadata
+    alchemist.engine = engine
+
+    snapshot_path = columnar.write_columnar_snapshot(alchemist, test_dir)
+    engine.dispose()
+    return snapshot_path
+
+
+def gene_row(geneid, pham, notes, locus_tag=None):
+    return {"GeneID": geneid, "PhageID": geneid.split("_")[0],
+            "PhamID": pham, "LocusTag": locus_tag, "Notes": notes}
+
+
+class TestColumnarSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.a_genes = [gene_row("Trixie_CDS_1", 1, b"terminase", "TX_1"),
+                        gene_row("Trixie_CDS_2", 2, b"", "TX_2"),
+                        gene_row("Trixie_CDS_3", 3, None, "TX_3"),
+                        gene_row("L5_CDS_1", 1, b"terminase", "L5_1"),
+                        gene_row("L5_CDS_2", 2, b"portal protein", "L5_2"),
+                        gene_row("L5_CDS_3", 3, None, "L5_3"),
+                        gene_row("Alice_CDS_1", 2, b"", "AL_1"),
+                        gene_row("Alice_CDS_2", None, b"", "AL_2")]
+        self.b_genes = [gene_row("Trixie_CDS_1", 1, b"terminase", "TX_1"),
+                        gene_row("Trixie_CDS_2", 4, b"", "TX_2"),
+                        gene_row("Trixie_CDS_3", 5, None, "TX_3"),
+                        gene_row("L5_CDS_1", 1, b"terminase", "L5_1"),
+                        gene_row("L5_CDS_2", 4, b"portal protein", "L5_2"),
+                        gene_row("L5_CDS_3", 6, None, "L5_3"),
+                        gene_row("Alice_CDS_1", 7, b"", "AL_1")]
+
+        a_path = build_snapshot(self.test_dir, "Actino_A", self.a_genes)
+        b_path = build_snapshot(self.test_dir, "Actino_B", self.b_genes)
+        self.a_snapshot = columnar.load_columnar_snapshot(a_path)
+        self.b_snapshot = columnar.load_columnar_snapshot(b_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_write_columnar_snapshot_1(self):
+        """Verify snapshots are written as memory-mapped column files."""
+        snapshot_path = self.test_dir.joinpath("Actino_A.columns")
+        with self.subTest():
+            self.assertTrue(columnar.is_columnar_snapshot(snapshot_path))
+        with self.subTest():
+            self.assertTrue(snapshot_path.joinpath(
+                                        "gene.Notes.dict.npy").is_file())
+        with self.subTest():
+            self.assertFalse(snapshot_path.joinpath(
+                                        "gene.PhamID.dict.npy").is_file())
+        with self.subTest():
+            self.assertIsInstance(columnar.get_column(
+                                        self.a_snapshot, "gene.PhamID"),
+                                  np.memmap)
+        with self.subTest():
+            self.assertEqual(self.a_snapshot["version"],
+                             {"Version": 7, "SchemaVersion": 10})
+
+    def test_decode_column_1(self):
+        """Verify encoded columns decode to their database values."""
+        with self.subTest():
+            self.assertEqual(
+                    columnar.decode_column(self.a_snapshot, "gene.Notes"),
+                    ["terminase", "", None, "terminase", "portal protein",
+                     None, "", ""])
+        with self.subTest():
+            self.assertEqual(
+                    columnar.decode_column(self.a_snapshot, "gene.PhamID"),
+                    [gene["PhamID"] for gene in self.a_genes])
+
+    def test_encode_values_1(self):
+        """Verify values missing from a dictionary encode as NULL_CODE."""
+        codes = columnar.encode_values(self.a_snapshot, "gene.GeneID",
+                                       ["L5_CDS_2", "D29_CDS_1", "Z"])
+        with self.subTest():
+            self.assertEqual(codes[1], columnar.NULL_CODE)
+        with self.subTest():
+            self.assertEqual(codes[2], columnar.NULL_CODE)
+        with self.subTest():
+            self.assertEqual(columnar.decode_column(
+                                    self.a_snapshot, "gene.GeneID",
+                                    codes=codes[:1]),
+                             ["L5_CDS_2"])
+
+    def test_get_pham_sizes_1(self):
+        """Verify genes are counted per pham, excluding unphammed genes."""
+        with self.subTest():
+            self.assertEqual(columnar.get_pham_sizes(self.a_snapshot),
+                             {1: 2, 2: 3, 3: 2})
+        with self.subTest():
+            self.assertEqual(columnar.get_pham_sizes(self.a_snapshot,
+                                                     phams=[2]),
+                             {2: 3})
+
+    def test_get_discrepant_phams_1(self):
+        """Verify phams with multiple non-NULL annotations are found."""
+        with self.subTest():
+            self.assertEqual(columnar.get_discrepant_phams(self.a_snapshot),
+                             [2])
+        with self.subTest():
+            self.assertEqual(columnar.get_discrepant_phams(
+                                            self.a_snapshot, phams=[3, 1]),
+                             [])
+
+    def test_get_annotation_counts_1(self):
+        """Verify annotation histograms include NULL annotations."""
+        with self.subTest():
+            self.assertEqual(columnar.get_annotation_counts(
+                                                    self.a_snapshot, 2),
+                             {"": 2, "portal protein": 1})
+        with self.subTest():
+            self.assertEqual(columnar.get_annotation_counts(
+                                                    self.a_snapshot, 3),
+                             {None: 2})
+
+    def test_get_cluster_pham_matrix_1(self):
+        """Verify genes are counted per cluster and pham."""
+        clusters, phams, matrix = columnar.get_cluster_pham_matrix(
+                                                            self.a_snapshot)
+        with self.subTest():
+            self.assertEqual(clusters, [None, "A"])
+        with self.subTest():
+            self.assertEqual(phams, [1, 2, 3])
+        with self.subTest():
+            self.assertEqual(matrix.tolist(), [[0, 1, 0], [2, 2, 2]])
+
+    def test_find_phams_1(self):
+        """Verify reference phams are mapped to corresponding phams."""
+        mapped_phams = columnar.find_phams(self.a_snapshot, self.b_snapshot)
+        self.assertEqual(mapped_phams, {2: "4;7", 3: "5;6"})
+
+    def test_find_phams_2(self):
+        """Verify gene coverage percentages of corresponding phams."""
+        mapped_phams = columnar.find_phams(self.a_snapshot, self.b_snapshot,
+                                           phams=[2], show_per=True)
+        self.assertEqual(mapped_phams, {2: "4(66.7%);7(33.3%)"})
+
+    def test_find_phams_3(self):
+        """Verify phams are mapped by LocusTag, including missing genes."""
+        b_genes = self.b_genes[:2]
+        b_genes[1] = gene_row("Trixie_CDS_9", 4, b"", "L5_1")
+        b_path = build_snapshot(self.test_dir, "Actino_C", b_genes)
+        b_snapshot = columnar.load_columnar_snapshot(b_path)
+
+        mapped_phams = columnar.find_phams(self.a_snapshot, b_snapshot,
+                                           use_locus=True)
+        self.assertEqual(mapped_phams, {1: "1;4", 2: "None", 3: "None"})
+
+
+if __name__ == "__main__":
+    unittest.main()
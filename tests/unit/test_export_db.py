@@ -43,6 +43,7 @@ class TestExportMain(unittest.TestCase):
         self.mock_raw_bytes = Mock()
 
         self.mock_concatenate = Mock()
+        self.mock_compress = Mock()
 
         type(self.mock_args).pipeline = PropertyMock(
                                     return_value=self.mock_pipeline)
@@ -89,6 +90,8 @@ class TestExportMain(unittest.TestCase):
 
         type(self.mock_args).concatenate = PropertyMock(
                                     return_value=self.mock_concatenate)
+        type(self.mock_args).compress = PropertyMock(
+                                    return_value=self.mock_compress)
 
     @patch("pdm_utils.pipelines.revise.configfile.build_complete_config")
     @patch("pdm_utils.pipelines.export_db.execute_export")
@@ -130,7 +133,81 @@ class TestExportMain(unittest.TestCase):
                             verbose=self.mock_verbose, dump=self.mock_dump,
                             force=self.mock_force, threads=self.mock_threads,
                             db_name=self.mock_db_name, 
-                            phams_out=self.mock_phams_out)
+                            phams_out=self.mock_phams_out,
+                            compression=self.mock_compress)
+
+
+class TestBuildGenomeSeqRecord(unittest.TestCase):
+    def setUp(self):
+        self.phage_data = {"PhageID": "Trixie", "Name": "Trixie",
+                           "Accession": "", "HostGenus": "Mycobacterium",
+                           "Sequence": b"ATGCATGCATGCATGAAATTT",
+                           "Length": 21, "Cluster": "A", "Subcluster": "A2",
+                           "Status": "final", "RetrieveRecord": 1,
+                           "AnnotationAuthor": 1}
+        self.gene_data = [{"GeneID": "Trixie_CDS_1", "PhageID": "Trixie",
+                           "Start": 0, "Stop": 9, "Orientation": "F",
+                           "Name": "1", "Translation": b"MHA",
+                           "Notes": b"terminase", "LocusTag": None,
+                           "PhamID": 5, "Parts": 1}]
+        self.db_version = {"Version": 10, "SchemaVersion": 9}
+
+    def test_build_genome_seqrecord_1(self):
+        """Verify build_genome_seqrecord() builds a versioned SeqRecord
+        from compact table data.
+        """
+        record = export_db.build_genome_seqrecord(
+                                        self.phage_data, self.gene_data,
+                                        [], [], self.db_version)
+
+        self.assertEqual(record.name, "Trixie")
+        self.assertEqual(str(record.seq), "ATGCATGCATGCATGAAATTT")
+        self.assertIn("Database Version: 10; Schema Version: 9",
+                      record.annotations["comment"])
+
+        cds_features = [feature for feature in record.features
+                        if feature.type == "CDS"]
+        self.assertEqual(len(cds_features), 1)
+
+    @patch("pdm_utils.pipelines.export_db.mysqldb_basic.retrieve_data")
+    def test_get_genome_data_1(self, retrieve_data_mock):
+        """Verify get_genome_data() groups feature data by PhageID
+        in value order and skips missing genomes.
+        """
+        def retrieve_data(engine, column=None, query=None, id_list=None):
+            if query == export_db.PHAGE_QUERY:
+                return [self.phage_data]
+            elif query == export_db.GENE_QUERY:
+                return self.gene_data
+            return []
+
+        retrieve_data_mock.side_effect = retrieve_data
+
+        genome_data = export_db.get_genome_data(Mock(), ["Trixie", "L5"])
+
+        self.assertEqual(len(genome_data), 1)
+        self.assertEqual(genome_data[0],
+                         [self.phage_data, self.gene_data, [], []])
+
+    @patch("pdm_utils.pipelines.export_db.mysqldb_basic.retrieve_data")
+    def test_get_genome_data_2(self, retrieve_data_mock):
+        """Verify get_genome_data() reuses data cached for earlier groups.
+        """
+        retrieve_data_mock.side_effect = (
+                    lambda engine, column=None, query=None, id_list=None:
+                    [self.phage_data] if query == export_db.PHAGE_QUERY
+                    else [])
+        data_cache = {}
+
+        export_db.get_genome_data(Mock(), ["Trixie"], data_cache=data_cache)
+        retrieve_data_mock.reset_mock()
+        genome_data = export_db.get_genome_data(Mock(), ["Trixie"],
+                                                data_cache=data_cache)
+
+        with self.subTest():
+            retrieve_data_mock.assert_not_called()
+        with self.subTest():
+            self.assertEqual(genome_data, [[self.phage_data, [], [], []]])
 
 
 if __name__ == "__main__":
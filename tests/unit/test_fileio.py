@@ -0,0 +1,366 @@
+"""Unit tests for the file compression and database export functions in
+the fileio module."""
+import gzip
+import shutil
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from Bio import bgzf
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+from sqlalchemy import Column, create_engine, ForeignKey, Index, MetaData
+from sqlalchemy import Table, types
+from sqlalchemy.dialects import mysql
+
+from pdm_utils.functions import fileio
+
+TMPDIR_PREFIX = "pdm_utils_tests_unit_fileio_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location
+TMPDIR_BASE = "/tmp"
+
+
+def build_seqrecord(name, seq):
+    record = SeqRecord(Seq(seq), id=name, name=name)
+    record.annotations["molecule_type"] = "DNA"
+    return record
+
+
+class TestCompressedWriters(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.file_path = self.test_dir.joinpath("test.txt")
+        self.text = "".join([f">Seq{x}\nATGCATGCAATTGGCC\n"
+                             for x in range(20000)])
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_get_compressed_path_1(self):
+        """Verify get_compressed_path() appends compression suffixes."""
+        with self.subTest(compression=None):
+            self.assertEqual(fileio.get_compressed_path(self.file_path),
+                             self.file_path)
+        with self.subTest(compression="gzip"):
+            path = fileio.get_compressed_path(self.file_path, "gzip")
+            self.assertEqual(path.name, "test.txt.gz")
+        with self.subTest(compression="zstd"):
+            path = fileio.get_compressed_path(self.file_path, "zstd")
+            self.assertEqual(path.name, "test.txt.zst")
+
+    def test_get_compressed_path_2(self):
+        """Verify get_compressed_path() raises ValueError for unknown
+        compression formats.
+        """
+        with self.assertRaises(ValueError):
+            fileio.get_compressed_path(self.file_path, "rar")
+
+    def test_open_text_writer_1(self):
+        """Verify open_text_writer() writes multi-block gzip files that
+        decompress identically regardless of thread count.
+        """
+        for threads in [1, 4]:
+            with self.subTest(threads=threads):
+                with fileio.open_text_writer(self.file_path, "gzip",
+                                             threads=threads) as handle:
+                    handle.write(self.text)
+
+                path = self.file_path.with_name("test.txt.gz")
+                with gzip.open(path, mode="rt") as handle:
+                    self.assertEqual(handle.read(), self.text)
+
+    def test_open_text_writer_2(self):
+        """Verify open_text_writer() writes valid BGZF files."""
+        for threads in [1, 4]:
+            with self.subTest(threads=threads):
+                with fileio.open_text_writer(self.file_path, "bgzf",
+                                             threads=threads) as handle:
+                    handle.write(self.text)
+
+                path = self.file_path.with_name("test.txt.gz")
+                with bgzf.open(path, mode="rt") as handle:
+                    self.assertEqual(handle.read(len(self.text) + 1),
+                                     self.text)
+                with gzip.open(path, mode="rt") as handle:
+                    self.assertEqual(handle.read(), self.text)
+
+    def test_open_text_writer_3(self):
+        """Verify open_text_writer() writes uncompressed files without
+        compression.
+        """
+        with fileio.open_text_writer(self.file_path) as handle:
+            handle.write(self.text)
+
+        self.assertEqual(self.file_path.read_text(), self.text)
+
+
+class TestWriteSeqrecordsFromData(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.data_list = [("Trixie", "ATGC"), ("L5", "GGCC"), ("D29", "TTAA")]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_write_seqrecords_from_data_1(self):
+        """Verify records are written in data order by several processes."""
+        fileio.write_seqrecords_from_data(
+                        self.data_list, build_seqrecord, "fasta",
+                        self.test_dir, export_name="phages",
+                        concatenate=True, processes=2)
+
+        text = self.test_dir.joinpath("phages.fasta").read_text()
+        self.assertEqual([line for line in text.split("\n")
+                          if line.startswith(">")],
+                         [">Trixie <unknown description>",
+                          ">L5 <unknown description>",
+                          ">D29 <unknown description>"])
+
+    def test_write_seqrecords_from_data_2(self):
+        """Verify an error building a record is raised instead of
+        leaving the export waiting on results."""
+        self.data_list.append(("Alice",))
+        with self.assertRaises(TypeError):
+            fileio.write_seqrecords_from_data(
+                        self.data_list, build_seqrecord, "fasta",
+                        self.test_dir, processes=2)
+
+
+class TestWriteDatabase(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.alchemist = Mock()
+        self.alchemist.database = "test_db"
+
+        self.tables = {"phage": 2, "gene": 10, "version": 1}
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.mysqldump_command")
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.get_table_count")
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.get_tables")
+    def test_write_database_1(self, get_tables_mock, get_table_count_mock,
+                              mysqldump_command_mock):
+        """Verify write_database() joins table dumps in table order and
+        records row counts and checksums in the version file.
+        """
+        get_tables_mock.return_value = set(self.tables.keys())
+        get_table_count_mock.side_effect = (
+                                lambda engine, table: self.tables[table])
+        # Echo stands in for mysqldump by printing the table arguments.
+        mysqldump_command_mock.side_effect = lambda *args: ["echo"]
+
+        for compression in [None, "gzip"]:
+            with self.subTest(compression=compression):
+                fileio.write_database(self.alchemist, 5, self.test_dir,
+                                      compression=compression, threads=3)
+
+                sql_path = fileio.get_compressed_path(
+                                        self.test_dir.joinpath("test_db.sql"),
+                                        compression=compression)
+                if compression is None:
+                    sql_text = sql_path.read_text()
+                else:
+                    with gzip.open(sql_path, mode="rt") as handle:
+                        sql_text = handle.read()
+
+                self.assertEqual(sql_text, ("--skip-comments gene\n"
+                                            "--skip-comments phage\n"
+                                            "--skip-comments version\n"))
+
+                version_path = self.test_dir.joinpath("test_db.version")
+                version_lines = version_path.read_text().splitlines()
+                self.assertEqual(version_lines[0], "5")
+                self.assertTrue(version_lines[1].startswith(
+                                            f"file\t{sql_path.name}\tsha256:"))
+                self.assertTrue(version_lines[2].startswith(
+                                            "table\tgene\t10\tsha256:"))
+                self.assertEqual(len(version_lines), 5)
+
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.mysqldump_command")
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.get_table_count")
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.get_tables")
+    def test_write_database_2(self, get_tables_mock, get_table_count_mock,
+                              mysqldump_command_mock):
+        """Verify write_database() raises OSError when mysqldump fails."""
+        get_tables_mock.return_value = set(self.tables.keys())
+        get_table_count_mock.side_effect = (
+                                lambda engine, table: self.tables[table])
+        mysqldump_command_mock.side_effect = lambda *args: ["false"]
+
+        with self.assertRaises(OSError):
+            fileio.write_database(self.alchemist, 5, self.test_dir)
+
+        self.assertFalse(self.test_dir.joinpath("test_db.version").exists())
+
+
+    @patch("pdm_utils.functions.fileio.dump_table")
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.get_table_count")
+    def test_dump_tables_1(self, get_table_count_mock, dump_table_mock):
+        """Verify dump_tables() counts rows and dumps tables while all
+        tables are read locked.
+        """
+        connection = self.alchemist.engine.connect.return_value
+        get_table_count_mock.side_effect = (
+                                lambda engine, table: self.tables[table])
+        dump_table_mock.return_value = "digest"
+        tables = sorted(self.tables.keys())
+        part_paths = {table: self.test_dir.joinpath(f"{table}.sql")
+                      for table in tables}
+
+        row_counts, digests = fileio.dump_tables(self.alchemist, tables,
+                                                 part_paths, threads=3)
+
+        with self.subTest():
+            self.assertEqual(row_counts, self.tables)
+        with self.subTest():
+            self.assertEqual(connection.execute.call_args_list[0][0][0],
+                             "LOCK TABLES `gene` READ, `phage` READ, "
+                             "`version` READ")
+        with self.subTest():
+            self.assertEqual(connection.execute.call_args_list[-1][0][0],
+                             "UNLOCK TABLES")
+        with self.subTest():
+            self.assertEqual(get_table_count_mock.call_args[0][0],
+                             connection)
+        with self.subTest():
+            self.assertEqual(dump_table_mock.call_args[1]["threads"], 1)
+
+    @patch("pdm_utils.functions.fileio.dump_table")
+    @patch("pdm_utils.functions.fileio.mysqldb_basic.get_table_count")
+    def test_dump_tables_2(self, get_table_count_mock, dump_table_mock):
+        """Verify the thread budget is split between table dumps and
+        their compression.
+        """
+        get_table_count_mock.side_effect = (
+                                lambda engine, table: self.tables[table])
+        dump_table_mock.return_value = "digest"
+        tables = sorted(self.tables.keys())
+        part_paths = {table: self.test_dir.joinpath(f"{table}.sql")
+                      for table in tables}
+
+        fileio.dump_tables(self.alchemist, tables, part_paths,
+                           compression="gzip", threads=8)
+
+        with self.subTest():
+            self.assertEqual(dump_table_mock.call_count, 3)
+        with self.subTest():
+            self.assertEqual(dump_table_mock.call_args[1]["threads"], 2)
+
+
+class TestWriteSqliteDatabase(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.metadata = MetaData()
+        phage = Table("phage", self.metadata,
+                      Column("PhageID", mysql.VARCHAR(25, collation="utf8_bin"),
+                             primary_key=True),
+                      Column("Sequence", mysql.MEDIUMBLOB),
+                      Column("Status", mysql.ENUM("draft", "final")))
+        gene = Table("gene", self.metadata,
+                     Column("GeneID", mysql.VARCHAR(35), primary_key=True),
+                     Column("PhageID", mysql.VARCHAR(25),
+                            ForeignKey("phage.PhageID")),
+                     Column("PhamID", mysql.INTEGER(11)))
+        Index("PhageID", gene.c.PhageID)
+
+        self.source_engine = create_engine("sqlite://")
+        source_metadata = fileio.build_sqlite_metadata(self.metadata)
+        source_metadata.create_all(self.source_engine)
+        self.source_engine.execute(
+                        source_metadata.tables["phage"].insert(),
+                        [{"PhageID": "L5", "Sequence": b"ATGC",
+                          "Status": "final"}])
+        self.source_engine.execute(
+                        source_metadata.tables["gene"].insert(),
+                        [{"GeneID": f"L5_{x}", "PhageID": "L5", "PhamID": x}
+                         for x in range(5)])
+
+        self.alchemist = Mock()
+        self.alchemist.database = "Actino_Draft"
+        self.alchemist.metadata = self.metadata
+        self.alchemist.engine = self.source_engine
+
+    def tearDown(self):
+        self.source_engine.dispose()
+        shutil.rmtree(self.test_dir)
+
+    def test_get_sqlite_type_1(self):
+        """Verify MySQL column types are converted to generic types."""
+        with self.subTest():
+            sqlite_type = fileio.get_sqlite_type(mysql.VARCHAR(
+                                                25, collation="utf8_bin"))
+            self.assertIsInstance(sqlite_type, types.String)
+            self.assertIsNone(sqlite_type.collation)
+        with self.subTest():
+            sqlite_type = fileio.get_sqlite_type(mysql.MEDIUMBLOB())
+            self.assertIsInstance(sqlite_type, types.LargeBinary)
+        with self.subTest():
+            sqlite_type = fileio.get_sqlite_type(mysql.ENUM("draft", "final"))
+            self.assertEqual(sqlite_type.length, 5)
+
+    def test_build_sqlite_metadata_1(self):
+        """Verify index names are prefixed with their table names."""
+        sqlite_metadata = fileio.build_sqlite_metadata(self.metadata)
+        index_names = [index.name for index in
+                       sqlite_metadata.tables["gene"].indexes]
+        self.assertEqual(index_names, ["gene_PhageID"])
+
+    def test_write_sqlite_database_1(self):
+        """Verify data, keys, and indexes are copied to the snapshot."""
+        sqlite_path = fileio.write_sqlite_database(
+                                self.alchemist, self.test_dir, chunk_size=2)
+
+        self.assertEqual(sqlite_path,
+                         self.test_dir.joinpath("Actino_Draft.sqlite"))
+
+        engine = create_engine(f"sqlite:///{sqlite_path}")
+        gene_rows = engine.execute("SELECT * FROM gene").fetchall()
+        phage_rows = engine.execute("SELECT * FROM phage").fetchall()
+        indexes = engine.execute("SELECT name FROM sqlite_master "
+                                 "WHERE type = 'index' AND "
+                                 "sql IS NOT NULL").fetchall()
+        engine.dispose()
+
+        with self.subTest():
+            self.assertEqual(len(gene_rows), 5)
+        with self.subTest():
+            self.assertEqual(phage_rows, [("L5", b"ATGC", "final")])
+        with self.subTest():
+            self.assertEqual(indexes, [("gene_PhageID",)])
+
+    def test_write_sqlite_database_2(self):
+        """Verify the snapshot is compressed and the raw file removed."""
+        sqlite_path = fileio.write_sqlite_database(
+                                self.alchemist, self.test_dir,
+                                db_name="snapshot", compression="gzip")
+
+        with self.subTest():
+            self.assertEqual(sqlite_path.name, "snapshot.sqlite.gz")
+        with self.subTest():
+            with gzip.open(sqlite_path, "rb") as handle:
+                self.assertEqual(handle.read(15), b"SQLite format 3")
+        with self.subTest():
+            self.assertFalse(self.test_dir.joinpath(
+                                            "snapshot.sqlite").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -297,6 +297,88 @@ class TestFilter(unittest.TestCase):
         check_mock.assert_called()
         build_distinct_mock.assert_not_called()
 
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.get_columns")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_retrieve_2(self, check_mock, get_columns_mock,
+                        build_distinct_mock, execute_mock):
+        """Verify that retrieve() queries once per column and separates
+        the data for each value.
+        """
+        type(self.mock_key).type = PropertyMock(return_value=Mock(
+                                                    python_type=str))
+        cluster_column = Mock(spec=Column)
+        cluster_column.name = "Cluster"
+        cluster_column.type.python_type = str
+        notes_column = Mock(spec=Column)
+        notes_column.name = "Notes"
+        notes_column.type.python_type = bytes
+        get_columns_mock.return_value = [cluster_column, notes_column]
+
+        execute_mock.side_effect = [[("Trixie", "A"), ("l5", "A")],
+                                    [("Trixie", b"terminase"),
+                                     ("Trixie", b"portal"),
+                                     ("L5", None)]]
+
+        self.db_filter._values = ["Trixie", "L5", "D29"]
+        data = self.db_filter.retrieve(["phage.Cluster", "gene.Notes"])
+
+        self.assertEqual(build_distinct_mock.call_count, 2)
+        self.assertEqual(execute_mock.call_count, 2)
+        self.assertEqual(data, {
+                    "Trixie": {"Cluster": ["A"],
+                               "Notes": ["terminase", "portal"]},
+                    "L5": {"Cluster": ["A"], "Notes": [None]},
+                    "D29": {"Cluster": [], "Notes": []}})
+
+    @patch("pdm_utils.classes.filter.q.execute")
+    @patch("pdm_utils.classes.filter.q.build_distinct")
+    @patch("pdm_utils.classes.filter.Filter.get_column")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_group_1(self, check_mock, get_column_mock,
+                     build_distinct_mock, execute_mock):
+        """Verify that group() partitions values from a single query.
+        """
+        type(self.mock_key).type = PropertyMock(return_value=Mock(
+                                                    python_type=str))
+        column = Mock(spec=Column)
+        column.type.python_type = str
+        get_column_mock.return_value = column
+
+        execute_mock.return_value = [("A", "Trixie"), ("a", "L5"),
+                                     ("C", "Alice"), (None, "D29")]
+
+        self.db_filter._values = ["Trixie", "L5", "Alice", "D29"]
+        groups = self.db_filter.group("phage.Cluster")
+
+        execute_mock.assert_called_once()
+        self.assertEqual(groups, {"A": ["Trixie", "L5"], "C": ["Alice"],
+                                  None: ["D29"]})
+
+    @patch("pdm_utils.classes.filter.q.iter_rows")
+    @patch("pdm_utils.classes.filter.q.build_select")
+    @patch("pdm_utils.classes.filter.Filter.get_columns")
+    @patch("pdm_utils.classes.filter.Filter.check")
+    def test_iter_select_1(self, check_mock, get_columns_mock,
+                           build_select_mock, iter_rows_mock):
+        """Verify that iter_select() streams rows with the Filter values.
+        """
+        get_columns_mock.return_value = ["Column"]
+        build_select_mock.return_value = "Select"
+        iter_rows_mock.return_value = iter([{"Column": 1}])
+
+        self.db_filter._values = ["Trixie"]
+        rows = self.db_filter.iter_select("Column", chunk_size=10)
+
+        build_select_mock.assert_called_with(self.mock_graph, ["Column"],
+                                             add_in=self.mock_key)
+        iter_rows_mock.assert_called_with(self.mock_engine, "Select",
+                                          in_column=self.mock_key,
+                                          values=["Trixie"], chunk_size=10,
+                                          return_dict=True)
+        self.assertEqual(list(rows), [{"Column": 1}])
+
     @patch("pdm_utils.classes.filter.Filter.check")
     @patch("pdm_utils.classes.filter.Filter.build_values")
     def test_refresh_1(self, build_values_mock, check_mock):
@@ -0,0 +1,141 @@
+"""Unit tests for the GeneNeighborhood class."""
+import unittest
+from unittest.mock import Mock
+
+from sqlalchemy import Column, create_engine, Integer, LargeBinary, MetaData
+from sqlalchemy import String, Table
+
+from pdm_utils.classes.geneneighborhood import GeneNeighborhood
+from pdm_utils.functions import annotation
+
+
+class TestGeneNeighborhood(unittest.TestCase):
+    def setUp(self):
+        self.neighborhood = GeneNeighborhood()
+        self.neighborhood.load([("L5_1", "L5", 1, b"terminase"),
+                                ("L5_gp2", "L5", 2, b""),
+                                ("L5_3", "L5", 1, None),
+                                ("Trixie_1", "Trixie", 2, b"portal"),
+                                ("Trixie_2", "Trixie", 1, b"terminase")])
+
+    def test_get_relative_gene_1(self):
+        """Verify neighbors are found for non-standard GeneIDs."""
+        with self.subTest():
+            self.assertEqual(self.neighborhood.get_relative_gene("L5_1", 1),
+                             "L5_gp2")
+        with self.subTest():
+            self.assertEqual(self.neighborhood.get_relative_gene("L5_3", -2),
+                             "L5_1")
+
+    def test_get_relative_gene_2(self):
+        """Verify neighbors are not found across genome boundaries."""
+        with self.subTest():
+            self.assertIsNone(self.neighborhood.get_relative_gene("L5_3", 1))
+        with self.subTest():
+            self.assertIsNone(self.neighborhood.get_relative_gene(
+                                                            "Trixie_1", -1))
+        with self.subTest():
+            self.assertIsNone(self.neighborhood.get_relative_gene("L5_1", -1))
+        with self.subTest():
+            self.assertIsNone(self.neighborhood.get_relative_gene("D29_1", 1))
+
+    def test_get_relative_gene_3(self):
+        """Verify GeneIDs are matched case-insensitively."""
+        self.assertEqual(self.neighborhood.get_relative_gene("l5_GP2", 1),
+                         "L5_3")
+
+    def test_get_adjacent_phams_1(self):
+        """Verify the phams of adjacent genes are found."""
+        with self.subTest():
+            self.assertEqual(self.neighborhood.get_adjacent_phams("L5_gp2"),
+                             (1, 1))
+        with self.subTest():
+            self.assertEqual(self.neighborhood.get_adjacent_phams("Trixie_2"),
+                             (2, None))
+
+    def test_get_genes_adjacent_to_pham_1(self):
+        """Verify genes adjacent to all pham members are found."""
+        adjacent_genes = self.neighborhood.get_genes_adjacent_to_pham(1)
+        self.assertEqual(adjacent_genes,
+                         (["L5_gp2", "Trixie_1"], ["L5_gp2"]))
+
+    def test_get_count_adjacent_annotations_to_pham_1(self):
+        """Verify annotation helpers count from the neighborhood index."""
+        alchemist = Mock()
+        counts = annotation.get_count_adjacent_annotations_to_pham(
+                                        alchemist, 1,
+                                        neighborhood=self.neighborhood)
+        with self.subTest():
+            self.assertEqual(counts, ({"": 1, "portal": 1}, {"": 1}))
+        with self.subTest():
+            alchemist.engine.execute.assert_not_called()
+
+    def test_build_1(self):
+        """Verify genes are indexed by PhageID and Start coordinate."""
+        metadata = MetaData()
+        gene = Table("gene", metadata,
+                     Column("GeneID", String(35), primary_key=True),
+                     Column("PhageID", String(25)),
+                     Column("PhamID", Integer),
+                     Column("Notes", LargeBinary),
+                     Column("Start", Integer),
+                     Column("Stop", Integer))
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+        engine.execute(gene.insert(), [
+                {"GeneID": "L5_2", "PhageID": "L5", "PhamID": 2,
+                 "Notes": b"", "Start": 500, "Stop": 900},
+                {"GeneID": "L5_1", "PhageID": "L5", "PhamID": 1,
+                 "Notes": b"", "Start": 10, "Stop": 400}])
+
+        alchemist = Mock()
+        alchemist.engine = engine
+        alchemist.metadata = metadata
+
+        neighborhood = GeneNeighborhood()
+        neighborhood.build(alchemist)
+        engine.dispose()
+
+        with self.subTest():
+            self.assertEqual(neighborhood.geneids, ["L5_1", "L5_2"])
+        with self.subTest():
+            self.assertEqual(neighborhood.get_adjacent_genes("L5_1"),
+                             (None, "L5_2"))
+
+    def test_build_2(self):
+        """Verify only the genomes of the requested phams are indexed."""
+        metadata = MetaData()
+        gene = Table("gene", metadata,
+                     Column("GeneID", String(35), primary_key=True),
+                     Column("PhageID", String(25)),
+                     Column("PhamID", Integer),
+                     Column("Notes", LargeBinary),
+                     Column("Start", Integer),
+                     Column("Stop", Integer))
+        engine = create_engine("sqlite://")
+        metadata.create_all(engine)
+        engine.execute(gene.insert(), [
+                {"GeneID": "L5_2", "PhageID": "L5", "PhamID": 2,
+                 "Notes": b"", "Start": 500, "Stop": 900},
+                {"GeneID": "L5_1", "PhageID": "L5", "PhamID": 1,
+                 "Notes": b"", "Start": 10, "Stop": 400},
+                {"GeneID": "Trixie_1", "PhageID": "Trixie", "PhamID": 3,
+                 "Notes": b"", "Start": 10, "Stop": 400}])
+
+        alchemist = Mock()
+        alchemist.engine = engine
+        alchemist.metadata = metadata
+
+        neighborhood = GeneNeighborhood()
+        neighborhood.build(alchemist, phams=[2])
+        engine.dispose()
+
+        with self.subTest():
+            self.assertEqual(neighborhood.geneids, ["L5_1", "L5_2"])
+        with self.subTest():
+            self.assertEqual(neighborhood.get_adjacent_phams("L5_2"),
+                             (1, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
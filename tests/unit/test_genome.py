@@ -1665,6 +1665,18 @@ class TestGenomeClass2(unittest.TestCase):
         with self.subTest():
             self.assertEqual(self.src2.id, "New_SRC_1")
 
+    def test_seq_hash_1(self):
+        """Verify the sequence digest is computed from the current sequence."""
+        gnm = genome.Genome()
+        gnm.seq = Seq("atgc", IUPAC.ambiguous_dna)
+        seq_hash1 = gnm.seq_hash
+        gnm.set_sequence("ATGC")
+        with self.subTest():
+            self.assertEqual(gnm.seq_hash, seq_hash1)
+        gnm.set_sequence("ATGCA")
+        with self.subTest():
+            self.assertNotEqual(gnm.seq_hash, seq_hash1)
+
 
 
 
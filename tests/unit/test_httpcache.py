@@ -0,0 +1,206 @@
+"""Unit tests for the HTTPCache class."""
+import shutil
+import time
+import unittest
+import urllib.error
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from pdm_utils.classes.httpcache import HTTPCache
+
+TMPDIR_PREFIX = "pdm_utils_tests_unit_httpcache_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location
+TMPDIR_BASE = "/tmp"
+
+URL = "https://phagesdb.org/api/host_genera/"
+URLOPEN = "pdm_utils.classes.httpcache.urllib.request.urlopen"
+
+
+def build_response(content, headers=None):
+    response = MagicMock()
+    response.read.return_value = content
+    response.headers = headers if headers is not None else {}
+    response.__enter__.return_value = response
+    return response
+
+
+def build_http_error(code):
+    return urllib.error.HTTPError(URL, code, "", {}, None)
+
+
+class TestHTTPCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.cache = HTTPCache(self.test_dir.joinpath("cache"), ttl=60)
+        self.headers = {"ETag": '"abc"',
+                        "Last-Modified": "Sun, 18 Oct 2026 00:00:00 GMT"}
+
+    def tearDown(self):
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+
+    def expire_entry(self):
+        metadata, content = self.cache.read_entry(URL)
+        metadata["time"] = time.time() - 120
+        self.cache.write_entry(URL, metadata)
+
+    @patch(URLOPEN)
+    def test_get_1(self, urlopen_mock):
+        """Verify a fresh response is retrieved once and then cached."""
+        urlopen_mock.return_value = build_response(b"data", self.headers)
+        content1 = self.cache.get(URL)
+        content2 = self.cache.get(URL)
+        with self.subTest():
+            self.assertEqual(content1, b"data")
+        with self.subTest():
+            self.assertEqual(content2, b"data")
+        with self.subTest():
+            self.assertEqual(urlopen_mock.call_count, 1)
+
+    @patch(URLOPEN)
+    def test_get_2(self, urlopen_mock):
+        """Verify a stale response is revalidated with its validators."""
+        urlopen_mock.return_value = build_response(b"data", self.headers)
+        self.cache.get(URL)
+        self.expire_entry()
+
+        urlopen_mock.side_effect = build_http_error(304)
+        content = self.cache.get(URL)
+        request = urlopen_mock.call_args[0][0]
+        with self.subTest():
+            self.assertEqual(content, b"data")
+        with self.subTest():
+            self.assertEqual(request.get_header("If-none-match"), '"abc"')
+        with self.subTest():
+            self.assertEqual(request.get_header("If-modified-since"),
+                             self.headers["Last-Modified"])
+        with self.subTest():
+            metadata = self.cache.read_entry(URL)[0]
+            self.assertTrue(self.cache.is_fresh(metadata))
+
+    @patch(URLOPEN)
+    def test_get_3(self, urlopen_mock):
+        """Verify a changed response replaces the cached response."""
+        urlopen_mock.return_value = build_response(b"data", self.headers)
+        self.cache.get(URL)
+        urlopen_mock.return_value = build_response(b"new data")
+
+        content = self.cache.get(URL, ttl=0)
+        with self.subTest():
+            self.assertEqual(content, b"new data")
+        with self.subTest():
+            self.assertEqual(self.cache.read_entry(URL)[1], b"new data")
+        with self.subTest():
+            self.assertIsNone(self.cache.read_entry(URL)[0]["etag"])
+
+    @patch(URLOPEN)
+    def test_get_4(self, urlopen_mock):
+        """Verify a stale response is used if the server can not be
+        reached."""
+        urlopen_mock.return_value = build_response(b"data")
+        self.cache.get(URL)
+        self.expire_entry()
+
+        urlopen_mock.side_effect = urllib.error.URLError("timed out")
+        with self.assertLogs("pdm_utils.classes.httpcache",
+                             level="WARNING") as logs:
+            content = self.cache.get(URL)
+        with self.subTest():
+            self.assertEqual(content, b"data")
+        with self.subTest():
+            self.assertIn("from 2 minutes ago", logs.output[0])
+
+    @patch(URLOPEN)
+    def test_get_8(self, urlopen_mock):
+        """Verify a response that is always revalidated is used with a
+        warning if the server returns a server error."""
+        urlopen_mock.return_value = build_response(b"data")
+        self.cache.get(URL, ttl=0)
+
+        urlopen_mock.side_effect = build_http_error(503)
+        with self.assertLogs("pdm_utils.classes.httpcache",
+                             level="WARNING") as logs:
+            content = self.cache.get(URL, ttl=0)
+        with self.subTest():
+            self.assertEqual(content, b"data")
+        with self.subTest():
+            self.assertIn(URL, logs.output[0])
+
+    @patch(URLOPEN)
+    def test_get_5(self, urlopen_mock):
+        """Verify client errors are raised instead of using the cache."""
+        urlopen_mock.return_value = build_response(b"data")
+        self.cache.get(URL)
+        self.expire_entry()
+
+        urlopen_mock.side_effect = build_http_error(404)
+        with self.assertRaises(urllib.error.HTTPError):
+            self.cache.get(URL)
+
+    @patch(URLOPEN)
+    def test_get_6(self, urlopen_mock):
+        """Verify stale responses are used without requests when offline."""
+        urlopen_mock.return_value = build_response(b"data")
+        self.cache.get(URL)
+        self.expire_entry()
+        self.cache.offline = True
+
+        content = self.cache.get(URL)
+        with self.subTest():
+            self.assertEqual(content, b"data")
+        with self.subTest():
+            self.assertEqual(urlopen_mock.call_count, 1)
+
+    @patch(URLOPEN)
+    def test_get_7(self, urlopen_mock):
+        """Verify an error is raised for uncached responses when offline."""
+        self.cache.offline = True
+        with self.subTest():
+            with self.assertRaises(urllib.error.URLError):
+                self.cache.get(URL)
+        with self.subTest():
+            urlopen_mock.assert_not_called()
+
+    @patch(URLOPEN)
+    def test_clear_1(self, urlopen_mock):
+        """Verify cached responses are removed."""
+        urlopen_mock.return_value = build_response(b"data")
+        self.cache.get(URL)
+        self.cache.clear()
+        self.assertIsNone(self.cache.read_entry(URL))
+
+    @patch(URLOPEN)
+    def test_prune_1(self, urlopen_mock):
+        """Verify only responses older than the maximum age are removed."""
+        other_url = URL + "Mycobacterium/"
+        urlopen_mock.return_value = build_response(b"data")
+        self.cache.get(URL)
+        self.cache.get(other_url)
+        self.expire_entry()
+
+        self.cache.prune(max_age=90)
+        with self.subTest():
+            self.assertIsNone(self.cache.read_entry(URL))
+        with self.subTest():
+            self.assertIsNotNone(self.cache.read_entry(other_url))
+        with self.subTest():
+            metadata_path, content_path = self.cache.get_entry_paths(URL)
+            self.assertFalse(content_path.exists())
+
+    @patch(URLOPEN)
+    def test_prune_2(self, urlopen_mock):
+        """Verify the cache is pruned before the first response is
+        written."""
+        urlopen_mock.return_value = build_response(b"data")
+        self.cache.get(URL)
+        self.expire_entry()
+
+        cache = HTTPCache(self.cache.cache_dir, ttl=60, max_age=90)
+        cache.get(URL + "Mycobacterium/")
+        self.assertIsNone(cache.read_entry(URL))
+
+
+if __name__ == "__main__":
+    unittest.main()
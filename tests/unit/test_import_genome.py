@@ -16,6 +16,7 @@ from pdm_utils.classes import cds, trna, tmrna
 from pdm_utils.classes import genomepair
 from pdm_utils.classes import ticket
 from pdm_utils.constants import constants
+from pdm_utils.functions import basic
 from pdm_utils.functions import eval_modes
 from pdm_utils.pipelines import import_genome
 
@@ -316,7 +317,7 @@ class TestImportGenome2(unittest.TestCase):
 
         self.null_set = set([""])
         self.id_set = set(["Trixie"])
-        self.seq_set = set(["AATTAA"])
+        self.seq_hash_set = set([basic.get_seq_hash("AATTAA")])
         self.host_set = set(["Mycobacterium"])
         self.cluster_set = set(["A", "B"])
         self.subcluster_set = set(["A1, A2"])
@@ -637,8 +638,8 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.tmrna_features = [self.tmrna1, self.tmrna2]
 
         self.id_set = set(["L5", "RedRock"])
-        self.seq_set = set([Seq("ATGC", IUPAC.ambiguous_dna),
-                           Seq("TTTT", IUPAC.ambiguous_dna)])
+        self.seq_hash_set = set([basic.get_seq_hash("ATGC"),
+                                 basic.get_seq_hash("TTTT")])
         self.host_set = set(["Mycobacterium", "Gordonia"])
         self.cluster_set = set(["A", "B", "C"])
         self.subcluster_set = set(["A1", "A2", "A3"])
@@ -656,7 +657,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum)
 
@@ -669,7 +670,7 @@ class TestImportGenome4(unittest.TestCase):
         'annotation_author' = 1."""
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 1)
 
@@ -684,7 +685,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 2)
 
@@ -699,7 +700,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 1)
 
@@ -715,7 +716,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 2)
 
@@ -730,7 +731,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 3)
 
@@ -745,7 +746,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 1)
 
@@ -760,7 +761,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 3)
 
@@ -775,7 +776,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 3)
 
@@ -790,7 +791,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 2)
 
@@ -805,7 +806,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ABC123"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         self.assertEqual(len(self.gnm.evaluations), self.check_sum - 1)
 
@@ -818,7 +819,7 @@ class TestImportGenome4(unittest.TestCase):
         'annotation_author' = 1."""
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 0)
@@ -829,7 +830,7 @@ class TestImportGenome4(unittest.TestCase):
         self.id_set.add("Trixie")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -840,7 +841,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.id = ""
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 4)
@@ -851,7 +852,7 @@ class TestImportGenome4(unittest.TestCase):
         self.id_set.add("Trixie_Draft")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -862,18 +863,18 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.name = ""
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 2)
 
     def test_check_genome_17(self):
         """Verify correct number of errors are produced using:
-        'add' ticket type and 'seq' in seq_set."""
+        'add' ticket type and 'seq' in seq_hash_set."""
         self.gnm.seq = Seq("ATGC", IUPAC.ambiguous_dna)
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -884,7 +885,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.seq = Seq("", IUPAC.ambiguous_dna)
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -899,7 +900,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.name = "Trixie"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -911,7 +912,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "BBBBB"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 0)
@@ -923,7 +924,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "AAAAA"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -940,7 +941,7 @@ class TestImportGenome4(unittest.TestCase):
         self.id_set.add("Trixie")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 0)
@@ -956,7 +957,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.seq = Seq("ATGC", IUPAC.ambiguous_dna)
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -973,7 +974,7 @@ class TestImportGenome4(unittest.TestCase):
         self.id_set.add("Trixie")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -992,7 +993,7 @@ class TestImportGenome4(unittest.TestCase):
         self.id_set.add("Trixie")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1004,7 +1005,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.name = "Trixie"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1016,7 +1017,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._cds_descriptions_tally = 1
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1027,7 +1028,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.accession = "ZZZZ"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1051,7 +1052,7 @@ class TestImportGenome4(unittest.TestCase):
         self.cds2.orientation = "R"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1075,7 +1076,7 @@ class TestImportGenome4(unittest.TestCase):
         self.trna1.orientation = "R"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1099,7 +1100,7 @@ class TestImportGenome4(unittest.TestCase):
         self.trna1.orientation = "R"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1117,7 +1118,7 @@ class TestImportGenome4(unittest.TestCase):
         self.id_set.add("Trixie_Draft")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1135,7 +1136,7 @@ class TestImportGenome4(unittest.TestCase):
         self.id_set.add("Trixie")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1153,7 +1154,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._organism_name = "Trixie_Draft"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1164,7 +1165,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.annotation_status = "invalid"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1176,7 +1177,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.authors = "none"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1187,7 +1188,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.retrieve_record = -1
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1200,7 +1201,7 @@ class TestImportGenome4(unittest.TestCase):
         self.subcluster_set.add("Z1")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1213,7 +1214,7 @@ class TestImportGenome4(unittest.TestCase):
         self.cluster_set.add("Z")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1224,7 +1225,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.subcluster = "none"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 0)
@@ -1235,7 +1236,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.translation_table = 1
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1246,7 +1247,7 @@ class TestImportGenome4(unittest.TestCase):
         self.host_set = {"Gordonia"}
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1260,7 +1261,7 @@ class TestImportGenome4(unittest.TestCase):
         self.subcluster_set.add("Z1")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 2)
@@ -1274,7 +1275,7 @@ class TestImportGenome4(unittest.TestCase):
         self.subcluster_set.add("Z")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 2)
@@ -1288,7 +1289,7 @@ class TestImportGenome4(unittest.TestCase):
         self.subcluster_set.add("X1")
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1299,7 +1300,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.date = constants.EMPTY_DATE
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1310,7 +1311,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.gc = -1
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1321,7 +1322,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.gc = 101
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1332,7 +1333,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.length = 0
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1343,7 +1344,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._cds_features_tally = 0
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1354,7 +1355,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.seq = Seq("CCCCC-C", IUPAC.ambiguous_dna)
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1365,7 +1366,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._description_name = "L5"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1376,7 +1377,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._source_name = "L5"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1387,7 +1388,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._organism_name = "L5"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1398,7 +1399,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._description_host_genus = "Gordonia"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1409,7 +1410,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._source_host_genus = "Gordonia"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1420,7 +1421,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm._organism_host_genus = "Gordonia"
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1431,7 +1432,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.authors = "Doe,J., Hatful,G.F., John;R., Smith;."
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1442,7 +1443,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.authors = "Doe,J., Hatfull,G.F., LASTNAME, John;R., Smith;."
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1454,7 +1455,7 @@ class TestImportGenome4(unittest.TestCase):
         self.gnm.authors = "Doe,J., Hatfull,G.F., John;R., Smith;."
         import_genome.check_genome(
             self.gnm, self.tkt.type, self.tkt.eval_flags,
-            self.id_set, self.seq_set, self.host_set,
+            self.id_set, self.seq_hash_set, self.host_set,
             self.cluster_set, self.subcluster_set, self.accession_set)
         count = count_status(self.gnm, "error", "warning")
         self.assertEqual(count, 1)
@@ -1684,7 +1685,8 @@ class TestImportGenome6(unittest.TestCase):
         self.null_set = set(["", "none", None])
         self.accession_set = set(["ABC123", "XYZ456"])
         self.phage_id_set = set(["L5", "Trixie"])
-        self.seq_set = set(["AATTGG", "ATGC"])
+        self.seq_hash_set = set([basic.get_seq_hash("AATTGG"),
+                                 basic.get_seq_hash("ATGC")])
         self.host_genus_set = set(["Mycobacterium", "Gordonia"])
         self.cluster_set = set(["A", "B"])
         self.subcluster_set = set(["A2", "B2"])
@@ -1702,7 +1704,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1722,7 +1725,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1743,7 +1747,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1777,7 +1782,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1814,7 +1820,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1837,7 +1844,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1864,7 +1872,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1896,7 +1905,8 @@ class TestImportGenome6(unittest.TestCase):
                 self.bndl,
                 accession_set=self.accession_set,
                 phage_id_set=self.phage_id_set,
-                seq_set=self.seq_set, host_genus_set=self.host_genus_set,
+                seq_hash_set=self.seq_hash_set,
+                host_genus_set=self.host_genus_set,
                 cluster_set=self.cluster_set,
                 subcluster_set=self.subcluster_set,
                 file_ref="flat_file", ticket_ref="ticket",
@@ -1909,7 +1919,7 @@ class TestImportGenome6(unittest.TestCase):
 
 
 
-    @patch("pdm_utils.functions.mysqldb.execute_transaction")
+    @patch("pdm_utils.functions.mysqldb.execute_genome_inserts")
     @patch("pdm_utils.classes.genome.Genome.clear_locus_tags")
     def test_import_into_db_1(self, clear_mock, execute_mock):
         """Verify import_into_db works using a bundle with:
@@ -1927,7 +1937,7 @@ class TestImportGenome6(unittest.TestCase):
             self.assertEqual(len(self.bndl.evaluations), 0)
 
 
-    @patch("pdm_utils.functions.mysqldb.execute_transaction")
+    @patch("pdm_utils.functions.mysqldb.execute_genome_inserts")
     def test_import_into_db_2(self, execute_mock):
         """Verify import_into_db works using a bundle with:
         0 errors, genome present, prod_run = False."""
@@ -1945,7 +1955,7 @@ class TestImportGenome6(unittest.TestCase):
             self.assertEqual(len(self.bndl.evaluations), 0)
 
 
-    @patch("pdm_utils.functions.mysqldb.execute_transaction")
+    @patch("pdm_utils.functions.mysqldb.execute_genome_inserts")
     def test_import_into_db_3(self, execute_mock):
         """Verify import_into_db works using a bundle with:
         0 errors, genome present, prod_run = True, execution = failed."""
@@ -1964,7 +1974,7 @@ class TestImportGenome6(unittest.TestCase):
             self.assertEqual(len(self.bndl.evaluations), 1)
 
 
-    @patch("pdm_utils.functions.mysqldb.execute_transaction")
+    @patch("pdm_utils.functions.mysqldb.execute_genome_inserts")
     def test_import_into_db_4(self, execute_mock):
         """Verify import_into_db works using a bundle with:
         0 errors, genome present, prod_run = True, execution = successful."""
@@ -1997,6 +2007,51 @@ class TestImportGenome6(unittest.TestCase):
         self.assertTrue(clear_mock.called)
 
 
+    @patch("pdm_utils.functions.pham_summary.get_genome_phams")
+    @patch("pdm_utils.functions.mysqldb.execute_genome_inserts")
+    def test_import_into_db_6(self, execute_mock, get_genome_phams_mock):
+        """Verify phams of a successfully replaced genome are collected."""
+        execute_mock.return_value = (0, "Success")
+        get_genome_phams_mock.return_value = {1, 2}
+        self.bndl._errors = 0
+        self.tkt.type = "replace"
+        self.bndl.ticket = self.tkt
+        self.bndl.genome_dict["flat_file"] = self.gnm1
+        changed_phams = {3}
+        import_genome.import_into_db(self.bndl, self.engine,
+                    gnm_key="flat_file", prod_run=True,
+                    changed_phams=changed_phams)
+        self.assertEqual(changed_phams, {1, 2, 3})
+
+
+    @patch("pdm_utils.functions.pham_summary.get_genome_phams")
+    @patch("pdm_utils.functions.mysqldb.execute_genome_inserts")
+    def test_import_into_db_7(self, execute_mock, get_genome_phams_mock):
+        """Verify phams are not collected if the import fails, or for
+        added genomes."""
+        execute_mock.return_value = (1, "Fail")
+        get_genome_phams_mock.return_value = {1, 2}
+        self.bndl._errors = 0
+        self.tkt.type = "replace"
+        self.bndl.ticket = self.tkt
+        self.bndl.genome_dict["flat_file"] = self.gnm1
+        changed_phams = set()
+        import_genome.import_into_db(self.bndl, self.engine,
+                    gnm_key="flat_file", prod_run=True,
+                    changed_phams=changed_phams)
+        with self.subTest():
+            self.assertEqual(changed_phams, set())
+
+        execute_mock.return_value = (0, "Success")
+        self.bndl._errors = 0
+        self.tkt.type = "add"
+        import_genome.import_into_db(self.bndl, self.engine,
+                    gnm_key="flat_file", prod_run=True,
+                    changed_phams=changed_phams)
+        with self.subTest():
+            get_genome_phams_mock.assert_called_once()
+
+
 
 
 class TestImportGenome7(unittest.TestCase):
@@ -2423,6 +2478,242 @@ class TestImportGenome9(unittest.TestCase):
         self.assertIsNone(logfile_path)
 
 
+class TestImportGenome10(unittest.TestCase):
+
+    def setUp(self):
+        self.tkt = ticket.ImportTicket()
+        self.tkt.type = "add"
+        self.gnm = genome.Genome()
+        self.gnm.id = "Trixie"
+        self.gnm.accession = "ABC123"
+        self.gnm.seq = Seq("atgc", IUPAC.ambiguous_dna)
+        self.gnm.host_genus = "Mycobacterium"
+        self.gnm.cluster = "A"
+        self.gnm.subcluster = "A2"
+        self.old_gnm = genome.Genome()
+        self.old_gnm.id = "Trixie"
+        self.old_gnm.accession = "XYZ456"
+        self.bndl = bundle.Bundle()
+        self.bndl.ticket = self.tkt
+        self.bndl.genome_dict["flat_file"] = self.gnm
+        self.ref_data = {"phage_id_set": {"L5"},
+                         "accession_set": {"XYZ456", ""},
+                         "seq_hash_set": {basic.get_seq_hash("GGCC")},
+                         "host_genera_set": {"Mycobacterium"},
+                         "cluster_set": {"UNK", "Singleton"},
+                         "subcluster_set": {"none"}}
+
+    def test_update_mysql_reference_sets_1(self):
+        """Verify an added genome's values are added to the sets."""
+        import_genome.update_mysql_reference_sets(
+                            self.ref_data, self.bndl,
+                            file_ref="flat_file", retain_ref="mysql")
+        with self.subTest():
+            self.assertEqual(self.ref_data["phage_id_set"], {"L5", "Trixie"})
+        with self.subTest():
+            self.assertEqual(self.ref_data["accession_set"],
+                             {"XYZ456", "ABC123", ""})
+        with self.subTest():
+            self.assertIn(basic.get_seq_hash("ATGC"),
+                          self.ref_data["seq_hash_set"])
+        with self.subTest():
+            self.assertEqual(self.ref_data["cluster_set"],
+                             {"UNK", "Singleton", "A"})
+        with self.subTest():
+            self.assertEqual(self.ref_data["subcluster_set"], {"none", "A2"})
+
+    def test_update_mysql_reference_sets_2(self):
+        """Verify a replaced genome's accession is removed from the set."""
+        self.tkt.type = "replace"
+        self.bndl.genome_dict["mysql"] = self.old_gnm
+        import_genome.update_mysql_reference_sets(
+                            self.ref_data, self.bndl,
+                            file_ref="flat_file", retain_ref="mysql")
+        self.assertEqual(self.ref_data["accession_set"], {"ABC123", ""})
+
+    def test_update_mysql_reference_sets_3(self):
+        """Verify an empty accession of a replaced genome is retained."""
+        self.tkt.type = "replace"
+        self.old_gnm.accession = ""
+        self.bndl.genome_dict["mysql"] = self.old_gnm
+        import_genome.update_mysql_reference_sets(
+                            self.ref_data, self.bndl,
+                            file_ref="flat_file", retain_ref="mysql")
+        self.assertEqual(self.ref_data["accession_set"],
+                         {"XYZ456", "ABC123", ""})
+
+    @patch("pdm_utils.pipelines.import_genome.get_mysql_reference_sets")
+    def test_check_mysql_reference_sets_1(self, gmrs_mock):
+        """Verify no sets are reported when they match the database."""
+        gmrs_mock.return_value = {key: set(value) for key, value
+                                  in self.ref_data.items()}
+        inconsistent_sets = import_genome.check_mysql_reference_sets(
+                                                    None, self.ref_data)
+        self.assertEqual(inconsistent_sets, [])
+
+    @patch("pdm_utils.pipelines.import_genome.get_mysql_reference_sets")
+    def test_check_mysql_reference_sets_2(self, gmrs_mock):
+        """Verify sets with missing or extra values are reported."""
+        mysql_ref_data = {key: set(value) for key, value
+                          in self.ref_data.items()}
+        mysql_ref_data["phage_id_set"].add("D29")
+        mysql_ref_data["cluster_set"].remove("Singleton")
+        gmrs_mock.return_value = mysql_ref_data
+        inconsistent_sets = import_genome.check_mysql_reference_sets(
+                                                    None, self.ref_data)
+        self.assertEqual(inconsistent_sets, ["phage_id_set", "cluster_set"])
+
+
+class TestImportGenome11(unittest.TestCase):
+
+    def setUp(self):
+        self.tkt = ticket.ImportTicket()
+        self.tkt.type = "add"
+        self.tkt.phage_id = "Trixie"
+        self.gnm = genome.Genome()
+        self.gnm.id = "Trixie"
+        self.gnm.name = "Trixie_Draft"
+        self.gnm.accession = "ABC123"
+        self.gnm.seq = Seq("ATGC", IUPAC.ambiguous_dna)
+        self.bndl = bundle.Bundle()
+        self.bndl.ticket = self.tkt
+        self.bndl.genome_dict["flat_file"] = self.gnm
+        self.imported_ref_data = {"phage_id_set": {"L5"},
+                                  "accession_set": {"ABC123"},
+                                  "seq_hash_set": {basic.get_seq_hash("TTTT")},
+                                  "host_genera_set": set(),
+                                  "cluster_set": set(),
+                                  "subcluster_set": set()}
+        self.ref_data = {key: set() for key in self.imported_ref_data.keys()}
+        self.files = [pathlib.Path("Trixie.gb"), pathlib.Path("L5.gb"),
+                      pathlib.Path("D29.gb")]
+
+    def test_claim_ticket_1(self):
+        """Verify an available matched ticket is claimed."""
+        ticket_dict = {"Trixie": self.tkt}
+        claimed = import_genome.claim_ticket(self.bndl, ticket_dict,
+                                             file_ref="flat_file")
+        with self.subTest():
+            self.assertTrue(claimed)
+        with self.subTest():
+            self.assertEqual(ticket_dict, {})
+
+    def test_claim_ticket_2(self):
+        """Verify a ticket matched to an earlier file is not claimed."""
+        claimed = import_genome.claim_ticket(self.bndl, {},
+                                             file_ref="flat_file")
+        self.assertFalse(claimed)
+
+    def test_claim_ticket_3(self):
+        """Verify a bundle without a ticket does not claim one."""
+        self.bndl.ticket = None
+        claimed = import_genome.claim_ticket(self.bndl, {},
+                                             file_ref="flat_file")
+        self.assertTrue(claimed)
+
+    def test_check_imported_genomes_1(self):
+        """Verify an added genome is checked against imported genomes."""
+        import_genome.check_imported_genomes(self.bndl,
+                                             self.imported_ref_data,
+                                             file_ref="flat_file")
+        errors = count_status(self.gnm, "error")
+        with self.subTest():
+            self.assertEqual(len(self.gnm.evaluations), 4)
+        with self.subTest():
+            self.assertEqual(errors, 1)
+
+    def test_check_imported_genomes_2(self):
+        """Verify a replaced genome is not checked."""
+        self.tkt.type = "replace"
+        import_genome.check_imported_genomes(self.bndl,
+                                             self.imported_ref_data,
+                                             file_ref="flat_file")
+        self.assertEqual(len(self.gnm.evaluations), 0)
+
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file_batch")
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file")
+    def test_evaluate_flat_files_1(self, eff_mock, effb_mock):
+        """Verify files are evaluated one at a time, in order."""
+        eff_mock.side_effect = ["bndl1", "bndl2", "bndl3"]
+        evaluated_files = import_genome.evaluate_flat_files(
+                                self.files, {}, self.ref_data, self.ref_data,
+                                file_ref="flat_file")
+        with self.subTest():
+            self.assertEqual(list(evaluated_files),
+                             list(zip(self.files,
+                                      ["bndl1", "bndl2", "bndl3"])))
+        with self.subTest():
+            effb_mock.assert_not_called()
+        with self.subTest():
+            self.assertEqual(eff_mock.call_args_list[2][1]["id"], 3)
+
+    @patch("pdm_utils.pipelines.import_genome.check_imported_genomes")
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file_batch")
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file")
+    def test_evaluate_flat_files_2(self, eff_mock, effb_mock, cig_mock):
+        """Verify files are evaluated in batches, and bundles are checked
+        against genomes imported from earlier files of the batch."""
+        bndl2 = bundle.Bundle()
+        bndl3 = bundle.Bundle()
+        effb_mock.side_effect = [[self.bndl, bndl2], [bndl3]]
+        ticket_dict = {"Trixie": self.tkt}
+        evaluated_files = import_genome.evaluate_flat_files(
+                                self.files, ticket_dict, self.ref_data,
+                                self.ref_data, number_processes=2,
+                                file_ref="flat_file")
+
+        self.assertEqual(next(evaluated_files), (self.files[0], self.bndl))
+        self.ref_data["phage_id_set"].add("Trixie")
+        self.assertEqual(next(evaluated_files), (self.files[1], bndl2))
+        self.assertEqual(next(evaluated_files), (self.files[2], bndl3))
+
+        with self.subTest():
+            self.assertEqual(effb_mock.call_count, 2)
+        with self.subTest():
+            self.assertEqual(effb_mock.call_args_list[1][1]["start_id"], 3)
+        with self.subTest():
+            eff_mock.assert_not_called()
+        with self.subTest():
+            cig_mock.assert_called_once()
+        with self.subTest():
+            self.assertEqual(cig_mock.call_args[0][1]["phage_id_set"],
+                             {"Trixie"})
+
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file_batch")
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file")
+    def test_evaluate_flat_files_3(self, eff_mock, effb_mock):
+        """Verify a file is evaluated again if its ticket was matched
+        to an earlier file."""
+        effb_mock.return_value = [self.bndl]
+        eff_mock.return_value = "bndl"
+        evaluated_files = import_genome.evaluate_flat_files(
+                                self.files[:1], {}, self.ref_data,
+                                self.ref_data, number_processes=2,
+                                file_ref="flat_file")
+        self.assertEqual(list(evaluated_files), [(self.files[0], "bndl")])
+
+    @patch("pdm_utils.pipelines.import_genome.os.cpu_count")
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file")
+    def test_evaluate_flat_file_batch_1(self, eff_mock, cpu_count_mock):
+        """Verify bundles are returned in the order of the files."""
+        eff_mock.side_effect = lambda filepath, *args, **kwargs: filepath.name
+        cpu_count_mock.return_value = 2
+        bundles = import_genome.evaluate_flat_file_batch(
+                                self.files, {}, self.ref_data,
+                                file_ref="flat_file")
+        self.assertEqual(bundles, [file.name for file in self.files])
+
+    @patch("pdm_utils.pipelines.import_genome.os.cpu_count")
+    @patch("pdm_utils.pipelines.import_genome.evaluate_flat_file")
+    def test_evaluate_flat_file_batch_2(self, eff_mock, cpu_count_mock):
+        """Verify errors raised by evaluation processes are propagated."""
+        eff_mock.side_effect = ValueError("Unable to parse file.")
+        cpu_count_mock.return_value = 2
+        with self.assertRaises(ValueError):
+            import_genome.evaluate_flat_file_batch(
+                                self.files, {}, self.ref_data,
+                                file_ref="flat_file")
+
 
 
 if __name__ == '__main__':
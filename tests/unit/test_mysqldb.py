@@ -2,17 +2,20 @@
 
 
 from datetime import datetime
+import hashlib
 from pathlib import Path
 import sys
 import unittest
 from unittest.mock import Mock, patch, PropertyMock
 
 from Bio.Seq import Seq
+import sqlalchemy
 
 from pdm_utils.classes import bundle
 from pdm_utils.classes import cds, trna, tmrna
 from pdm_utils.classes import genome
 from pdm_utils.constants import constants
+from pdm_utils.functions import basic
 from pdm_utils.functions import mysqldb
 
 
@@ -456,5 +459,85 @@ class TestMysqldbFunctions2(unittest.TestCase):
                         self.genome1, tkt_type="add")
         self.assertEqual(len(statements), 7)
 
+    def test_create_genome_rows_1(self):
+        """Verify row dictionaries are created for each genome feature."""
+        self.genome1.cds_features = self.cds_features
+        self.genome1.trna_features = self.trna_features
+        self.genome1.tmrna_features = [self.tmrna1]
+        rows = mysqldb.create_genome_rows(self.genome1)
+        with self.subTest():
+            self.assertEqual(list(rows.keys()),
+                             ["phage", "gene", "trna", "tmrna"])
+        with self.subTest():
+            self.assertEqual(len(rows["phage"]), 1)
+        with self.subTest():
+            self.assertEqual(len(rows["gene"]), 2)
+        with self.subTest():
+            self.assertEqual(len(rows["trna"]), 2)
+        with self.subTest():
+            self.assertEqual(len(rows["tmrna"]), 1)
+
+    def test_create_phage_table_row_1(self):
+        """Verify Singleton cluster and 'none' subcluster become NULL."""
+        self.genome1.seq = Seq("ATCG")
+        self.genome1.cluster = "Singleton"
+        self.genome1.subcluster = "none"
+        row = mysqldb.create_phage_table_row(self.genome1)
+        with self.subTest():
+            self.assertEqual(row["Sequence"], "ATCG")
+        with self.subTest():
+            self.assertIsNone(row["Cluster"])
+        with self.subTest():
+            self.assertIsNone(row["Subcluster"])
+
+    def test_create_gene_table_row_1(self):
+        """Verify descriptions with quotes are not escaped or altered."""
+        self.cds1.description = "5' \"terminase\""
+        self.cds1.locus_tag = ""
+        row = mysqldb.create_gene_table_row(self.cds1)
+        with self.subTest():
+            self.assertEqual(row["Notes"], "5' \"terminase\"")
+        with self.subTest():
+            self.assertIsNone(row["LocusTag"])
+
+    def test_execute_genome_inserts_1(self):
+        """Verify one executemany() call is made per table with rows,
+        after deleting genomes for 'replace' tickets."""
+        self.genome1.cds_features = self.cds_features
+        engine = Mock()
+        connection = engine.connect.return_value
+        result, msg = mysqldb.execute_genome_inserts(
+                            engine, [self.genome1], tkt_type="replace")
+        with self.subTest():
+            self.assertEqual(result, 0)
+        with self.subTest():
+            # One DELETE, then one phage and one gene insert.
+            self.assertEqual(connection.execute.call_count, 3)
+        with self.subTest():
+            gene_rows = connection.execute.call_args_list[2][0][1]
+            self.assertEqual(len(gene_rows), 2)
+        with self.subTest():
+            connection.begin.return_value.commit.assert_called()
+
+    def test_create_seq_hash_set_1(self):
+        """Verify sequence digests are computed by the database."""
+        engine = sqlalchemy.create_engine("sqlite://")
+
+        # SQLite does not provide the MySQL SHA2() function.
+        @sqlalchemy.event.listens_for(engine, "connect")
+        def create_sha2(dbapi_connection, connection_record):
+            dbapi_connection.create_function(
+                "SHA2", 2, lambda value, bits: None if value is None
+                           else hashlib.sha256(value.encode()).hexdigest())
+
+        engine.execute("CREATE TABLE phage (PhageID VARCHAR(25), "
+                       "Sequence BLOB)")
+        engine.execute("INSERT INTO phage VALUES "
+                       "('Trixie', 'atgc'), ('L5', 'ATGC'), ('D29', 'TTTT'), "
+                       "('Alice', NULL)")
+        result = mysqldb.create_seq_hash_set(engine)
+        self.assertEqual(result, {basic.get_seq_hash("ATGC"),
+                                  basic.get_seq_hash("TTTT")})
+
 if __name__ == '__main__':
     unittest.main()
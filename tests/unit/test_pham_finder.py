@@ -0,0 +1,94 @@
+"""Tests the functionality of unique functions in the pham_finder pipeline
+"""
+import unittest
+from unittest.mock import Mock
+
+from sqlalchemy import Column, create_engine, ForeignKey, Integer, MetaData
+from sqlalchemy import String, Table
+
+from pdm_utils.functions import querying
+from pdm_utils.pipelines import pham_finder
+
+
+def build_filter(genes, values=None):
+    metadata = MetaData()
+    Table("pham", metadata,
+          Column("PhamID", Integer, primary_key=True))
+    Table("gene", metadata,
+          Column("GeneID", String(35), primary_key=True),
+          Column("LocusTag", String(35)),
+          Column("PhamID", Integer, ForeignKey("pham.PhamID")))
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    phams = {gene[2] for gene in genes if gene[2] is not None}
+    engine.execute(metadata.tables["pham"].insert(),
+                   [{"PhamID": pham} for pham in phams])
+    engine.execute(metadata.tables["gene"].insert(),
+                   [{"GeneID": geneid, "LocusTag": locus_tag, "PhamID": pham}
+                    for geneid, locus_tag, pham in genes])
+
+    db_filter = Mock()
+    db_filter.engine = engine
+    db_filter.graph = querying.build_graph(metadata)
+    db_filter.values = values
+    return db_filter
+
+
+class TestFindPhams(unittest.TestCase):
+    def setUp(self):
+        self.a_filter = build_filter([("L5_1", "LT_1", 1),
+                                      ("L5_2", "LT_2", 1),
+                                      ("L5_3", "LT_3", 1),
+                                      ("L5_4", None, 2),
+                                      ("L5_5", "LT_5", 3),
+                                      ("L5_6", "LT_6", 4)],
+                                     values=[1, 2, 3, 4])
+        self.b_filter = build_filter([("L5_1", "LT_1", 5),
+                                      ("L5_2", "LT_2", 5),
+                                      ("l5_3", "LT_3", 6),
+                                      ("L5_4", "LT_4", 2),
+                                      ("L5_5", "LT_5", 7),
+                                      ("L5_6", "LT_6", None)])
+
+    def tearDown(self):
+        self.a_filter.engine.dispose()
+        self.b_filter.engine.dispose()
+
+    def test_find_phams_1(self):
+        """Verify corresponding phams are found by GeneID."""
+        mapped_phams = pham_finder.find_phams(self.a_filter, self.b_filter)
+
+        self.assertEqual(mapped_phams, {1: "5;6", 3: "7", 4: "None"})
+
+    def test_find_phams_2(self):
+        """Verify gene coverage percentages are computed from join counts."""
+        mapped_phams = pham_finder.find_phams(self.a_filter, self.b_filter,
+                                              show_per=True)
+
+        self.assertEqual(mapped_phams[1], "5(66.7%);6(33.3%)")
+
+    def test_find_phams_3(self):
+        """Verify corresponding phams are found by LocusTag."""
+        mapped_phams = pham_finder.find_phams(self.a_filter, self.b_filter,
+                                              use_locus=True)
+
+        self.assertEqual(mapped_phams,
+                         {1: "5;6", 2: "None", 3: "7", 4: "None"})
+
+    def test_find_phams_4(self):
+        """Verify a provided gene pham index is used instead of a query."""
+        b_filter = Mock()
+        b_index = {"l5_1": [1], "l5_2": [1], "l5_3": [1], "l5_4": [8]}
+
+        mapped_phams = pham_finder.find_phams(self.a_filter, b_filter,
+                                              b_index=b_index)
+
+        with self.subTest():
+            self.assertEqual(mapped_phams, {2: "8", 3: "None", 4: "None"})
+        with self.subTest():
+            b_filter.engine.execute.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,18 @@
 """Tests the functionality of unique functions in the pham_review pipeline
 """
+import shutil
 import unittest
+from pathlib import Path
 from unittest.mock import Mock
 from unittest.mock import patch
 from unittest.mock import PropertyMock
 
 from pdm_utils.pipelines import pham_review
 
+TMPDIR_PREFIX = "pdm_utils_tests_unit_pham_review_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location
+TMPDIR_BASE = "/tmp"
+
 
 class TestMain(unittest.TestCase):
     def setUp(self):
@@ -31,6 +37,9 @@ class TestMain(unittest.TestCase):
         self.mock_config = Mock()
         self.mock_force = Mock()
         self.mock_production = Mock()
+        self.mock_snapshot = Mock()
+        self.mock_pham_summary = Mock()
+        self.mock_number_processes = Mock()
 
         type(self.args).database = PropertyMock(
                                         return_value=self.mock_database)
@@ -62,6 +71,12 @@ class TestMain(unittest.TestCase):
                                         return_value=False)
         type(self.args).production = PropertyMock(
                                         return_value=self.mock_production)
+        type(self.args).snapshot = PropertyMock(
+                                        return_value=self.mock_snapshot)
+        type(self.args).pham_summary = PropertyMock(
+                                        return_value=self.mock_pham_summary)
+        type(self.args).number_processes = PropertyMock(
+                                    return_value=self.mock_number_processes)
 
     @patch("pdm_utils.pipelines.pham_review.configfile.build_complete_config")
     @patch("pdm_utils.pipelines.pham_review.execute_pham_review")
@@ -96,7 +111,175 @@ class TestMain(unittest.TestCase):
                             psr_reports=self.mock_pham_summary_report,
                             s_report=self.mock_summary_report,
                             verbose=self.mock_verbose,
-                            production=self.mock_production)
+                            production=self.mock_production,
+                            snapshot=self.mock_snapshot,
+                            use_summary=self.mock_pham_summary,
+                            threads=self.mock_number_processes)
+
+
+class TestExecutePhamReview(unittest.TestCase):
+    @patch("pdm_utils.pipelines.pham_review.pipelines_basic.build_filter")
+    @patch("pdm_utils.pipelines.pham_review.mysqldb_basic.get_first_row_data")
+    @patch("pdm_utils.pipelines.pham_review.columnar.load_columnar_snapshot")
+    @patch("pdm_utils.pipelines.pham_review.columnar.is_columnar_snapshot")
+    def test_execute_pham_review_1(self, is_snapshot_mock, load_snapshot_mock,
+                                   get_first_row_data_mock, build_filter_mock):
+        """Verify review stops if the snapshot is from another version."""
+        is_snapshot_mock.return_value = True
+        load_snapshot_mock.return_value = {"version": {"Version": 7}}
+        get_first_row_data_mock.return_value = {"Version": 8}
+
+        with self.assertRaises(SystemExit):
+            pham_review.execute_pham_review(Mock(),
+                                            snapshot=Path("Actino.columns"))
+
+        build_filter_mock.assert_not_called()
+
+
+class TestReviewPhams(unittest.TestCase):
+    def setUp(self):
+        self.db_filter = Mock()
+        self.db_filter.values = [3, 1, 2]
+
+    @patch("pdm_utils.pipelines.pham_review.columnar.get_discrepant_phams")
+    def test_review_phams_1(self, get_discrepant_phams_mock):
+        """Verify snapshot review does not query the database."""
+        get_discrepant_phams_mock.return_value = [3, 2]
+        snapshot = Mock()
+
+        pham_review.review_phams(self.db_filter, snapshot=snapshot)
+
+        get_discrepant_phams_mock.assert_called_with(snapshot,
+                                                     phams=[3, 1, 2])
+        with self.subTest():
+            self.assertEqual(self.db_filter.values, [3, 2])
+        with self.subTest():
+            self.db_filter.get_column.assert_not_called()
+
+    @patch("pdm_utils.pipelines.pham_review.querying.first_column")
+    @patch("pdm_utils.pipelines.pham_review.querying.build_select")
+    def test_review_phams_2(self, build_select_mock, first_column_mock):
+        """Verify discrepant phams are found with one grouped query."""
+        first_column_mock.return_value = [2, 3]
+
+        pham_review.review_phams(self.db_filter)
+
+        build_select_mock.assert_called_once()
+        first_column_mock.assert_called_once_with(
+                                self.db_filter.engine,
+                                build_select_mock.return_value,
+                                in_column=self.db_filter.key,
+                                values=[3, 1, 2])
+        self.assertEqual(self.db_filter.values, [3, 2])
+
+    @patch("pdm_utils.pipelines.pham_review.querying.first_column")
+    def test_review_phams_3(self, first_column_mock):
+        """Verify no query is executed without phams to review."""
+        self.db_filter.values = []
+
+        pham_review.review_phams(self.db_filter)
+
+        first_column_mock.assert_not_called()
+
+
+class TestExecutePhamReportExport(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+
+        self.alchemist = Mock()
+        self.db_filter = Mock()
+        self.db_filter.values = [1, 2]
+
+        self.gr_data = {1: [{"Gene": "L5_1"}], 2: [{"Gene": "L5_2"}]}
+        self.psr_data = {1: {"Pham": 1}, 2: {"Pham": 2}}
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    @patch("pdm_utils.pipelines.pham_review.ProcessPoolExecutor")
+    @patch("pdm_utils.pipelines.pham_review.write_pham_reports")
+    @patch("pdm_utils.pipelines.pham_review.get_psr_data")
+    @patch("pdm_utils.pipelines.pham_review.get_gr_data")
+    def test_execute_pham_report_export_1(self, get_gr_data_mock,
+                                          get_psr_data_mock,
+                                          write_pham_reports_mock,
+                                          executor_mock):
+        """Verify report data is retrieved once for all uncached phams."""
+        get_gr_data_mock.return_value = {2: self.gr_data[2]}
+        get_psr_data_mock.return_value = self.psr_data
+        gr_data_cache = {1: self.gr_data[1]}
+
+        pham_review.execute_pham_report_export(
+                                    self.alchemist, self.db_filter,
+                                    self.test_dir, gr_reports=True,
+                                    gr_data_cache=gr_data_cache,
+                                    psr_reports=True, psr_data_cache={})
+
+        pham_path = self.test_dir.joinpath("PhamReports")
+        with self.subTest():
+            get_gr_data_mock.assert_called_once_with(self.alchemist, [2],
+                                                     verbose=False)
+        with self.subTest():
+            get_psr_data_mock.assert_called_once_with(self.alchemist,
+                                                      [1, 2],
+                                                      neighborhood=None,
+                                                      verbose=False)
+        with self.subTest():
+            write_pham_reports_mock.assert_any_call(
+                                    2, pham_path.joinpath("2"),
+                                    self.gr_data[2], self.psr_data[2], False)
+        with self.subTest():
+            executor_mock.assert_not_called()
+
+    @patch("pdm_utils.pipelines.pham_review.os.cpu_count")
+    @patch("pdm_utils.pipelines.pham_review.get_gr_data")
+    def test_execute_pham_report_export_2(self, get_gr_data_mock,
+                                          cpu_count_mock):
+        """Verify pham reports are written by a process pool."""
+        get_gr_data_mock.return_value = self.gr_data
+        cpu_count_mock.return_value = 2
+
+        pham_review.execute_pham_report_export(
+                                    self.alchemist, self.db_filter,
+                                    self.test_dir, gr_reports=True,
+                                    gr_data_cache={}, threads=4)
+
+        pham_path = self.test_dir.joinpath("PhamReports")
+        for pham in self.db_filter.values:
+            with self.subTest(pham=pham):
+                self.assertTrue(pham_path.joinpath(
+                        str(pham), f"{pham}_GeneReport.csv").is_file())
+
+    @patch("pdm_utils.pipelines.pham_review.os.cpu_count")
+    @patch("pdm_utils.pipelines.pham_review.get_psr_data")
+    def test_execute_pham_report_export_3(self, get_psr_data_mock,
+                                          cpu_count_mock):
+        """Verify errors raised by report processes are propagated."""
+        get_psr_data_mock.return_value = {2: {}}
+        cpu_count_mock.return_value = 2
+
+        with self.assertRaises(KeyError):
+            pham_review.execute_pham_report_export(
+                                    self.alchemist, self.db_filter,
+                                    self.test_dir, psr_reports=True,
+                                    psr_data_cache={}, threads=2)
+
+    def test_write_pham_reports_1(self):
+        """Verify only the requested reports are written."""
+        pham_path = self.test_dir.joinpath("1")
+        gr_data = [{"Gene": "L5_1", "Phage": "L5", "Gene#": "1",
+                    "Cluster": "A", "Subcluster": "A2",
+                    "Functional Call": "terminase", "Translation": "MK"}]
+
+        pham_review.write_pham_reports(1, pham_path, gr_data, None)
+
+        with self.subTest():
+            self.assertTrue(pham_path.joinpath("1_GeneReport.csv").is_file())
+        with self.subTest():
+            self.assertFalse(pham_path.joinpath("SummaryReport.txt").exists())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,261 @@
+"""Unit tests for the cached pham summary functions."""
+import shutil
+import unittest
+import zlib
+from pathlib import Path
+
+import sqlalchemy
+from sqlalchemy import Column, create_engine, Integer, LargeBinary, MetaData
+from sqlalchemy import String, Table
+
+from pdm_utils.functions import pham_summary
+
+TMPDIR_PREFIX = "pdm_utils_tests_unit_pham_summary_"
+# Can set TMPDIR_BASE to string such as "/tmp/" to track tmp directory location
+TMPDIR_BASE = "/tmp"
+
+
+def concat_ws(separator, *values):
+    values = [value.decode("utf-8") if isinstance(value, bytes)
+              else str(value)
+              for value in values if value is not None]
+    return separator.join(values)
+
+
+def crc32(value):
+    return None if value is None else zlib.crc32(value.encode("utf-8"))
+
+
+class TestPhamSummary(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(TMPDIR_BASE, TMPDIR_PREFIX)
+        if self.test_dir.is_dir():
+            shutil.rmtree(self.test_dir)
+        self.test_dir.mkdir()
+        self.cache_dir = self.test_dir.joinpath("cache")
+
+        metadata = MetaData()
+        Table("phage", metadata,
+              Column("PhageID", String(25), primary_key=True),
+              Column("Cluster", String(5)))
+        Table("pham", metadata,
+              Column("PhamID", Integer, primary_key=True))
+        Table("gene", metadata,
+              Column("GeneID", String(35), primary_key=True),
+              Column("PhageID", String(25)),
+              Column("PhamID", Integer),
+              Column("Notes", LargeBinary))
+        Table("domain", metadata,
+              Column("ID", Integer, primary_key=True),
+              Column("HitID", String(25), unique=True),
+              Column("Name", String(25)))
+        Table("gene_domain", metadata,
+              Column("ID", Integer, primary_key=True),
+              Column("GeneID", String(35)),
+              Column("HitID", String(25)))
+        Table("version", metadata,
+              Column("Version", Integer, primary_key=True))
+        self.metadata = metadata
+
+        self.engine = create_engine(
+                        f"sqlite:///{self.test_dir.joinpath('Actino.sqlite')}")
+
+        # SQLite does not provide the MySQL CONCAT_WS() and CRC32() functions.
+        @sqlalchemy.event.listens_for(self.engine, "connect")
+        def create_functions(dbapi_connection, connection_record):
+            dbapi_connection.create_function("CONCAT_WS", -1, concat_ws)
+            dbapi_connection.create_function("CRC32", 1, crc32)
+
+        metadata.create_all(self.engine)
+        tables = metadata.tables
+        self.engine.execute(tables["phage"].insert(), [
+                            {"PhageID": "Trixie", "Cluster": "A"},
+                            {"PhageID": "L5", "Cluster": "A"},
+                            {"PhageID": "Alice", "Cluster": None}])
+        self.engine.execute(tables["pham"].insert(), [
+                            {"PhamID": 1}, {"PhamID": 2}])
+        self.engine.execute(tables["gene"].insert(), [
+                {"GeneID": "Trixie_1", "PhageID": "Trixie", "PhamID": 1,
+                 "Notes": b"terminase"},
+                {"GeneID": "L5_1", "PhageID": "L5", "PhamID": 1,
+                 "Notes": None},
+                {"GeneID": "Alice_1", "PhageID": "Alice", "PhamID": 1,
+                 "Notes": b"terminase"},
+                {"GeneID": "L5_2", "PhageID": "L5", "PhamID": 2,
+                 "Notes": b""},
+                {"GeneID": "Alice_2", "PhageID": "Alice", "PhamID": 2,
+                 "Notes": b"portal"}])
+        self.engine.execute(tables["domain"].insert(), [
+                            {"HitID": "hit1", "Name": "Terminase_6"}])
+        self.engine.execute(tables["gene_domain"].insert(), [
+                            {"GeneID": "Trixie_1", "HitID": "hit1"},
+                            {"GeneID": "Alice_1", "HitID": "hit1"}])
+        self.engine.execute(tables["version"].insert(), [{"Version": 5}])
+
+    def tearDown(self):
+        self.engine.dispose()
+        shutil.rmtree(self.test_dir)
+
+    def test_compute_pham_summaries_1(self):
+        """Verify pham statistics are computed from bulk queries."""
+        summaries = pham_summary.compute_pham_summaries(self.engine, [1, 3])
+        with self.subTest():
+            self.assertEqual(list(summaries.keys()), [1])
+        with self.subTest():
+            self.assertEqual(summaries[1],
+                             {"Size": 3,
+                              "Annotations": {"terminase": 2, None: 1},
+                              "Phages": ["Alice", "L5", "Trixie"],
+                              "Clusters": ["A", None],
+                              "Domains": ["Terminase_6"]})
+
+    def test_get_discrepant_phams_1(self):
+        """Verify NULL annotations are not counted as distinct annotations."""
+        summaries = pham_summary.compute_pham_summaries(self.engine, [1, 2])
+        self.assertEqual(pham_summary.get_discrepant_phams(summaries,
+                                                           [2, 1, 3]),
+                         [2])
+
+    def test_get_row_phams_1(self):
+        """Verify rows are mapped to the phams that summarize them."""
+        with self.subTest():
+            self.assertEqual(pham_summary.get_row_phams(
+                                    self.engine, "gene", "L5_2"), {2})
+        with self.subTest():
+            self.assertEqual(pham_summary.get_row_phams(
+                                    self.engine, "phage", "L5"), {1, 2})
+        with self.subTest():
+            self.assertEqual(pham_summary.get_row_phams(
+                                    self.engine, "domain", 1), {1})
+        with self.subTest():
+            self.assertEqual(pham_summary.get_row_phams(
+                                    self.engine, "gene_domain", 2), {1})
+        with self.subTest():
+            self.assertEqual(pham_summary.get_row_phams(
+                                    self.engine, "version", 5), set())
+
+    def test_load_pham_summary_1(self):
+        """Verify summaries are built once and then read from the cache."""
+        summaries = pham_summary.load_pham_summary(self.engine,
+                                                   cache_dir=self.cache_dir)
+        with self.subTest():
+            self.assertTrue(pham_summary.has_pham_summary(
+                                    self.engine, cache_dir=self.cache_dir))
+
+        cached_summaries = pham_summary.load_pham_summary(
+                                    self.engine, cache_dir=self.cache_dir)
+        with self.subTest():
+            self.assertEqual(cached_summaries, summaries)
+
+    def test_load_pham_summary_2(self):
+        """Verify summaries are rebuilt after untracked gene changes."""
+        pham_summary.load_pham_summary(self.engine, cache_dir=self.cache_dir)
+        self.engine.execute("DELETE FROM gene WHERE GeneID = 'Alice_2'")
+
+        summaries = pham_summary.load_pham_summary(self.engine,
+                                                   cache_dir=self.cache_dir)
+        self.assertEqual(summaries[2]["Size"], 1)
+
+    def test_load_pham_summary_3(self):
+        """Verify summaries are rebuilt after untracked edits that do not
+        change the gene count."""
+        pham_summary.load_pham_summary(self.engine, cache_dir=self.cache_dir)
+        self.engine.execute("UPDATE gene SET Notes = 'capsid' "
+                            "WHERE GeneID = 'Alice_2'")
+
+        summaries = pham_summary.load_pham_summary(self.engine,
+                                                   cache_dir=self.cache_dir)
+        self.assertEqual(summaries[2]["Annotations"], {"": 1, "capsid": 1})
+
+    def test_get_database_state_1(self):
+        """Verify cluster and domain edits change the database state."""
+        state1 = pham_summary.get_database_state(self.engine)
+        self.engine.execute("UPDATE phage SET Cluster = 'B' "
+                            "WHERE PhageID = 'Alice'")
+        state2 = pham_summary.get_database_state(self.engine)
+        self.engine.execute("INSERT INTO gene_domain (GeneID, HitID) "
+                            "VALUES ('L5_1', 'hit1')")
+        state3 = pham_summary.get_database_state(self.engine)
+        with self.subTest():
+            self.assertNotEqual(state1["PhageChecksum"],
+                                state2["PhageChecksum"])
+        with self.subTest():
+            self.assertEqual(state1["GeneChecksum"], state2["GeneChecksum"])
+        with self.subTest():
+            self.assertEqual(state3["GeneDomainID"], 3)
+
+    def test_refresh_pham_summary_1(self):
+        """Verify only the refreshed phams are recomputed."""
+        pham_summary.load_pham_summary(self.engine, cache_dir=self.cache_dir)
+        state = pham_summary.get_database_state(self.engine)
+
+        self.engine.execute("UPDATE gene SET PhamID = 2 "
+                            "WHERE GeneID = 'L5_1'")
+        self.engine.execute("DELETE FROM gene WHERE GeneID = 'Alice_2'")
+        pham_summary.refresh_pham_summary(self.engine, {1, 2},
+                                          previous_state=state,
+                                          cache_dir=self.cache_dir)
+
+        data = pham_summary.read_pham_summary(
+                            pham_summary.get_pham_summary_path(
+                                    self.engine, cache_dir=self.cache_dir))
+        with self.subTest():
+            self.assertEqual(data["phams"][1]["Size"], 2)
+        with self.subTest():
+            self.assertEqual(data["phams"][2]["Annotations"],
+                             {"": 1, None: 1})
+        with self.subTest():
+            self.assertEqual(data["state"],
+                             pham_summary.get_database_state(self.engine))
+
+    def test_refresh_pham_summary_2(self):
+        """Verify outdated caches are removed instead of refreshed."""
+        pham_summary.load_pham_summary(self.engine, cache_dir=self.cache_dir)
+        self.engine.execute("UPDATE version SET Version = 6")
+        state = pham_summary.get_database_state(self.engine)
+
+        pham_summary.refresh_pham_summary(self.engine, {1},
+                                          previous_state=state,
+                                          cache_dir=self.cache_dir)
+
+        self.assertFalse(pham_summary.has_pham_summary(
+                                    self.engine, cache_dir=self.cache_dir))
+
+    def test_refresh_pham_summary_3(self):
+        """Verify a Notes update is reflected after refreshing its pham."""
+        pham_summary.load_pham_summary(self.engine, cache_dir=self.cache_dir)
+        state = pham_summary.get_database_state(self.engine)
+
+        changed_phams = pham_summary.get_row_phams(self.engine, "gene",
+                                                   "Alice_2")
+        self.engine.execute("UPDATE gene SET Notes = 'capsid' "
+                            "WHERE GeneID = 'Alice_2'")
+        pham_summary.refresh_pham_summary(self.engine, changed_phams,
+                                          previous_state=state,
+                                          cache_dir=self.cache_dir)
+
+        summaries = pham_summary.load_pham_summary(self.engine,
+                                                   cache_dir=self.cache_dir)
+        self.assertEqual(summaries[2]["Annotations"], {"": 1, "capsid": 1})
+
+    def test_refresh_pham_summary_4(self):
+        """Verify no cache is created by refreshing phams."""
+        pham_summary.refresh_pham_summary(self.engine, {1},
+                                          cache_dir=self.cache_dir)
+
+        self.assertFalse(pham_summary.has_pham_summary(
+                                    self.engine, cache_dir=self.cache_dir))
+
+
+    def test_remove_pham_summary_1(self):
+        """Verify the cache of a database is removed."""
+        pham_summary.load_pham_summary(self.engine, cache_dir=self.cache_dir)
+        pham_summary.remove_pham_summary(self.engine,
+                                         cache_dir=self.cache_dir)
+
+        self.assertFalse(pham_summary.has_pham_summary(
+                                    self.engine, cache_dir=self.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
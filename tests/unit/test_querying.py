@@ -622,6 +622,55 @@ class TestBuildClauses(unittest.TestCase):
         get_table_pathing_mock.assert_called_with(self.graph, self.table_names)
         join_pathed_tables_mock.assert_called_with(self.graph, self.pathing)
 
+    @patch("pdm_utils.functions.querying.join_pathed_tables")
+    @patch("pdm_utils.functions.querying.get_table_pathing")
+    @patch("pdm_utils.functions.querying.get_table_list")
+    def test_build_fromclause_2(self, get_table_list_mock,
+                                get_table_pathing_mock,
+                                join_pathed_tables_mock):
+        """Verify build_fromclause() reuses joins for repeated Tables.
+        """
+        get_table_list_mock.return_value = self.table_names
+        get_table_pathing_mock.return_value = self.pathing
+        joined_table = Mock()
+        join_pathed_tables_mock.return_value = joined_table
+
+        first = querying.build_fromclause(self.graph, self.tables)
+        second = querying.build_fromclause(self.graph, self.tables)
+
+        self.assertEqual(first, joined_table)
+        self.assertEqual(second, joined_table)
+        get_table_pathing_mock.assert_called_once()
+        join_pathed_tables_mock.assert_called_once()
+
+    @patch("pdm_utils.functions.querying.select")
+    def test_build_select_template_1(self, select_mock):
+        """Verify build_select_template() caches Column statements.
+        """
+        select_mock.return_value.select_from.return_value = "Select"
+
+        first = querying.build_select_template(self.graph, self.columns,
+                                               self.phage, "select")
+        second = querying.build_select_template(self.graph, self.columns,
+                                                self.phage, "select")
+
+        self.assertEqual(first, "Select")
+        self.assertEqual(second, "Select")
+        select_mock.assert_called_once_with(self.columns)
+
+    @patch("pdm_utils.functions.querying.select")
+    def test_build_select_template_2(self, select_mock):
+        """Verify build_select_template() does not cache expressions.
+        """
+        columns = [self.not_column]
+
+        querying.build_select_template(self.graph, columns,
+                                       self.phage, "select")
+        querying.build_select_template(self.graph, columns,
+                                       self.phage, "select")
+
+        self.assertEqual(select_mock.call_count, 2)
+
     @patch("pdm_utils.functions.querying.append_order_by_clauses")
     @patch("pdm_utils.functions.querying.append_where_clauses")
     @patch("pdm_utils.functions.querying.select")
@@ -829,7 +878,7 @@ class TestExecute(unittest.TestCase):
                                            self.mock_in_column,
                                            self.values,
                                            limit=8001, 
-                                           return_dict=False)
+                                           return_dict=False, threads=1)
 
     def test_execute_6(self):
         """Verify that execute() raises ValueError with lacking instruction.
@@ -865,7 +914,7 @@ class TestExecute(unittest.TestCase):
                                            self.mock_executable,
                                            self.mock_in_column,
                                            self.values,
-                                           limit=8001)
+                                           limit=8001, threads=1)
 
     def test_first_column_4(self):
         """Verify first_column() raises ValueError with lacking instructions.
@@ -936,6 +985,90 @@ class TestExecute(unittest.TestCase):
         self.mock_in_column.in_.assert_any_call(self.values[:2])
         self.mock_in_column.in_.assert_any_call([self.values[2]])
 
+    def test_iter_rows_1(self):
+        """Verify that iter_rows() streams rows in chunks until exhausted.
+        """
+        self.mock_engine.connect.return_value = MagicMock()
+        connection = self.mock_engine.connect.return_value.__enter__.\
+                                                        return_value
+        stream_connection = connection.execution_options.return_value
+        stream_connection.execute.return_value = self.mock_proxy
+        self.mock_proxy.fetchmany.side_effect = [[self.data_tuple] * 2,
+                                                 [self.data_tuple], []]
+
+        results = querying.iter_rows(self.mock_engine, self.mock_executable,
+                                     chunk_size=2, return_dict=False)
+
+        self.mock_engine.connect.assert_not_called()
+        self.assertEqual(list(results), [self.data_tuple] * 3)
+
+        connection.execution_options.assert_called_with(stream_results=True)
+        self.mock_proxy.fetchmany.assert_called_with(2)
+        self.mock_proxy.close.assert_called()
+
+    def test_iter_rows_2(self):
+        """Verify that iter_rows() conditions on chunks of values.
+        """
+        self.mock_engine.connect.return_value = MagicMock()
+        connection = self.mock_engine.connect.return_value.__enter__.\
+                                                        return_value
+        stream_connection = connection.execution_options.return_value
+        stream_connection.execute.return_value = self.mock_proxy
+        self.mock_proxy.fetchmany.return_value = []
+
+        list(querying.iter_rows(self.mock_engine, self.mock_executable,
+                                in_column=self.mock_in_column,
+                                values=self.values, limit=2))
+
+        self.mock_in_column.in_.assert_any_call(self.values[:2])
+        self.mock_in_column.in_.assert_any_call([self.values[2]])
+        self.assertEqual(stream_connection.execute.call_count, 2)
+
+    @patch("pdm_utils.functions.querying.execute_temp_table_subquery")
+    def test_execute_value_subqueries_6(self, temp_table_mock):
+        """Verify execute_value_subqueries() uses a temporary table above
+        the temporary table threshold.
+        """
+        temp_table_mock.return_value = [self.data_tuple]
+
+        results = querying.execute_value_subqueries(self.mock_engine,
+                                                    self.mock_executable,
+                                                    self.mock_in_column,
+                                                    self.values,
+                                                    return_dict=False,
+                                                    limit=2,
+                                                    temp_table_threshold=2)
+
+        temp_table_mock.assert_called_with(self.mock_engine,
+                                           self.mock_executable,
+                                           self.mock_in_column,
+                                           self.values, limit=2)
+        self.mock_in_column.in_.assert_not_called()
+        self.assertEqual(results, [self.data_tuple])
+
+    def test_execute_in_clause_subqueries_1(self):
+        """Verify execute_in_clause_subqueries() keeps chunk result order
+        when chunk queries run concurrently.
+        """
+        self.mock_executable.where.side_effect = lambda clause: clause
+        self.mock_in_column.in_.side_effect = lambda chunk: tuple(chunk)
+
+        def execute_side_effect(subquery):
+            proxy = Mock()
+            proxy.fetchall.return_value = list(subquery)
+            return proxy
+
+        self.mock_engine.execute.side_effect = execute_side_effect
+
+        results = querying.execute_in_clause_subqueries(
+                                            self.mock_engine,
+                                            self.mock_executable,
+                                            self.mock_in_column,
+                                            self.values, limit=1, threads=3)
+
+        self.assertEqual(results, [["Trixie"], ["D29"], ["Myrna"]])
+        self.assertEqual(self.mock_engine.execute.call_count, 3)
+
     def test_first_column_value_subqueries_1(self):
         """Verify that first_column_value_subqueries() raises ValueError.
         First_column_value_subqueries should raise when inputted column
@@ -0,0 +1,77 @@
+"""Unit tests for the QueryProfiler class."""
+
+import unittest
+
+from sqlalchemy import create_engine
+
+from pdm_utils.classes import queryprofiler
+from pdm_utils.classes.queryprofiler import QueryProfiler
+
+
+class TestQueryProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = QueryProfiler(n_plus_one_threshold=3)
+        self.engine = create_engine("sqlite://")
+        self.engine.execute("CREATE TABLE phage (PhageID VARCHAR(25))")
+        self.engine.execute("INSERT INTO phage VALUES ('Trixie'), ('L5')")
+
+    def tearDown(self):
+        self.profiler.detach()
+        self.engine.dispose()
+
+    def test_get_statement_template_1(self):
+        """Verify literal values are removed from statement templates."""
+        template = queryprofiler.get_statement_template(
+                        "SELECT PhageID FROM phage\n"
+                        "WHERE PhageID = 'Trixie' AND Length > 5000")
+        self.assertEqual(template,
+                         "SELECT PhageID FROM phage "
+                         "WHERE PhageID = ? AND Length > ?")
+
+    def test_get_statement_template_2(self):
+        """Verify IN clause placeholder lists are collapsed."""
+        template_1 = queryprofiler.get_statement_template(
+                        "SELECT * FROM gene WHERE PhageID IN (%s, %s)")
+        template_2 = queryprofiler.get_statement_template(
+                        "SELECT * FROM gene WHERE PhageID IN (?, ?, ?)")
+        self.assertEqual(template_1,
+                         "SELECT * FROM gene WHERE PhageID IN (...)")
+        self.assertEqual(template_1, template_2)
+
+    def test_attach_1(self):
+        """Verify statements executed by an attached engine are recorded."""
+        self.profiler.attach(self.engine)
+        for phage_id in ["Trixie", "L5", "D29"]:
+            self.engine.execute("SELECT * FROM phage WHERE PhageID = ?",
+                                phage_id)
+
+        self.assertEqual(len(self.profiler.statements), 1)
+        stats = list(self.profiler.statements.values())[0]
+        self.assertEqual(stats["count"], 3)
+        self.assertGreaterEqual(stats["total_time"], stats["max_time"])
+
+    def test_detach_1(self):
+        """Verify statements are not recorded after detaching."""
+        self.profiler.attach(self.engine)
+        self.profiler.detach()
+        self.engine.execute("SELECT * FROM phage")
+
+        self.assertEqual(self.profiler.statements, {})
+
+    def test_report_1(self):
+        """Verify frequently executed statements are flagged as N+1."""
+        for index in range(3):
+            self.profiler.record(f"SELECT * FROM gene WHERE PhamID = {index}",
+                                 0.1, 1)
+        self.profiler.record("SELECT * FROM phage", 0.5, 2)
+
+        report = self.profiler.report()
+
+        self.assertEqual(self.profiler.get_n_plus_one(),
+                         ["SELECT * FROM gene WHERE PhamID = ?"])
+        self.assertIn("4 SQL statements executed", report)
+        self.assertIn("N+1", report)
+
+
+if __name__ == '__main__':
+    unittest.main()
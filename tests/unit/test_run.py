@@ -89,6 +89,41 @@ class TestRunFunctions1(unittest.TestCase):
         unparsed_args = ["pdm_utils.run", "convert"]
         run.main(unparsed_args)
         pipeline_mock.assert_called()
+    @patch("pdm_utils.run.QueryProfiler")
+    @patch("pdm_utils.pipelines.export_db.main")
+    def test_main_13(self, pipeline_mock, profiler_mock):
+        """Verify that the SQL profiling flag is removed and reported."""
+        unparsed_args = ["pdm_utils.run", "export", "--profile-sql", "db"]
+        profiler_mock.return_value.report.return_value = "Report"
+        run.main(unparsed_args)
+        pipeline_mock.assert_called_with(["pdm_utils.run", "export", "db"])
+        profiler_mock.return_value.attach.assert_called()
+        profiler_mock.return_value.report.assert_called()
+
+    @patch("pdm_utils.run.QueryProfiler")
+    @patch("pdm_utils.pipelines.export_db.main")
+    def test_main_14(self, pipeline_mock, profiler_mock):
+        """Verify that SQL statements are not profiled by default."""
+        unparsed_args = ["pdm_utils.run", "export", "db"]
+        run.main(unparsed_args)
+        pipeline_mock.assert_called_with(unparsed_args)
+        profiler_mock.assert_not_called()
+
+    @patch("pdm_utils.functions.phagesdb.set_offline")
+    @patch("pdm_utils.pipelines.import_genome.main")
+    def test_main_15(self, pipeline_mock, set_offline_mock):
+        """Verify that the PhagesDB offline flag is removed and applied."""
+        unparsed_args = ["pdm_utils.run", "import", "--phagesdb-offline",
+                         "db"]
+        run.main(unparsed_args)
+        pipeline_mock.assert_called_with(["pdm_utils.run", "import", "db"])
+        set_offline_mock.assert_called()
+
+    def test_parse_args_1(self):
+        """Verify that the SQL profiling flag may precede the pipeline."""
+        args = run.parse_args(["pdm_utils.run", "--profile-sql", "export"])
+        self.assertEqual(args.pipeline, "export")
+        self.assertTrue(args.profile_sql)
 
 if __name__ == '__main__':
     unittest.main()
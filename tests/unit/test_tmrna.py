@@ -3,12 +3,14 @@
 
 from pathlib import Path
 import unittest
+from unittest.mock import patch
 import sys
 
 from Bio.Alphabet import IUPAC
 from Bio.Seq import Seq
 
 from pdm_utils.classes import tmrna
+from pdm_utils.classes.aragornhandler import AragornHandler
 from pdm_utils.constants import constants
 
 # Import helper functions to build mock database and mock flat files
@@ -793,5 +795,47 @@ class TestTmrnaClass(unittest.TestCase):
                 self.feature.seqfeature.location.end.position, 5)
 
 
+ARAGORN_OUTPUT = (">seq2\n"
+                  "1 gene found\n"
+                  "1   tmRNA        [1,8]      4,6      ANDNYAPVAA*\n")
+
+
+def set_records(handler, records):
+    handler.records = records
+
+
+def set_output(handler):
+    handler.out_str = ARAGORN_OUTPUT
+
+
+class TestTmrnaBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmrnas = [tmrna.Tmrna(), tmrna.Tmrna()]
+        self.tmrnas[0].seq = Seq("GGTTAACC", IUPAC.ambiguous_dna)
+        self.tmrnas[1].seq = Seq("GGTTAACC", IUPAC.ambiguous_dna)
+
+    @patch.object(AragornHandler, "read_output", autospec=True,
+                  side_effect=set_output)
+    @patch.object(AragornHandler, "run_aragorn", autospec=True)
+    @patch.object(AragornHandler, "write_multi_fasta", autospec=True,
+                  side_effect=set_records)
+    def test_run_aragorn_batch_1(self, write_mock, run_mock, read_mock):
+        """Verify all tmRNA sequences are searched in one Aragorn run."""
+        tmrna.run_aragorn_batch(self.tmrnas, identifier="Trixie_tmrna")
+        with self.subTest():
+            run_mock.assert_called_once()
+        with self.subTest():
+            self.assertEqual(run_mock.call_args[1], {"m": True, "t": False})
+        with self.subTest():
+            self.assertTrue(self.tmrnas[0].aragorn_run)
+        with self.subTest():
+            self.assertIsNone(self.tmrnas[0].aragorn_data)
+        with self.subTest():
+            self.assertEqual(self.tmrnas[1].aragorn_data["PeptideTag"],
+                             "ANDNYAPVAA*")
+
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,14 +1,19 @@
 """ Unit tests for the Trna class."""
 
 
+import os
 from pathlib import Path
 import unittest
+from unittest.mock import patch
 import sys
 
 from Bio.Alphabet import IUPAC
 from Bio.Seq import Seq
 
+from pdm_utils.classes import aragornhandler
 from pdm_utils.classes import trna
+from pdm_utils.classes.aragornhandler import AragornHandler
+from pdm_utils.classes.trnascansehandler import TRNAscanSEHandler
 from pdm_utils.constants import constants
 
 # Import helper functions to build mock database and mock flat files
@@ -794,6 +799,192 @@ class TestTrnaClass(unittest.TestCase):
                 self.feature.seqfeature.location.end.position, 5)
 
 
+ARAGORN_OUTPUT = (">seq1\n"
+                  "1 gene found\n"
+                  "1   tRNA-Gln              c[1,8]      4      (ttg)\n"
+                  "ggttaacc\n"
+                  "((....))\n"
+                  ">seq3\n"
+                  "0 genes found\n")
+
+TRNASCANSE_OUTPUT = ("seq1.trna1 (8-1)\tLength: 8 bp\n"
+                     "Type: Gln\tAnticodon: TTG at 4-6 (4-6)\tScore: 50.0\n"
+                     "Seq: GGTTAACC\n"
+                     "Str: >>....<<\n"
+                     "\n"
+                     "seq3.trna1 (1-8)\tLength: 8 bp\n"
+                     "Type: Gln\tAnticodon: TTG at 4-6 (4-6)\tScore: 50.0\n"
+                     "Seq: GGTTAACC\n"
+                     "Str: >>....<<\n"
+                     "\n"
+                     "seq3.trna2 (1-8)\tLength: 8 bp\n"
+                     "Type: Gln\tAnticodon: TTG at 4-6 (4-6)\tScore: 50.0\n"
+                     "Seq: GGTTAACC\n"
+                     "Str: >>....<<\n")
+
+
+def set_records(handler, records):
+    handler.records = records
+
+
+def set_output(output):
+    def read_output(handler):
+        handler.out_str = output
+    return read_output
+
+
+class TestTrnaBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.trnas = [trna.Trna(), trna.Trna(), trna.Trna()]
+        self.trnas[0].seq = Seq("GGTTAACC", IUPAC.ambiguous_dna)
+        self.trnas[2].seq = Seq("GGTTAACC", IUPAC.ambiguous_dna)
+        self.records = {"seq1": "GGTTAACC", "seq3": "GGTTAACC"}
+
+    def test_get_search_records_1(self):
+        """Verify only features with sequences are assigned identifiers."""
+        records = aragornhandler.get_search_records(self.trnas)
+        self.assertEqual(records, {"seq1": self.trnas[0],
+                                   "seq3": self.trnas[2]})
+
+    def test_aragorn_split_output_1(self):
+        """Verify Aragorn output is split by FASTA header."""
+        ah = AragornHandler("test", "")
+        ah.records = self.records
+        ah.out_str = ARAGORN_OUTPUT
+        handlers = ah.split_output()
+        handlers["seq1"].parse_trnas()
+        handlers["seq3"].parse_trnas()
+        with self.subTest():
+            self.assertEqual(handlers["seq1"].trna_tally, 1)
+        with self.subTest():
+            self.assertEqual(handlers["seq3"].trna_tally, 0)
+        with self.subTest():
+            self.assertEqual(handlers["seq1"].trnas[0]["Orientation"],
+                             "reverse")
+
+    def test_trnascanse_split_output_1(self):
+        """Verify tRNAscan-SE output is split by tRNA name."""
+        th = TRNAscanSEHandler("test", "")
+        th.records = self.records
+        th.out_str = TRNASCANSE_OUTPUT
+        handlers = th.split_output()
+        handlers["seq1"].parse_trnas()
+        handlers["seq3"].parse_trnas()
+        with self.subTest():
+            self.assertEqual(handlers["seq1"].trna_tally, 1)
+        with self.subTest():
+            self.assertEqual(handlers["seq3"].trna_tally, 2)
+
+    def test_aragorn_write_multi_fasta_1(self):
+        """Verify concurrent searches with the same identifier do not
+        share input and output files, and that the files are removed."""
+        handlers = [AragornHandler("Trixie_trna", ""),
+                    AragornHandler("Trixie_trna", "")]
+        for handler in handlers:
+            handler.write_multi_fasta(self.records)
+        paths = [(handler.input, handler.output) for handler in handlers]
+        for handler in handlers:
+            with open(handler.output, "w") as fh:
+                fh.write(ARAGORN_OUTPUT)
+            handler.read_output()
+            handler.remove_files()
+        with self.subTest():
+            self.assertNotEqual(paths[0], paths[1])
+        with self.subTest():
+            self.assertEqual(handlers[1].out_str, ARAGORN_OUTPUT)
+        for input, output in paths:
+            with self.subTest(input=input):
+                self.assertFalse(os.path.exists(input))
+            with self.subTest(output=output):
+                self.assertFalse(os.path.exists(output))
+
+    def test_trnascanse_write_fasta_1(self):
+        """Verify concurrent searches with the same identifier do not
+        share input files."""
+        handlers = [TRNAscanSEHandler("Trixie", "GGTTAACC"),
+                    TRNAscanSEHandler("Trixie", "GGTTAACC")]
+        for handler in handlers:
+            handler.write_fasta()
+        inputs = [handler.input for handler in handlers]
+        with open(inputs[0]) as fh:
+            fasta = fh.read()
+        for handler in handlers:
+            handler.remove_files()
+        with self.subTest():
+            self.assertNotEqual(inputs[0], inputs[1])
+        with self.subTest():
+            self.assertEqual(fasta, ">Trixie\nGGTTAACC\n")
+
+    @patch.object(AragornHandler, "read_output", autospec=True,
+                  side_effect=set_output(ARAGORN_OUTPUT))
+    @patch.object(AragornHandler, "run_aragorn", autospec=True)
+    @patch.object(AragornHandler, "write_multi_fasta", autospec=True,
+                  side_effect=set_records)
+    def test_run_aragorn_batch_1(self, write_mock, run_mock, read_mock):
+        """Verify all tRNA sequences are searched in one Aragorn run."""
+        trna.run_aragorn_batch(self.trnas, identifier="Trixie_trna")
+        with self.subTest():
+            run_mock.assert_called_once()
+        with self.subTest():
+            self.assertEqual(write_mock.call_args[0][1], self.records)
+        with self.subTest():
+            self.assertEqual(self.trnas[0].aragorn_data["AminoAcid"], "Gln")
+        with self.subTest():
+            self.assertEqual(self.trnas[0].sources, {"aragorn"})
+        with self.subTest():
+            self.assertFalse(self.trnas[1].aragorn_run)
+        with self.subTest():
+            self.assertTrue(self.trnas[2].aragorn_run)
+        with self.subTest():
+            self.assertIsNone(self.trnas[2].aragorn_data)
+
+    @patch.object(TRNAscanSEHandler, "read_output", autospec=True,
+                  side_effect=set_output(TRNASCANSE_OUTPUT))
+    @patch.object(TRNAscanSEHandler, "run_trnascanse", autospec=True)
+    @patch.object(TRNAscanSEHandler, "write_multi_fasta", autospec=True,
+                  side_effect=set_records)
+    def test_run_trnascanse_batch_1(self, write_mock, run_mock, read_mock):
+        """Verify all tRNA sequences are searched in one tRNAscan-SE run."""
+        trna.run_trnascanse_batch(self.trnas, identifier="Trixie_trna")
+        with self.subTest():
+            run_mock.assert_called_once()
+        with self.subTest():
+            self.assertEqual(self.trnas[0].trnascanse_data["Orientation"],
+                             "reverse")
+        with self.subTest():
+            self.assertEqual(self.trnas[0].sources, {"trnascan"})
+        with self.subTest():
+            self.assertTrue(self.trnas[2].trnascanse_run)
+        with self.subTest():
+            self.assertIsNone(self.trnas[2].trnascanse_data)
+
+    @patch.object(AragornHandler, "remove_files", autospec=True,
+                  side_effect=AragornHandler.remove_files)
+    @patch.object(AragornHandler, "run_aragorn", autospec=True)
+    def test_run_aragorn_batch_2(self, run_mock, remove_mock):
+        """Verify input files are removed if Aragorn can not be run."""
+        run_mock.side_effect = FileNotFoundError("aragorn")
+        with self.subTest():
+            with self.assertRaises(FileNotFoundError):
+                trna.run_aragorn_batch(self.trnas, identifier="Trixie_trna")
+        handler = remove_mock.call_args[0][0]
+        with self.subTest():
+            self.assertFalse(os.path.exists(handler.input))
+
+    @patch("pdm_utils.classes.trna.Trna.run_trnascanse")
+    @patch("pdm_utils.classes.trna.Trna.run_aragorn")
+    def test_check_sources_1(self, aragorn_mock, trnascanse_mock):
+        """Verify tRNAs searched in a batch run are not searched again."""
+        self.trnas[0].aragorn_run = True
+        self.trnas[0].trnascanse_run = True
+        self.trnas[0].check_sources()
+        with self.subTest():
+            aragorn_mock.assert_not_called()
+        with self.subTest():
+            trnascanse_mock.assert_not_called()
+
+
 
 if __name__ == '__main__':
     unittest.main()